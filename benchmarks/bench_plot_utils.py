@@ -0,0 +1,343 @@
+# benchmarks/bench_plot_utils.py
+"""
+Micro-benchmarks for the plot_utils helpers across data sizes.
+
+Every helper is run on a synthetic frame of 1e3, 1e5 and 1e7 rows. For each
+(helper, rows) pair the script records:
+
+- build:     seconds to build the figure (figure, bin and map-cell caches cleared, best of --repeat)
+- serialize: seconds for fig.to_json()
+- payload:   bytes of that JSON
+- peak:      peak traced memory (tracemalloc) of build + serialize, in a separate run
+
+Results are written to benchmarks/results/<git sha>.json so runs can be
+compared across commits:
+
+    python benchmarks/bench_plot_utils.py
+    python benchmarks/bench_plot_utils.py --sizes 1000 100000 --helpers line_plot box_plot
+    python benchmarks/bench_plot_utils.py --compare a7668a3
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly
+import plotly.graph_objects as go
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils import plot_utils as pu  # noqa: E402
+from utils.binning_utils import clear_binning_cache  # noqa: E402
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+DEFAULT_SIZES = (1_000, 100_000, 10_000_000)
+
+# Above this many rows a single run is timed instead of the best of --repeat
+REPEAT_LIMIT = 100_000
+
+CATEGORIES = ["Furniture", "Office Supplies", "Technology", "Apparel", "Books"]
+COUNTRIES = ["United States", "India", "Brazil", "Germany", "Japan", "Nigeria", "Australia", "Canada"]
+FRAMES = [f"2024-{m:02d}" for m in range(1, 13)]
+
+
+# ============================
+# 🧪 SYNTHETIC DATA
+# ============================
+
+
+def make_frame(n, seed=0):
+    """
+    n rows with every column the helpers below need (time, numbers, categories, geo).
+    """
+    rng = np.random.default_rng(seed)
+    seconds = np.sort(rng.integers(0, 365 * 24 * 3600, size=n))
+    return pd.DataFrame({
+        "t": np.datetime64("2024-01-01") + seconds.astype("timedelta64[s]"),
+        "x": rng.uniform(0, 100, size=n),
+        "y": np.cumsum(rng.normal(0, 1, size=n)),
+        "value": rng.gamma(2.0, 50.0, size=n),
+        "size": rng.uniform(1, 20, size=n),
+        "category": pd.Categorical.from_codes(rng.integers(0, len(CATEGORIES), size=n), CATEGORIES),
+        "country": pd.Categorical.from_codes(rng.integers(0, len(COUNTRIES), size=n), COUNTRIES),
+        "frame": pd.Categorical.from_codes(rng.integers(0, len(FRAMES), size=n), FRAMES, ordered=True),
+        "lat": rng.uniform(-60, 70, size=n),
+        "lon": rng.uniform(-180, 180, size=n),
+    })
+
+
+# ============================
+# 📋 CASES
+# ============================
+# name → (builder(df) → figure, max rows or None). Helpers made for
+# pre-aggregated input (one bar / slice / country per row) stop at 1e5 rows.
+
+
+def _per_category_figure(df):
+    fig = go.Figure()
+    for name, part in df.groupby("category", observed=True):
+        fig.add_trace(pu.scatter_trace(x=part["t"], y=part["y"], mode="lines", name=name))
+    return fig
+
+
+def _dropdown(df, mode="visible"):
+    fig = _per_category_figure(df)
+    return pu.add_dropdown(fig, {name: [i] for i, name in enumerate(CATEGORIES)}, title="Category", mode=mode)
+
+
+def _slider(df, mode="visible"):
+    return pu.add_slider(_per_category_figure(df), CATEGORIES, title="Category", mode=mode)
+
+
+def _data_dropdown(df):
+    steps = pu.group_arrays(df, "category", x="t", y="y")
+    first = next(iter(steps.values()))
+    fig = go.Figure(pu.scatter_trace(first["x"], first["y"], mode="lines"))
+    return pu.data_dropdown(fig, steps, title="Category")
+
+
+def _zscore_band(df):
+    upper, lower = pu.add_zscore_band(df["t"], df["y"], z=2)
+    return go.Figure([
+        pu.scatter_trace(x=df["t"], y=upper, mode="lines", name="+2σ"),
+        pu.scatter_trace(x=df["t"], y=lower, mode="lines", name="-2σ"),
+    ])
+
+
+def _subplots(df):
+    fig = pu.create_subplots(2, 1, subplot_titles=["y", "value"], shared_x=True)
+    pu.add_trace_to_subplot(fig, pu.scatter_trace(x=df["t"], y=df["y"], mode="lines"), 1, 1)
+    pu.add_trace_to_subplot(fig, pu.scatter_trace(x=df["t"], y=df["value"], mode="markers"), 2, 1)
+    return fig
+
+
+def _int_markers(df, downcast="lossless"):
+    # Integer y values 0..99: payload vs downcast=None shows compact_figure never widens them
+    fig = go.Figure(pu.scatter_trace(x=None, y=df["x"].to_numpy().astype(np.int64), mode="markers"))
+    return pu.compact_figure(fig, downcast)
+
+
+AGGREGATED_INPUT = 100_000
+
+CASES = {
+    "line_plot": (lambda df: pu.line_plot(df, "t", "y", color="category"), None),
+    "line_plot[lttb]": (lambda df: pu.line_plot(df, "t", "y", color="category",
+                                                max_points=pu.DEFAULT_MAX_POINTS), None),
+    "scatter_plot": (lambda df: pu.scatter_plot(df, "x", "value", color="category"), None),
+    "bubble_plot": (lambda df: pu.bubble_plot(df, "x", "value", size="size"), None),
+    "bar_plot": (lambda df: pu.bar_plot(df, "category", "value"), AGGREGATED_INPUT),
+    "pie_chart": (lambda df: pu.pie_chart(df, "category", "value"), AGGREGATED_INPUT),
+    "box_plot": (lambda df: pu.box_plot(df, "category", "value"), None),
+    "histogram_plot": (lambda df: pu.histogram_plot(df, "value", color="category"), None),
+    "histogram_plot[server]": (lambda df: pu.histogram_plot(df, "value", color="category",
+                                                            binning="server"), None),
+    "density_heatmap": (lambda df: pu.density_heatmap(df, "x", "value"), None),
+    "density_heatmap[server]": (lambda df: pu.density_heatmap(df, "x", "value", binning="server"), None),
+    "density_contour": (lambda df: pu.density_contour(df, "x", "value"), None),
+    "scatter_geo": (lambda df: pu.scatter_geo(df, "lat", "lon"), None),
+    "scatter_geo[grid]": (lambda df: pu.scatter_geo(df, "lat", "lon", color="value", aggregate="grid", zoom=3), None),
+    "scatter_mapbox": (lambda df: pu.scatter_mapbox(df, "lat", "lon"), None),
+    "scatter_mapbox[hex]": (lambda df: pu.scatter_mapbox(df, "lat", "lon", color="value", aggregate="hex", zoom=3),
+                            None),
+    "choropleth_map": (lambda df: pu.choropleth_map(df, "country", "value"), AGGREGATED_INPUT),
+    "animated_plot": (lambda df: pu.animated_plot(df, "category", "value", "frame", plot_type="bar"),
+                      AGGREGATED_INPUT),
+    "animated_plot[express]": (lambda df: pu.animated_plot(df, "category", "value", "frame", plot_type="bar",
+                                                           engine="express"), AGGREGATED_INPUT),
+    "add_dropdown": (_dropdown, None),
+    "add_dropdown[swap]": (lambda df: _dropdown(df, mode="swap"), None),
+    "data_dropdown": (_data_dropdown, None),
+    "add_slider": (_slider, None),
+    "add_slider[swap]": (lambda df: _slider(df, mode="swap"), None),
+    "add_trendline": (lambda df: go.Figure([pu.add_trendline(df["t"], df["y"])]), None),
+    "add_trendline[groups,ci]": (lambda df: go.Figure(pu.add_trendline(df["t"], df["y"], groups=df["category"],
+                                                                       ci=0.95)), None),
+    "add_moving_average": (lambda df: go.Figure([pu.add_moving_average(df["t"], df["y"], window=30)]), None),
+    "add_zscore_band": (_zscore_band, None),
+    "create_subplots": (_subplots, None),
+    "compact_figure[ints]": (_int_markers, None),
+    "compact_figure[ints,none]": (lambda df: _int_markers(df, downcast=None), None),
+}
+
+
+# ============================
+# ⏱️ MEASUREMENT
+# ============================
+
+
+def _timed(build):
+    # Every run recomputes: bins and map cells are cached per frame, and each run reuses the frame
+    clear_binning_cache()
+    pu.clear_geo_cache()
+    # Helpers that report (e.g. downsampling) print; keep the table readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        fig = build()
+        built = time.perf_counter()
+        payload = fig.to_json()
+    return built - start, time.perf_counter() - built, len(payload.encode())
+
+
+def _peak_bytes(build):
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            build().to_json()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(name, df, repeat=3, memory=True):
+    """
+    Builds and serializes one case on df. Returns a result dict.
+    """
+    build, _ = CASES[name]
+    runs = [_timed(lambda: build(df)) for _ in range(repeat if len(df) <= REPEAT_LIMIT else 1)]
+    build_s, serialize_s, payload = min(runs)
+    return {
+        "helper": name,
+        "rows": len(df),
+        "build_s": build_s,
+        "serialize_s": serialize_s,
+        "payload_bytes": payload,
+        "peak_bytes": _peak_bytes(lambda: build(df)) if memory else None,
+    }
+
+
+# ============================
+# 🗃️ RESULT STORE
+# ============================
+
+
+def _git(*args):
+    proc = subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True)
+    return proc.stdout.strip() if proc.returncode == 0 else ""
+
+
+def run_metadata():
+    sha = _git("rev-parse", "--short", "HEAD") or "unknown"
+    return {
+        "commit": sha,
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plotly": plotly.__version__,
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+    }
+
+
+def _result_file(ref):
+    path = Path(ref)
+    if path.is_file():
+        return path
+    matches = sorted(RESULTS_DIR.glob(f"{ref}*.json"))
+    if not matches:
+        raise SystemExit(f"No stored results for '{ref}' in {RESULTS_DIR}")
+    return matches[-1]
+
+
+def _fmt_row(r):
+    if r.get("skipped"):
+        return f"   {r['helper']:<26} {r['rows']:>11,}  skipped ({r['skipped']})"
+    peak = "-" if r["peak_bytes"] is None else f"{r['peak_bytes'] / 1e6:9.1f}"
+    return (
+        f"   {r['helper']:<26} {r['rows']:>11,} {r['build_s']:9.3f} {r['serialize_s']:9.3f} "
+        f"{r['payload_bytes'] / 1e6:10.2f} {peak:>9}"
+    )
+
+
+def _print_header():
+    print(f"   {'helper':<26} {'rows':>11} {'build s':>9} {'json s':>9} {'payload MB':>10} {'peak MB':>9}")
+
+
+def _ratio(new, old):
+    return f"{new / old:6.2f}x" if old else "     -"
+
+
+def print_comparison(results, baseline):
+    print(f"\n🔁 Compared with {baseline['meta']['commit']} ({baseline['meta']['date']})")
+    print(f"   {'helper':<26} {'rows':>11} {'build':>7} {'json':>7} {'payload':>7} {'peak':>7}")
+    old = {(r["helper"], r["rows"]): r for r in baseline["results"] if not r.get("skipped")}
+    for r in results:
+        before = old.get((r["helper"], r["rows"]))
+        if r.get("skipped") or before is None:
+            continue
+        peak = _ratio(r["peak_bytes"], before["peak_bytes"]) if r["peak_bytes"] and before["peak_bytes"] else "     -"
+        print(
+            f"   {r['helper']:<26} {r['rows']:>11,} {_ratio(r['build_s'], before['build_s'])} "
+            f"{_ratio(r['serialize_s'], before['serialize_s'])} "
+            f"{_ratio(r['payload_bytes'], before['payload_bytes'])} {peak}"
+        )
+
+
+# ============================
+# 🚀 ENTRY POINT
+# ============================
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every plot_utils helper across data sizes.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="Row counts")
+    parser.add_argument("--helpers", nargs="+", default=["*"], help="Case names or patterns, e.g. 'add_*'")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best counts)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory run")
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/<sha>.json)")
+    parser.add_argument("--compare", help="Commit sha (stored result) or JSON file to compare against")
+    args = parser.parse_args(argv)
+
+    # Read the baseline first: a run on the same commit overwrites its stored file
+    baseline = json.loads(_result_file(args.compare).read_text()) if args.compare else None
+
+    names = [n for n in CASES if any(fnmatch.fnmatch(n, p) for p in args.helpers)]
+    if not names:
+        parser.error(f"No case matches {args.helpers}. Available: {', '.join(CASES)}")
+
+    # Every build must do the work, not return a memoized figure
+    pu.disable_figure_cache()
+
+    # Warm-up on a tiny frame: lazy imports and Plotly's validators load here, not in the first timing
+    warmup = make_frame(100)
+    for name in names:
+        _timed(lambda: CASES[name][0](warmup))
+
+    results = []
+    _print_header()
+    for n in args.sizes:
+        df = make_frame(n)
+        for name in names:
+            limit = CASES[name][1]
+            if limit is not None and n > limit:
+                result = {"helper": name, "rows": n, "skipped": f"expects aggregated input, max {limit:,} rows"}
+            else:
+                result = measure(name, df, args.repeat, memory=not args.no_memory)
+            results.append(result)
+            print(_fmt_row(result), flush=True)
+        del df
+
+    meta = run_metadata()
+    output = args.output or RESULTS_DIR / f"{meta['commit']}{'-dirty' if meta['dirty'] else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"meta": meta, "results": results}, indent=2))
+    print(f"\n💾 Results written to {output}")
+
+    if baseline is not None:
+        print_comparison(results, baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+# benchmarks/import_time.py
+"""
+Cold-start import benchmark for the plotting utilities and the Streamlit app.
+
+Each target is imported in a fresh interpreter under `python -X importtime`.
+The script prints the wall time and the most expensive modules (self and
+cumulative microseconds). It exits with status 1 when a target exceeds its
+budget, so it can gate CI:
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget utils.plot_utils=0.2 --budget app.py=2.0
+    python benchmarks/import_time.py --json import_times.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Seconds allowed for a cold import (overridable with --budget target=seconds)
+DEFAULT_BUDGETS = {
+    "utils.plot_utils": 0.25,
+    "app.py": 1.5,
+}
+
+# Interpreter start-up imports (site, .pth hooks) are logged before the marker and ignored
+_MARKER = "--- benchmark start ---"
+_TIMER = (
+    "import sys, time as _t; sys.stderr.write({marker!r} + '\\n'); "
+    "_s = _t.perf_counter(); {stmt}; print(_t.perf_counter() - _s)"
+)
+
+
+def _statement(target):
+    # Modules are imported; scripts (app.py) are executed the way Streamlit's bare mode would
+    if target.endswith(".py"):
+        return f"import runpy; runpy.run_path({str(ROOT / target)!r}, run_name='__main__')"
+    return f"import {target}"
+
+
+def _parse_importtime(stderr):
+    modules = []
+    for line in stderr.partition(_MARKER)[2].splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+        })
+    return modules
+
+
+def measure(target, repeat=3):
+    """
+    Cold-imports a target `repeat` times in fresh interpreters.
+
+    Returns {"target", "seconds" (best run), "runs", "modules" (importtime rows of the best run)}.
+    """
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    runs = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _TIMER.format(marker=_MARKER, stmt=_statement(target))],
+            cwd=ROOT, env=env, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"Importing {target} failed:\n{proc.stderr[-2000:]}")
+        seconds = float(proc.stdout.strip().splitlines()[-1])
+        runs.append((seconds, _parse_importtime(proc.stderr)))
+
+    seconds, modules = min(runs, key=lambda run: run[0])
+    return {"target": target, "seconds": seconds, "runs": [r[0] for r in runs], "modules": modules}
+
+
+def _print_result(result, budget, top):
+    status = "✅" if budget is None or result["seconds"] <= budget else "❌"
+    limit = f" (budget {budget:.3f}s)" if budget is not None else ""
+    print(f"\n{status} {result['target']}: {result['seconds']:.3f}s{limit}")
+    print(f"   {'self ms':>9} {'cum ms':>9}  module")
+    by_cumulative = sorted(result["modules"], key=lambda m: m["cumulative_us"], reverse=True)
+    for m in by_cumulative[:top]:
+        print(f"   {m['self_us'] / 1000:9.1f} {m['cumulative_us'] / 1000:9.1f}  {'  ' * m['depth']}{m['module']}")
+
+
+def _budget(value):
+    target, _, seconds = value.partition("=")
+    if not seconds:
+        raise argparse.ArgumentTypeError("Use target=seconds, e.g. utils.plot_utils=0.25")
+    return target, float(seconds)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold import time and enforce budgets.")
+    parser.add_argument("targets", nargs="*", help="Modules or scripts (default: budgeted targets)")
+    parser.add_argument("--budget", action="append", type=_budget, default=[], help="target=seconds")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per target (best run counts)")
+    parser.add_argument("--top", type=int, default=15, help="Modules listed per target")
+    parser.add_argument("--json", type=Path, help="Also write the measurements as JSON")
+    args = parser.parse_args(argv)
+
+    budgets = {**DEFAULT_BUDGETS, **dict(args.budget)}
+    targets = args.targets or list(budgets)
+    results = [measure(target, args.repeat) for target in targets]
+
+    failed = []
+    for result in results:
+        budget = budgets.get(result["target"])
+        _print_result(result, budget, args.top)
+        if budget is not None and result["seconds"] > budget:
+            failed.append(result["target"])
+
+    if args.json:
+        args.json.write_text(json.dumps({"budgets": budgets, "results": results}, indent=2))
+    if failed:
+        print(f"\n❌ Over budget: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
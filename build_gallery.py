@@ -0,0 +1,213 @@
+# build_gallery.py
+"""
+Headless gallery build: renders every page's figures (figures/notebook_XX.py)
+without Streamlit and exports them as HTML/PNG in one run.
+
+    python build_gallery.py                        # all pages, HTML + PNG
+    python build_gallery.py --pages 01 04 --formats html
+    python build_gallery.py --workers 8 --report exports/build_report.json
+    python build_gallery.py --formats html --html-report    # + one HTML report per page
+
+HTML files reference one shared plotly.js per export root by default
+(--plotlyjs inline embeds it in every file instead).
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import plotly.graph_objects as go
+
+from figures import PAGES, build_page, load_page
+from utils.cube_utils import refresh_cube
+from utils.export_utils import export_figures, export_report
+from utils.plot_utils import theme_template
+
+ROOT = Path(__file__).resolve().parent
+DEFAULT_EXPORT_ROOT = ROOT / "exports"
+THEME = "plotly_white"
+
+
+# ============================
+# 🏗️ FIGURE BUILD (WORKERS)
+# ============================
+
+
+def build_variant(page_name, params, theme=THEME):
+    """
+    Builds one (page, widget settings) combination inside a worker process.
+
+    Returns (page_name, {stem: figure dict}, {stem: build seconds}, total seconds).
+    """
+    start = time.perf_counter()
+    timings = {}
+    figures = build_page(load_page(page_name), timings=timings, theme=theme_template(theme), **params)
+    specs = {stem: fig.to_dict() for stem, fig in figures.items()}
+    return page_name, specs, timings, time.perf_counter() - start
+
+
+def _variants(page_name):
+    return getattr(load_page(page_name), "VARIANTS", [{}])
+
+
+# ============================
+# 📊 REPORT
+# ============================
+
+
+def _export_summary(export):
+    if export["error"]:
+        return f"{export['format']} ❌ {export['error']}"
+    if export["skipped"]:
+        return f"{export['format']} unchanged"
+    return f"{export['format']} {export['seconds']:.2f}s"
+
+
+def _print_report(report):
+    print("\n⏱️ Gallery build report")
+    for page_name, page in report["pages"].items():
+        print(f"\n📄 {page_name}  build {page['build_seconds']:.2f}s")
+        for stem, fig in page["figures"].items():
+            exports = ", ".join(_export_summary(e) for e in fig["exports"])
+            print(f"   {stem:<40} build {fig['build_seconds']:6.2f}s   {exports}")
+        if "html_report" in page:
+            print(f"   {'(html report)':<40} {'':14} {_export_summary(dict(page['html_report'], format='html'))}")
+    totals = report["totals"]
+    print(
+        f"\n✅ {totals['figures']} figures, {totals['written']} files written, "
+        f"{totals['skipped']} unchanged, {totals['failed']} failed – "
+        f"build {totals['build_seconds']:.2f}s, export {totals['export_seconds']:.2f}s, "
+        f"wall {totals['wall_seconds']:.2f}s"
+    )
+
+
+# ============================
+# 🚀 ENTRY POINT
+# ============================
+
+
+def build_gallery(pages=None, workers=None, formats=("html", "png"), export_root=None,
+                  force=False, prune=False, plotlyjs="shared", html_report=False):
+    """
+    Builds and exports the gallery.
+
+    Parameters:
+    - pages (list[str] | None): Page names, e.g. ["notebook_01"] (default: all).
+    - workers (int | None): Build processes (default: CPU count); PNG export uses
+      export_utils' own pool.
+    - formats (tuple[str]): Any of "html", "png".
+    - export_root (Path | None): exports/ folder (default: <repo>/exports).
+    - force (bool): Re-export figures even when the manifest says they are unchanged.
+    - prune (bool): Delete stale files in the exported folders.
+    - plotlyjs (str): "shared" (one plotly.js per export root) or "inline" for HTML files.
+    - html_report (bool): Also pack each page's figures into <page>_report.html.
+
+    Returns the timing report as a dict.
+    """
+    wall = time.perf_counter()
+    pages = pages or PAGES
+    export_root = Path(export_root or DEFAULT_EXPORT_ROOT)
+
+    # Bring the shared aggregate cube up to date once, before workers read it
+    refresh_cube()
+
+    tasks = [(page_name, params) for page_name in pages for params in _variants(page_name)]
+    workers = workers or min(len(tasks), os.cpu_count() or 1)
+
+    report = {"pages": {}, "totals": {}}
+    jobs, owners = [], []
+    page_figures = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(build_variant, page_name, params) for page_name, params in tasks]
+        for future in futures:
+            page_name, specs, timings, seconds = future.result()
+            page = report["pages"].setdefault(page_name, {"build_seconds": 0.0, "figures": {}})
+            page["build_seconds"] += seconds
+            for stem, spec in specs.items():
+                # Figures that do not depend on the variant's params come back once per variant
+                if stem in page["figures"]:
+                    continue
+                page["figures"][stem] = {"build_seconds": timings[stem], "exports": []}
+                fig = go.Figure(spec)
+                page_figures.setdefault(page_name, {})[stem] = fig
+                for fmt in formats:
+                    jobs.append((fig, f"{stem}.{fmt}", page_name))
+                    owners.append((page_name, stem, fmt))
+
+    results = export_figures(jobs, export_root=export_root, skip_unchanged=not force, prune=prune, plotlyjs=plotlyjs)
+    for (page_name, stem, fmt), result in zip(owners, results):
+        report["pages"][page_name]["figures"][stem]["exports"].append({
+            "format": fmt,
+            "path": str(result.path),
+            "seconds": result.seconds,
+            "skipped": result.skipped,
+            "error": result.error,
+        })
+
+    if html_report:
+        for page_name, figures in page_figures.items():
+            result = export_report(figures, page_name, export_root=export_root, plotlyjs=plotlyjs,
+                                   skip_unchanged=not force)
+            results.append(result)
+            report["pages"][page_name]["html_report"] = {
+                "path": str(result.path),
+                "seconds": result.seconds,
+                "skipped": result.skipped,
+                "error": result.error,
+            }
+
+    report["totals"] = {
+        "figures": sum(len(p["figures"]) for p in report["pages"].values()),
+        "written": sum(r.ok and not r.skipped for r in results),
+        "skipped": sum(r.skipped for r in results),
+        "failed": sum(not r.ok for r in results),
+        "build_seconds": sum(p["build_seconds"] for p in report["pages"].values()),
+        "export_seconds": sum(r.seconds for r in results),
+        "wall_seconds": time.perf_counter() - wall,
+    }
+    return report
+
+
+def _page_name(value):
+    name = value if value.startswith("notebook_") else f"notebook_{int(value):02d}"
+    if name not in PAGES:
+        raise argparse.ArgumentTypeError(f"Unknown page '{value}'. Available: {', '.join(PAGES)}")
+    return name
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and export every gallery figure without Streamlit.")
+    parser.add_argument("--pages", nargs="+", type=_page_name, help="Pages to build, e.g. 01 04 or notebook_09 (default: all)")
+    parser.add_argument("--workers", type=int, help="Figure build processes (default: CPU count)")
+    parser.add_argument("--formats", nargs="+", choices=["html", "png"], default=["html", "png"])
+    parser.add_argument("--export-root", type=Path, default=DEFAULT_EXPORT_ROOT)
+    parser.add_argument("--force", action="store_true", help="Re-export unchanged figures")
+    parser.add_argument("--prune", action="store_true", help="Delete stale exports in the touched folders")
+    parser.add_argument("--report", type=Path, help="Also write the timing report as JSON")
+    parser.add_argument("--plotlyjs", choices=["shared", "inline"], default="shared",
+                        help="Reference one shared plotly.js (default) or embed it in every HTML file")
+    parser.add_argument("--html-report", action="store_true", help="Also write one multi-figure HTML file per page")
+    args = parser.parse_args(argv)
+
+    report = build_gallery(
+        pages=args.pages,
+        workers=args.workers,
+        formats=tuple(args.formats),
+        export_root=args.export_root,
+        force=args.force,
+        prune=args.prune,
+        plotlyjs=args.plotlyjs,
+        html_report=args.html_report,
+    )
+    _print_report(report)
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2))
+    return 1 if report["totals"]["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,272 @@
+# build_geometry.py
+"""
+Builds the offline country bundle choropleth_map uses (see utils/geo_utils.py):
+simplified country shapes per zoom level plus a name → ISO-3 index.
+
+    python build_geometry.py                                  # downloads Natural Earth 1:50m
+    python build_geometry.py --source ne_50m_admin_0_countries.geojson   # air-gapped: local copy
+    python build_geometry.py --levels 0 1
+
+The output goes to datasets/geo/ and is meant to be committed, so deployments
+never fetch geometry at runtime.
+"""
+
+import argparse
+import gzip
+import json
+import time
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+
+from utils.geo_utils import COUNTRY_INDEX_FILE, GEOMETRY_DIR, GEOMETRY_LEVELS, geometry_path, normalize_country_name
+
+DEFAULT_SOURCE = (
+    "https://raw.githubusercontent.com/nvkelso/natural-earth-vector/master/geojson/ne_50m_admin_0_countries.geojson"
+)
+
+# Natural Earth properties that hold a name of the country
+NAME_FIELDS = ("NAME", "NAME_LONG", "ADMIN", "GEOUNIT", "BRK_NAME", "NAME_SORT", "NAME_ALT", "NAME_EN",
+               "FORMAL_EN", "ABBREV")
+
+# Spellings Natural Earth does not carry (Faker's country list, older UN names)
+ALIASES = {
+    "Antarctica (the territory South of 60 deg S)": "ATA",
+    "Bouvet Island (Bouvetoya)": "BVT",
+    "British Indian Ocean Territory (Chagos Archipelago)": "IOT",
+    "British Virgin Islands": "VGB",
+    "Burma": "MMR",
+    "Cape Verde": "CPV",
+    "Czech Republic": "CZE",
+    "Falkland Islands (Malvinas)": "FLK",
+    "Holy See (Vatican City State)": "VAT",
+    "Korea": "KOR",
+    "Kyrgyz Republic": "KGZ",
+    "Lao People's Democratic Republic": "LAO",
+    "Libyan Arab Jamahiriya": "LBY",
+    "Macao": "MAC",
+    "Macedonia": "MKD",
+    "Micronesia": "FSM",
+    "Palestinian Territory": "PSE",
+    "Pitcairn Islands": "PCN",
+    "Russian Federation": "RUS",
+    "Saint Barthelemy": "BLM",
+    "Saint Martin": "MAF",
+    "Slovakia (Slovak Republic)": "SVK",
+    "South Georgia and the South Sandwich Islands": "SGS",
+    "Swaziland": "SWZ",
+    "Syrian Arab Republic": "SYR",
+    "Turkey": "TUR",
+    "United States": "USA",
+    "United States Virgin Islands": "VIR",
+    "Virgin Islands, British": "VGB",
+    "Virgin Islands, U.S.": "VIR",
+}
+
+
+# ============================
+# 📥 SOURCE
+# ============================
+
+
+def read_source(source):
+    """
+    GeoJSON FeatureCollection from a URL or a local (optionally gzipped) file.
+    """
+    if source.startswith(("http://", "https://")):
+        with urllib.request.urlopen(source, timeout=60) as response:
+            raw = response.read()
+    else:
+        raw = Path(source).read_bytes()
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+    return json.loads(raw)
+
+
+def iso3(properties):
+    """
+    ISO-3 code of a Natural Earth feature (-99 entries fall back to the EH/ADM0 codes).
+    """
+    for field in ("ISO_A3", "ISO_A3_EH", "ADM0_A3", "iso_a3", "id"):
+        code = properties.get(field)
+        if isinstance(code, str) and len(code) == 3 and code != "-99":
+            return code.upper()
+    return None
+
+
+# ============================
+# ✂️ SIMPLIFICATION
+# ============================
+
+
+def simplify_ring(points, tolerance):
+    """
+    Douglas-Peucker: keeps the points of a closed ring that deviate more than
+    tolerance (degrees) from the simplified outline. Distances of a whole span
+    are computed in one NumPy pass; spans are processed from a stack.
+    """
+    n = len(points)
+    if n <= 4 or tolerance <= 0:
+        return points
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    # A closed ring starts and ends on the same point: split at the farthest one
+    far = int(np.argmax(np.hypot(*(points - points[0]).T)))
+    keep[far] = True
+    stack = [(0, far), (far, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        a, b = points[start], points[end]
+        span = points[start + 1:end]
+        ab = b - a
+        length = np.hypot(*ab)
+        if length == 0:
+            dist = np.hypot(*(span - a).T)
+        else:
+            dist = np.abs(ab[0] * (span[:, 1] - a[1]) - ab[1] * (span[:, 0] - a[0])) / length
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            mid = start + 1 + i
+            keep[mid] = True
+            stack += [(start, mid), (mid, end)]
+    return points[keep]
+
+
+def _polygons(geometry):
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"]
+    return []
+
+
+def _area(ring):
+    x, y = ring[:, 0], ring[:, 1]
+    return abs(np.dot(x, np.roll(y, 1)) - np.dot(y, np.roll(x, 1))) / 2
+
+
+def simplify_geometry(geometry, tolerance, decimals):
+    """
+    Simplified (Multi)Polygon: rings that collapse below 4 points are dropped,
+    except the country's largest outline, which is kept at full detail.
+    """
+    polygons = [[np.asarray(ring, dtype=np.float64)[:, :2] for ring in polygon] for polygon in _polygons(geometry)]
+    if not polygons:
+        return None
+    largest = max(range(len(polygons)), key=lambda i: _area(polygons[i][0]))
+
+    kept = []
+    for i, polygon in enumerate(polygons):
+        rings = []
+        for j, ring in enumerate(polygon):
+            simple = np.round(simplify_ring(ring, tolerance), decimals)
+            if len(simple) >= 4:
+                rings.append(simple)
+            elif j == 0 and i == largest:
+                rings.append(np.round(ring, decimals))
+            elif j == 0:
+                break  # outer ring gone: drop the polygon with its holes
+        else:
+            kept.append([ring.tolist() for ring in rings])
+    if len(kept) == 1:
+        return {"type": "Polygon", "coordinates": kept[0]}
+    return {"type": "MultiPolygon", "coordinates": kept}
+
+
+# ============================
+# 🔎 NAME INDEX
+# ============================
+
+
+def build_index(features):
+    """
+    {"names": {normalized name: ISO-3}, "countries": {ISO-3: display name}} from
+    the features' name properties, plotly's gapminder names and ALIASES.
+    """
+    names, countries = {}, {}
+    for feature in features:
+        code, props = feature["id"], feature["properties"]
+        countries.setdefault(code, props.get("NAME") or props.get("ADMIN") or code)
+        for field in NAME_FIELDS:
+            if props.get(field):
+                names.setdefault(normalize_country_name(props[field]), code)
+        names.setdefault(normalize_country_name(code), code)
+
+    try:
+        import plotly.express as px
+
+        gapminder = px.data.gapminder()[["country", "iso_alpha"]].drop_duplicates()
+        for name, code in gapminder.itertuples(index=False):
+            if code in countries:
+                names.setdefault(normalize_country_name(name), code)
+    except Exception:  # gapminder names are a bonus, not a requirement
+        pass
+
+    for name, code in ALIASES.items():
+        if code in countries:
+            names[normalize_country_name(name)] = code
+    return {"names": dict(sorted(names.items())), "countries": dict(sorted(countries.items()))}
+
+
+# ============================
+# 💾 BUNDLE
+# ============================
+
+
+def country_features(collection):
+    """
+    The source's country Features with id = ISO-3 and only the properties the
+    index needs (first feature wins when a code repeats).
+    """
+    features = {}
+    for feature in collection["features"]:
+        props = feature.get("properties") or {}
+        code = iso3({**props, "id": feature.get("id")})
+        if code is None or code in features or not feature.get("geometry"):
+            continue
+        properties = {field: props[field] for field in NAME_FIELDS if props.get(field)}
+        features[code] = {"type": "Feature", "id": code, "properties": properties, "geometry": feature["geometry"]}
+    return list(features.values())
+
+
+def write_bundle(features, output_dir, levels):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for level in levels:
+        start = time.perf_counter()
+        tolerance, decimals = GEOMETRY_LEVELS[level]
+        simplified = []
+        for feature in features:
+            geometry = simplify_geometry(feature["geometry"], tolerance, decimals)
+            if geometry is not None:
+                simplified.append({"type": "Feature", "id": feature["id"],
+                                   "properties": {"name": feature["properties"].get("NAME", feature["id"])},
+                                   "geometry": geometry})
+        path = output_dir / geometry_path(level).name
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"type": "FeatureCollection", "features": simplified}, f, separators=(",", ":"))
+        print(f"✅ {path.name}: {len(simplified)} countries, {path.stat().st_size / 1e6:.2f} MB "
+              f"(tolerance {tolerance}°, {time.perf_counter() - start:.1f}s)")
+
+    index = build_index(features)
+    path = output_dir / COUNTRY_INDEX_FILE
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=0)
+    print(f"✅ {path.name}: {len(index['names'])} names → {len(index['countries'])} countries")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build the offline country geometry bundle in ./datasets/geo/")
+    parser.add_argument("--source", default=DEFAULT_SOURCE, help="Natural Earth admin-0 GeoJSON (URL or file)")
+    parser.add_argument("--output", type=Path, default=GEOMETRY_DIR)
+    parser.add_argument("--levels", type=int, nargs="+", default=list(GEOMETRY_LEVELS), choices=list(GEOMETRY_LEVELS))
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    features = country_features(read_source(args.source))
+    print(f"📥 {len(features)} countries from {args.source}")
+    write_bundle(features, args.output, args.levels)
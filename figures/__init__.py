@@ -0,0 +1,122 @@
+# figures/__init__.py
+"""
+Figure builders for every Streamlit page, free of any `st.*` calls.
+
+Each page module (figures/notebook_XX.py) defines:
+- NOTEBOOK: export folder name, e.g. "notebook_01"
+- PARAMS: default values for the page's widgets (optional)
+- VARIANTS: widget settings the headless gallery exports (optional, default [{}])
+- DATASETS: datasets the figures read (optional, default all); a cached figure
+  is rebuilt when one of them changes on disk
+- FIGURES: {export stem: builder}; a builder's argument names pick the PARAMS
+  it depends on, and a stem may use them as format fields ("{metric}_choropleth")
+
+The Streamlit pages render these figures; build_gallery.py exports them headlessly.
+Pages pass a per-session cache to build_page, so a widget change rebuilds only
+the figures whose builders declare that widget's parameter. Builders are
+independent of each other, so build_page can run them on a thread pool.
+"""
+
+import importlib
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.data_utils import dataset_version
+from utils.serialize_utils import compact_figure
+
+PAGES = [f"notebook_{i:02d}" for i in range(1, 11)]
+
+# Threads the Streamlit pages build their figures on (build_page(..., workers=...))
+PAGE_WORKERS = 4
+
+
+def load_page(name):
+    """
+    Imports a page module by name, e.g. "notebook_03".
+    """
+    return importlib.import_module(f"{__name__}.{name}")
+
+
+def page_params(page, **params):
+    """
+    Page defaults overridden by the given widget values.
+    """
+    return {**getattr(page, "PARAMS", {}), **params}
+
+
+def figure_inputs(builder, params):
+    """
+    The parameters a builder declares, with their current values.
+    """
+    names = inspect.signature(builder).parameters
+    return {name: params[name] for name in names if name in params}
+
+
+def build_figure(builder, params):
+    """
+    Calls a builder with just the parameters it declares.
+    """
+    return builder(**figure_inputs(builder, params))
+
+
+def _theme_key(theme):
+    # Part of the cache key: a figure built under another theme is rebuilt
+    return theme if theme is None or isinstance(theme, str) else theme.to_plotly_json()
+
+
+def _build(builder, inputs, theme):
+    start = time.perf_counter()
+    fig = builder(**inputs)
+    if theme is not None:
+        fig.update_layout(template=theme)
+    return compact_figure(fig), time.perf_counter() - start
+
+
+def build_page(page, timings=None, cache=None, theme=None, workers=1, **params):
+    """
+    Builds every figure of a page module.
+
+    Parameters:
+    - page (module): A figures.notebook_XX module.
+    - timings (dict | None): If given, filled with {stem: build seconds} of the figures built.
+    - cache (dict | None): {stem: (inputs, figure)} from earlier calls (e.g. a
+      Streamlit session's, see streamlit_utils.page_figure_cache). A figure
+      whose declared inputs and datasets are unchanged is taken from it
+      instead of being rebuilt; rebuilt figures are stored back.
+    - theme (go.layout.Template | str | None): Template set on every figure
+      (see plot_utils.theme_template).
+    - workers (int): Figures built at once on a thread pool.
+    - **params: Widget values overriding the page's PARAMS.
+
+    Returns {export stem: figure}, in the page's display order. Figures are
+    compacted (lossless typed arrays, see serialize_utils) for Streamlit and export.
+    """
+    params = page_params(page, **params)
+    version = dataset_version(getattr(page, "DATASETS", None)) if cache is not None else None
+    theme_key = _theme_key(theme)
+    figures, jobs = {}, {}
+    for stem, builder in page.FIGURES.items():
+        name = stem.format(**params)
+        inputs = figure_inputs(builder, params)
+        key = (tuple(sorted(inputs.items())), version, theme_key)
+        if cache is not None and name in cache and cache[name][0] == key:
+            figures[name] = cache[name][1]
+            continue
+        figures[name] = None  # placeholder keeps the display order
+        jobs[name] = (builder, inputs, key)
+
+    if workers > 1 and len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures = {name: pool.submit(_build, builder, inputs, theme) for name, (builder, inputs, _) in jobs.items()}
+            results = {name: future.result() for name, future in futures.items()}
+    else:
+        results = {name: _build(builder, inputs, theme) for name, (builder, inputs, _) in jobs.items()}
+
+    for name, (fig, seconds) in results.items():
+        figures[name] = fig
+        if timings is not None:
+            timings[name] = seconds
+        if cache is not None:
+            cache[name] = (jobs[name][2], fig)
+    return figures
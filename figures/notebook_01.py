@@ -0,0 +1,69 @@
+# figures/notebook_01.py
+from utils.cube_utils import query_cube
+from utils.downsample_utils import DEFAULT_MAX_POINTS
+from utils.plot_utils import (
+    line_plot,
+    scatter_plot,
+    bubble_plot,
+    apply_custom_layout,
+    apply_dark_theme,
+)
+
+NOTEBOOK = "notebook_01"
+
+
+# 📈 Line Plot – Total Sales
+def total_sales_over_time():
+    line_df = query_cube("OrderDate", "Sales")
+    return line_plot(line_df, x="OrderDate", y="Sales", title="Total Sales Over Time",
+                     max_points=DEFAULT_MAX_POINTS)
+
+
+# 📈 Line Plot – Region Breakdown
+def regional_sales_trend():
+    region_df = query_cube(["OrderDate", "Region"], "Sales")
+    return line_plot(region_df, x="OrderDate", y="Sales", color="Region", title="Regional Sales Trends",
+                     max_points=DEFAULT_MAX_POINTS)
+
+
+# 📍 Scatter Plot – Profit vs Sales by SubCategory
+def profit_vs_sales_scatter():
+    agg_df = query_cube("SubCategory", ["Sales", "Profit"])
+    return scatter_plot(
+        agg_df, x="Sales", y="Profit",
+        hover_name="SubCategory",
+        title="Profit vs Sales by SubCategory"
+    )
+
+
+# 🔵 Bubble Plot
+def bubble_sales_profit_orders():
+    df_count = query_cube("SubCategory", ["Sales", "Profit", "Orders"])
+    return bubble_plot(
+        df_count,
+        x="Sales", y="Profit",
+        size="Orders", color="SubCategory",
+        title="Sales vs Profit by SubCategory with Order Volume"
+    )
+
+
+# 🌒 Dark Theme Plot
+def regional_sales_dark():
+    region_df = query_cube(["OrderDate", "Region"], "Sales")
+    fig = line_plot(region_df, x="OrderDate", y="Sales", color="Region", max_points=DEFAULT_MAX_POINTS)
+    fig = apply_custom_layout(
+        fig,
+        title="💰 Regional Sales Trend Over Time (Dark)",
+        xaxis_title="Date", yaxis_title="Sales in USD",
+        legend_title="Region"
+    )
+    return apply_dark_theme(fig)
+
+
+FIGURES = {
+    "total_sales_over_time": total_sales_over_time,
+    "regional_sales_trend": regional_sales_trend,
+    "profit_vs_sales_scatter": profit_vs_sales_scatter,
+    "bubble_sales_profit_orders": bubble_sales_profit_orders,
+    "regional_sales_dark": regional_sales_dark,
+}
@@ -0,0 +1,45 @@
+# figures/notebook_02.py
+from utils.cube_utils import query_cube
+from utils.data_utils import load_dataset
+from utils.plot_utils import bar_plot, pie_chart, box_plot
+
+NOTEBOOK = "notebook_02"
+
+
+# 📘 Bar Plot – Total Sales by Category
+def sales_by_category():
+    bar_df = query_cube("Category", "Sales")
+    return bar_plot(bar_df, x="Category", y="Sales", title="Total Sales by Category")
+
+
+# 📘 Grouped Bar – SubCategory vs Region (Grouped)
+def subcat_sales_by_region_grouped():
+    group_df = query_cube(["SubCategory", "Region"], "Sales")
+    return bar_plot(group_df, x="SubCategory", y="Sales", color="Region", barmode="group", title="SubCategory Sales by Region (Grouped)")
+
+
+# 📘 Stacked Bar – SubCategory vs Region (Stacked)
+def subcat_sales_by_region_stacked():
+    group_df = query_cube(["SubCategory", "Region"], "Sales")
+    return bar_plot(group_df, x="SubCategory", y="Sales", color="Region", barmode="stack", title="SubCategory Sales by Region (Stacked)")
+
+
+# 🥧 Pie Chart – Region Sales Share
+def sales_share_pie_region():
+    pie_df = query_cube("Region", "Sales")
+    return pie_chart(pie_df, names="Region", values="Sales", title="Sales Share by Region")
+
+
+# 📦 Box Plot – Profit Distribution by Category
+def profit_boxplot_by_category():
+    df = load_dataset("superstore", columns=["Category", "Profit"])
+    return box_plot(df, x="Category", y="Profit", color="Category", title="Profit Distribution by Category")
+
+
+FIGURES = {
+    "sales_by_category": sales_by_category,
+    "subcat_sales_by_region_grouped": subcat_sales_by_region_grouped,
+    "subcat_sales_by_region_stacked": subcat_sales_by_region_stacked,
+    "sales_share_pie_region": sales_share_pie_region,
+    "profit_boxplot_by_category": profit_boxplot_by_category,
+}
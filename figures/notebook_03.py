@@ -0,0 +1,56 @@
+# figures/notebook_03.py
+from utils.data_utils import load_dataset
+from utils.plot_utils import histogram_plot, density_heatmap, density_contour
+
+NOTEBOOK = "notebook_03"
+
+# Bins are counted in Python, so figures carry per-bin counts instead of rows
+BINNING = "server"
+
+MEASURES = ["Profit", "Sales"]  # 🔧 Removed 'Quantity'
+
+# category=None → first category in the data (the page's default selection)
+PARAMS = {"category": None, "measure": "Profit"}
+DATASETS = ["superstore"]
+
+
+def _superstore():
+    return load_dataset("superstore", columns=["Category", "Sales", "Profit"])
+
+
+def category_options():
+    """
+    Categories offered by the page's category selector, in data order.
+    """
+    return list(_superstore()["Category"].unique())
+
+
+# 📊 Histogram – Selected Measure
+def histogram_selected_measure(category, measure):
+    df = _superstore()
+    category = category if category is not None else df["Category"].iloc[0]
+    filtered_df = df[df["Category"] == category]
+    return histogram_plot(filtered_df, x=measure, nbins=50, title=f"{measure} Distribution", binning=BINNING)
+
+
+# 📘 Histogram – By Category (Overlayed)
+def profit_hist_by_category():
+    return histogram_plot(_superstore(), x="Profit", color="Category", nbins=50, barmode="overlay", title="Profit by Category (Overlay)", binning=BINNING)
+
+
+# 🌈 Density Heatmap – Sales vs Profit
+def sales_profit_density_heatmap():
+    return density_heatmap(_superstore(), x="Sales", y="Profit", title="Sales vs Profit Density Heatmap", binning=BINNING)
+
+
+# 📈 Density Contour Plot
+def sales_profit_density_contour():
+    return density_contour(_superstore(), x="Sales", y="Profit", title="Sales vs Profit Density Contour")
+
+
+FIGURES = {
+    "histogram_selected_measure": histogram_selected_measure,
+    "profit_hist_by_category": profit_hist_by_category,
+    "sales_profit_density_heatmap": sales_profit_density_heatmap,
+    "sales_profit_density_contour": sales_profit_density_contour,
+}
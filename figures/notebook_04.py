@@ -0,0 +1,47 @@
+# figures/notebook_04.py
+from utils.data_utils import load_dataset
+from utils.plot_utils import choropleth_map, scatter_geo
+
+NOTEBOOK = "notebook_04"
+
+METRIC_TITLES = {
+    "GDP_per_capita": "World GDP per Capita (Synthetic Data)",
+    "Life_Expectancy": "Life Expectancy by Country"
+}
+
+PARAMS = {"metric": "GDP_per_capita"}
+VARIANTS = [{"metric": metric} for metric in METRIC_TITLES]
+DATASETS = ["world_population", "map_data"]
+
+
+# 🌍 Choropleth Map – Selected Metric
+def choropleth(metric):
+    world_df = load_dataset("world_population", columns=["Country", "GDP_per_capita", "Life_Expectancy"])
+    return choropleth_map(
+        world_df,
+        locations="Country",
+        color=metric,
+        locationmode="country names",
+        title=METRIC_TITLES[metric],
+        geometry="bundled",  # no CDN fallback: a missing bundle fails the build
+    )
+
+
+# 🌐 Scatter Geo – City Score
+def city_scores_scatter_geo():
+    city_df = load_dataset("map_data")
+    return scatter_geo(
+        city_df,
+        lat="Latitude",
+        lon="Longitude",
+        color="Score",
+        hover_name="City",
+        size="Score",
+        title="City-wise Synthetic Score (100 cities)"
+    )
+
+
+FIGURES = {
+    "{metric}_choropleth": choropleth,
+    "city_scores_scatter_geo": city_scores_scatter_geo,
+}
@@ -0,0 +1,50 @@
+# figures/notebook_05.py
+import plotly.graph_objects as go
+from utils.data_utils import load_dataset
+from utils.plot_utils import animated_plot, data_dropdown, data_slider, group_arrays
+
+NOTEBOOK = "notebook_05"
+
+
+# 🎞️ Animated Plot
+def monthly_sales_animated():
+    df = load_dataset("animated_sales")
+    return animated_plot(
+        df,
+        x="Category",
+        y="Sales",
+        animation_frame="Month",
+        color="Category",
+        title="Monthly Sales by Category (Animated)",
+        plot_type="bar"
+    )
+
+
+# 🔽 Dropdown Interactivity – one trace, each category's arrays swapped in per button
+def category_toggle_dropdown():
+    df = load_dataset("animated_sales")
+
+    fig = go.Figure(go.Scatter())
+    fig = data_dropdown(fig, group_arrays(df, "Category", x="Month", y="Sales"),
+                        title="Toggle Category Sales Over Time")
+    fig.update_layout(height=500)
+    return fig
+
+
+# 🎚️ Slider Interactivity
+def category_slider():
+    df = load_dataset("animated_sales")
+    totals = df.groupby("Category", sort=False, observed=True)["Sales"].sum()
+
+    fig = go.Figure(go.Bar())
+    step_data = {cat: {"x": [cat], "y": [total], "name": cat} for cat, total in totals.items()}
+    fig = data_slider(fig, step_data, title="Slider: Sales by Category")
+    fig.update_layout(height=500)
+    return fig
+
+
+FIGURES = {
+    "monthly_sales_animated": monthly_sales_animated,
+    "category_toggle_dropdown": category_toggle_dropdown,
+    "category_slider": category_slider,
+}
@@ -0,0 +1,78 @@
+# figures/notebook_06.py
+import plotly.graph_objects as go
+from utils.cube_utils import query_cube
+from utils.data_utils import load_dataset
+from utils.plot_utils import (
+    create_subplots,
+    add_trace_to_subplot,
+    update_subplot_layout,
+    apply_dashboard_margins,
+)
+
+NOTEBOOK = "notebook_06"
+
+
+# 📊 Dashboard 1 – 2x2 Layout
+def dashboard_sales_global():
+    store_df = load_dataset("superstore", columns=["Category", "Profit"])
+    world_df = load_dataset("world_population", columns=["GDP_per_capita", "Life_Expectancy"])
+
+    fig = create_subplots(
+        rows=2,
+        cols=2,
+        subplot_titles=[
+            "Sales by Category",
+            "Profit Distribution (Box)",
+            "GDP per Capita by Country",
+            "Life Expectancy Distribution"
+        ]
+    )
+
+    # Top-left: Sales by Category
+    bar_data = query_cube("Category", "Sales")
+    trace1 = go.Bar(x=bar_data["Category"], y=bar_data["Sales"], name="Sales")
+    add_trace_to_subplot(fig, trace1, row=1, col=1)
+
+    # Top-right: Profit Box
+    trace2 = go.Box(x=store_df["Category"], y=store_df["Profit"], name="Profit")
+    add_trace_to_subplot(fig, trace2, row=1, col=2)
+
+    # Bottom-left: GDP Histogram
+    trace3 = go.Histogram(x=world_df["GDP_per_capita"], nbinsx=20, name="GDP")
+    add_trace_to_subplot(fig, trace3, row=2, col=1)
+
+    # Bottom-right: Life Expectancy Violin Plot
+    trace4 = go.Violin(y=world_df["Life_Expectancy"], box_visible=True, meanline_visible=True, name="Life Exp")
+    add_trace_to_subplot(fig, trace4, row=2, col=2)
+
+    fig = update_subplot_layout(fig, title="📊 Dashboard: Sales, Profit, and Global Metrics", height=800)
+    return apply_dashboard_margins(fig)
+
+
+# 📘 Dashboard 2 – Shared X-Axis
+def subcategory_kpis_sharedx():
+    fig = create_subplots(
+        rows=1,
+        cols=2,
+        subplot_titles=["Sales by SubCategory", "Profit by SubCategory"],
+        shared_x=True,
+        vertical_spacing=0.05,
+        horizontal_spacing=0.15
+    )
+
+    bar_data2 = query_cube("SubCategory", ["Sales", "Profit"])
+
+    trace1 = go.Bar(x=bar_data2["SubCategory"], y=bar_data2["Sales"], name="Sales")
+    trace2 = go.Bar(x=bar_data2["SubCategory"], y=bar_data2["Profit"], name="Profit", marker_color="green")
+
+    add_trace_to_subplot(fig, trace1, row=1, col=1)
+    add_trace_to_subplot(fig, trace2, row=1, col=2)
+
+    fig = update_subplot_layout(fig, title="📈 SubCategory KPIs – Shared X & Custom Spacing", width=1000)
+    return apply_dashboard_margins(fig, l=30, r=30, t=60, b=40)
+
+
+FIGURES = {
+    "dashboard_sales_global": dashboard_sales_global,
+    "subcategory_kpis_sharedx": subcategory_kpis_sharedx,
+}
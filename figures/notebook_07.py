@@ -0,0 +1,66 @@
+# figures/notebook_07.py
+import plotly.graph_objects as go
+from utils.data_utils import load_dataset
+
+NOTEBOOK = "notebook_07"
+
+
+# 📘 Graph Object with Annotation
+def graph_objects_annotations():
+    df = load_dataset("superstore", columns=["OrderDate", "Sales"])
+    df["Month"] = df["OrderDate"].dt.to_period("M").astype(str)
+
+    # 📊 Aggregate Monthly Sales
+    monthly_sales = df.groupby("Month")["Sales"].sum().sort_index()
+
+    fig = go.Figure()
+
+    fig.add_trace(
+        go.Scatter(
+            x=monthly_sales.index,
+            y=monthly_sales.values,
+            mode="lines+markers",
+            name="Sales",
+            line=dict(color="royalblue"),
+            marker=dict(size=6),
+        )
+    )
+
+    # 📌 Add annotation for peak sales
+    max_idx = monthly_sales.idxmax()
+    max_val = monthly_sales.max()
+
+    fig.add_annotation(
+        x=max_idx,
+        y=max_val,
+        text=f"📌 Peak: {max_val:.0f}",
+        showarrow=True,
+        arrowhead=2,
+        ax=0,
+        ay=-40,
+        font=dict(color="darkred", size=12)
+    )
+
+    # 🎯 Layout + Line Shape
+    fig.update_layout(
+        title="📈 Monthly Sales with Annotation",
+        xaxis_title="Month",
+        yaxis_title="Total Sales",
+        shapes=[
+            dict(
+                type="line",
+                x0=max_idx,
+                y0=0,
+                x1=max_idx,
+                y1=max_val,
+                line=dict(color="red", dash="dot"),
+            )
+        ],
+        height=500,
+    )
+    return fig
+
+
+FIGURES = {
+    "graph_objects_annotations": graph_objects_annotations,
+}
@@ -0,0 +1,36 @@
+# figures/notebook_08.py
+from utils.data_utils import load_dataset
+from utils.plot_utils import scatter_mapbox
+
+NOTEBOOK = "notebook_08"
+
+MAP_STYLES = ["open-street-map", "carto-positron", "carto-darkmatter"]
+REQUIRED_COLUMNS = ["City", "Latitude", "Longitude", "Score"]
+
+AGGREGATIONS = [None, "grid", "hex", "geohash"]
+
+PARAMS = {"map_style": "open-street-map", "zoom": 2, "aggregate": None}
+VARIANTS = [{"map_style": style} for style in MAP_STYLES]
+DATASETS = ["map_data"]
+
+
+# 🌍 Mapbox Plot
+def city_scores(map_style, zoom, aggregate):
+    df = load_dataset("map_data")
+    return scatter_mapbox(
+        df,
+        lat="Latitude",
+        lon="Longitude",
+        color="Score",
+        size="Score",
+        hover_name="City",
+        zoom=zoom,
+        title=f"City Scores – {map_style.replace('-', ' ').title()}",
+        mapbox_style=map_style,
+        aggregate=aggregate,
+    )
+
+
+FIGURES = {
+    "city_scores_{map_style}": city_scores,
+}
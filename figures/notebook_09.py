@@ -0,0 +1,83 @@
+# figures/notebook_09.py
+import plotly.graph_objects as go
+from utils.cube_utils import query_cube
+from utils.data_utils import load_dataset
+from utils.plot_utils import (
+    add_trendline,
+    add_moving_average,
+    add_zscore_band,
+    scatter_trace,
+    create_subplots,
+    add_trace_to_subplot,
+    update_subplot_layout,
+)
+
+NOTEBOOK = "notebook_09"
+
+
+# 📈 Case 1: USA COVID Trend Line
+def covid_usa_trends():
+    covid_df = load_dataset("covid_data")
+    usa_df = covid_df[covid_df["Country"] == "USA"]
+
+    fig = go.Figure()
+    fig.add_trace(scatter_trace(
+        x=usa_df["Date"],
+        y=usa_df["Cases"],
+        name="Daily Cases",
+        mode="lines",
+        line=dict(color="orange")
+    ))
+
+    ma_trace = add_moving_average(usa_df["Date"], usa_df["Cases"], window=7, name="7-Day Avg")
+    fig.add_trace(ma_trace)
+    upper_band, lower_band = add_zscore_band(usa_df["Date"], usa_df["Cases"], z=1)
+
+    fig.add_trace(scatter_trace(
+        x=usa_df["Date"],
+        y=upper_band,
+        mode="lines",
+        name="+1σ Band",
+        line=dict(color="lightgray", dash="dash")
+    ))
+
+    fig.add_trace(scatter_trace(
+        x=usa_df["Date"],
+        y=lower_band,
+        mode="lines",
+        name="−1σ Band",
+        line=dict(color="lightgray", dash="dash")
+    ))
+
+    trend_trace = add_trendline(usa_df["Date"], usa_df["Cases"], name="Trend")
+    fig.add_trace(trend_trace)
+
+    fig.update_layout(
+        title="🦠 COVID-19 Case Trends – USA",
+        xaxis_title="Date",
+        yaxis_title="Daily Cases"
+    )
+    return fig
+
+
+# 📦 Case 2: Superstore KPI Dashboard
+def superstore_kpi_dashboard():
+    store_df = load_dataset("superstore", columns=["Profit"])
+    fig = create_subplots(rows=1, cols=2, subplot_titles=["Sales by Region", "Profit Distribution"])
+
+    # 📊 Region-wise Sales
+    sales_by_region = query_cube("Region", "Sales")
+    trace_sales = go.Bar(x=sales_by_region["Region"], y=sales_by_region["Sales"], name="Sales")
+    add_trace_to_subplot(fig, trace_sales, row=1, col=1)
+
+    # 📊 Profit Boxplot
+    trace_profit = go.Box(y=store_df["Profit"], name="Profit")
+    add_trace_to_subplot(fig, trace_profit, row=1, col=2)
+
+    return update_subplot_layout(fig, title="📦 Superstore KPIs")
+
+
+FIGURES = {
+    "covid_usa_trends": covid_usa_trends,
+    "superstore_kpi_dashboard": superstore_kpi_dashboard,
+}
@@ -0,0 +1,84 @@
+# figures/notebook_10.py
+import plotly.graph_objects as go
+from utils.data_utils import load_dataset
+from utils.downsample_utils import DEFAULT_MAX_POINTS, downsample_figure
+from utils.plot_utils import add_trendline, add_moving_average, add_zscore_band, scatter_trace
+
+NOTEBOOK = "notebook_10"
+
+# Point budget per trace; every overlay here has one point per order row
+MAX_POINTS = DEFAULT_MAX_POINTS
+
+
+def _sales_over_time():
+    df = load_dataset("superstore", columns=["OrderDate", "Sales"])
+    df["Sales"] = df["Sales"].fillna(0)
+    return df["OrderDate"], df["Sales"]
+
+
+def _sales_scatter(x, y):
+    return scatter_trace(x=x, y=y, mode="markers", name="Sales", marker=dict(size=4, color="gray"))
+
+
+# 📈 Trendline + Moving Average
+def sales_trend_ma():
+    x, y = _sales_over_time()
+    trend = add_trendline(x, y)
+    ma = add_moving_average(x, y, window=30)
+
+    fig = go.Figure([_sales_scatter(x, y), trend, ma])
+    fig.update_layout(
+        title="📈 Sales Over Time with Trendline & Moving Average",
+        xaxis_title="Order Date",
+        yaxis_title="Sales",
+        height=500
+    )
+    downsample_figure(fig, MAX_POINTS)
+    return fig
+
+
+# 📊 Z-Score Band Overlay
+def sales_zscore_band():
+    x, y = _sales_over_time()
+    upper, lower = add_zscore_band(x, y, z=2)
+    band_upper = scatter_trace(x=x, y=upper, name="+2σ", mode="lines", line=dict(color="red", dash="dash"))
+    band_lower = scatter_trace(x=x, y=lower, name="-2σ", mode="lines", line=dict(color="red", dash="dash"))
+
+    fig = go.Figure([_sales_scatter(x, y), band_upper, band_lower])
+    fig.update_layout(
+        title="📊 Z-Score Confidence Bands (±2σ) on Sales",
+        xaxis_title="Order Date",
+        yaxis_title="Sales",
+        height=500
+    )
+    downsample_figure(fig, MAX_POINTS)
+    return fig
+
+
+# 🧩 Modular Chart (.pipe()-style)
+def base_scatter(x, y, label="Sales"):
+    return scatter_trace(x=x, y=y, mode="markers", name=label, marker=dict(size=4, color="navy"))
+
+
+def modular_workflow():
+    x, y = _sales_over_time()
+    chart = go.Figure()
+    chart.add_trace(base_scatter(x, y))
+    chart.add_trace(add_moving_average(x, y, window=30))
+    chart.add_trace(add_trendline(x, y))
+
+    chart.update_layout(
+        title="🧩 Modular Workflow: .pipe()-style Assembly",
+        xaxis_title="Order Date",
+        yaxis_title="Sales",
+        height=500
+    )
+    downsample_figure(chart, MAX_POINTS)
+    return chart
+
+
+FIGURES = {
+    "sales_trend_ma": sales_trend_ma,
+    "sales_zscore_band": sales_zscore_band,
+    "modular_workflow": modular_workflow,
+}
@@ -1,24 +1,97 @@
-import pandas as pd
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+import pandas as pd
 from faker import Faker
-from datetime import datetime, timedelta
-import os
-import random
+
+from utils.data_utils import DATASETS, clear_partitions, write_dataset, write_partition
 
 # ========== CONFIG ==========
-faker = Faker()
-np.random.seed(42)
-random.seed(42)
-os.makedirs("datasets", exist_ok=True)
+DEFAULT_SEED = 42
+
+# Fixed "today" so the same seed always produces the same files
+DEFAULT_END_DATE = "2025-07-25"
+
+# Output formats: "csv" (text) and/or "feather" (columnar, memory-mappable; needs pyarrow)
+OUTPUT_FORMATS = ("csv", "feather")
+
+# Default sizes at --scale 1 (the superstore size is set with --rows)
+SUPERSTORE_ROWS = 1000
+COVID_DAYS = 365
+STOCK_DAYS = 180
+CUSTOMERS = 500
+CITIES = 100
 
 # Toggle this to True if you want to visualize a quick sanity-check using Plotly
 ENABLE_SANITY_PLOTS = False
 
-if ENABLE_SANITY_PLOTS:
-    import plotly.express as px
+# Every generator below draws whole columns at once from a numpy Generator,
+# so cost grows with the number of rows only through vectorized NumPy work.
+# Faker is only used to build small pools of names that rows are sampled from.
+
+
+# ========== Vectorized helpers ==========
+_HEX = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+
+def uuid4_column(rng, n):
+    """
+    n random (version 4) UUID strings drawn from rng, built without a Python loop.
+    """
+    raw = rng.integers(0, 256, size=(n, 16), dtype=np.uint8)
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+
+    digits = np.empty((n, 32), dtype=np.uint8)
+    digits[:, 0::2] = _HEX[raw >> 4]
+    digits[:, 1::2] = _HEX[raw & 0x0F]
+    text = np.insert(digits, [8, 12, 16, 20], ord("-"), axis=1)
+    return _text_column(text.view("S36").ravel())
+
+
+def _text_column(values):
+    # Fixed-width bytes → Arrow-backed strings (compact) or Python str objects
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return values.astype(str)
+    return pd.Series(pa.array(values, type=pa.binary()).cast(pa.string()), dtype=pd.ArrowDtype(pa.string()))
+
+
+def pick(rng, options, n):
+    """
+    n uniform draws from options as a Categorical (int8 codes, no per-row strings).
+    """
+    return pd.Categorical.from_codes(rng.integers(0, len(options), size=n), categories=list(options))
+
+
+def name_pool(faker, method, size):
+    """
+    `size` Faker names (e.g. "city") to sample rows from, instead of one Faker call per row.
+    """
+    return [getattr(faker, method)() for _ in range(size)]
+
+
+def recent_dates(rng, n, end_date, days):
+    """
+    n dates uniformly between end_date - days and end_date (inclusive).
+    """
+    end = np.datetime64(end_date, "D")
+    return end - rng.integers(0, days + 1, size=n).astype("timedelta64[D]")
+
+
+def daily_dates(end_date, days):
+    """
+    `days` consecutive dates ending the day before end_date.
+    """
+    end = np.datetime64(end_date, "D")
+    return end - np.arange(days, 0, -1).astype("timedelta64[D]")
+
 
 # ========== 1. Superstore Sales Dataset ==========
-def generate_superstore():
+def generate_superstore(rng, faker, rows=SUPERSTORE_ROWS, end_date=DEFAULT_END_DATE, **_):
     categories = ['Furniture', 'Office Supplies', 'Technology']
     subcategories = {
         'Furniture': ['Chairs', 'Tables', 'Bookcases'],
@@ -26,149 +99,226 @@ def generate_superstore():
         'Technology': ['Phones', 'Laptops', 'Accessories']
     }
     regions = ['East', 'West', 'Central', 'South']
-    rows = []
-
-    for _ in range(1000):
-        cat = random.choice(categories)
-        sub = random.choice(subcategories[cat])
-        region = random.choice(regions)
-        date = faker.date_between(start_date='-1y', end_date='today')
-        sales = round(random.uniform(10, 1000), 2)
-        profit = round(random.uniform(-100, 300), 2)
-        rows.append([faker.uuid4(), date, cat, sub, region, sales, profit])
-
-    df = pd.DataFrame(rows, columns=[
-        'OrderID', 'OrderDate', 'Category', 'SubCategory', 'Region', 'Sales', 'Profit'
-    ])
-    df.to_csv("datasets/superstore.csv", index=False)
+
+    # SubCategory is drawn within the row's Category (3 per category)
+    cat = rng.integers(0, len(categories), size=rows)
+    sub = cat * 3 + rng.integers(0, 3, size=rows)
+    all_subcategories = [s for c in categories for s in subcategories[c]]
+
+    return pd.DataFrame({
+        'OrderID': uuid4_column(rng, rows),
+        'OrderDate': recent_dates(rng, rows, end_date, 365),
+        'Category': pd.Categorical.from_codes(cat, categories=categories),
+        'SubCategory': pd.Categorical.from_codes(sub, categories=all_subcategories),
+        'Region': pick(rng, regions, rows),
+        'Sales': rng.uniform(10, 1000, size=rows).round(2),
+        'Profit': rng.uniform(-100, 300, size=rows).round(2),
+    })
+
 
 # ========== 2. COVID Time Series ==========
-def generate_covid_data():
+def generate_covid_data(rng, faker, scale=1, **_):
     countries = ['USA', 'India', 'Brazil', 'UK', 'Germany']
-    base_date = datetime(2020, 1, 1)
-    data = []
+    days = COVID_DAYS * scale
+    dates = np.datetime64("2020-01-01") + np.arange(days).astype("timedelta64[D]")
 
-    for country in countries:
-        cases = 100
-        deaths = 1
-        for i in range(365):
-            date = base_date + timedelta(days=i)
-            cases += int(np.random.normal(300, 100))
-            deaths += int(np.random.normal(5, 2))
-            data.append([country, date.date(), max(cases, 0), max(deaths, 0)])
+    # Random walks: one cumulative sum per country over daily increments
+    cases = 100 + np.cumsum(rng.normal(300, 100, size=(len(countries), days)).astype(np.int64), axis=1)
+    deaths = 1 + np.cumsum(rng.normal(5, 2, size=(len(countries), days)).astype(np.int64), axis=1)
+
+    return pd.DataFrame({
+        'Country': np.repeat(countries, days),
+        'Date': np.tile(dates, len(countries)),
+        'Cases': np.maximum(cases, 0).ravel(),
+        'Deaths': np.maximum(deaths, 0).ravel(),
+    })
 
-    df = pd.DataFrame(data, columns=['Country', 'Date', 'Cases', 'Deaths'])
-    df.to_csv("datasets/covid_data.csv", index=False)
 
 # ========== 3. Stock Price Data ==========
-def generate_stock_data():
+def generate_stock_data(rng, faker, scale=1, end_date=DEFAULT_END_DATE, **_):
     companies = ['AlphaCorp', 'BetaTech', 'GammaHealth']
-    base_date = datetime.today() - timedelta(days=180)
-    data = []
-
-    for company in companies:
-        price = round(random.uniform(20, 100), 2)
-        for i in range(180):
-            date = base_date + timedelta(days=i)
-            open_price = round(price + np.random.normal(0, 2), 2)
-            close = round(open_price + np.random.normal(0, 2), 2)
-            high = max(open_price, close) + round(random.uniform(0, 2), 2)
-            low = min(open_price, close) - round(random.uniform(0, 2), 2)
-            volume = random.randint(1000, 5000)
-            data.append([company, date.date(), open_price, close, high, low, volume])
-            price = close
-
-    df = pd.DataFrame(data, columns=['Company', 'Date', 'Open', 'Close', 'High', 'Low', 'Volume'])
-    df.to_csv("datasets/stock_data.csv", index=False)
+    days = STOCK_DAYS * scale
+    shape = (len(companies), days)
+
+    # Close follows a random walk: open = previous close + gap, close = open + move
+    start = rng.uniform(20, 100, size=(len(companies), 1)).round(2)
+    gap = rng.normal(0, 2, size=shape)
+    move = rng.normal(0, 2, size=shape)
+    close = start + np.cumsum(gap + move, axis=1)
+    open_price = np.concatenate([start, close[:, :-1]], axis=1) + gap
+    high = np.maximum(open_price, close) + rng.uniform(0, 2, size=shape).round(2)
+    low = np.minimum(open_price, close) - rng.uniform(0, 2, size=shape).round(2)
+
+    return pd.DataFrame({
+        'Company': np.repeat(companies, days),
+        'Date': np.tile(daily_dates(end_date, days), len(companies)),
+        'Open': open_price.round(2).ravel(),
+        'Close': close.round(2).ravel(),
+        'High': high.round(2).ravel(),
+        'Low': low.round(2).ravel(),
+        'Volume': rng.integers(1000, 5001, size=shape).ravel(),
+    })
+
 
 # ========== 4. World Population ==========
-def generate_world_population():
-    countries = [faker.country() for _ in range(60)]
-    data = []
-
-    for country in countries:
-        population = random.randint(1_000_000, 1_500_000_000)
-        gdp = round(random.uniform(1000, 60000), 2)
-        life_expectancy = round(random.uniform(50, 85), 2)
-        continent = random.choice(['Asia', 'Europe', 'Africa', 'Americas', 'Oceania'])
-        data.append([country, population, gdp, life_expectancy, continent])
-
-    df = pd.DataFrame(data, columns=[
-        'Country', 'Population', 'GDP_per_capita', 'Life_Expectancy', 'Continent'
-    ])
-    df.to_csv("datasets/world_population.csv", index=False)
+def generate_world_population(rng, faker, **_):
+    # One row per country name, so this table does not scale
+    n = 60
+    return pd.DataFrame({
+        'Country': name_pool(faker, "country", n),
+        'Population': rng.integers(1_000_000, 1_500_000_001, size=n),
+        'GDP_per_capita': rng.uniform(1000, 60000, size=n).round(2),
+        'Life_Expectancy': rng.uniform(50, 85, size=n).round(2),
+        'Continent': pick(rng, ['Asia', 'Europe', 'Africa', 'Americas', 'Oceania'], n),
+    })
+
 
 # ========== 5. Customer Segments ==========
-def generate_customer_segments():
-    data = []
-
-    for _ in range(500):
-        gender = random.choice(['Male', 'Female', 'Other'])
-        age = random.randint(18, 70)
-        income = random.randint(20_000, 150_000)
-        segment = random.choice(['Budget', 'Mid-range', 'Premium'])
-        region = faker.state()
-        data.append([faker.uuid4(), gender, age, income, segment, region])
-
-    df = pd.DataFrame(data, columns=[
-        'CustomerID', 'Gender', 'Age', 'Income', 'Segment', 'Region'
-    ])
-    df.to_csv("datasets/customer_segments.csv", index=False)
+def generate_customer_segments(rng, faker, scale=1, **_):
+    n = CUSTOMERS * scale
+    states = name_pool(faker, "state", 200)
+    return pd.DataFrame({
+        'CustomerID': uuid4_column(rng, n),
+        'Gender': pick(rng, ['Male', 'Female', 'Other'], n),
+        'Age': rng.integers(18, 71, size=n),
+        'Income': rng.integers(20_000, 150_001, size=n),
+        'Segment': pick(rng, ['Budget', 'Mid-range', 'Premium'], n),
+        'Region': np.asarray(states, dtype=object)[rng.integers(0, len(states), size=n)],
+    })
+
 
 # ========== 6. Product Launch Lifecycle ==========
-def generate_product_launch():
+def generate_product_launch(rng, faker, **_):
     stages = ['Pre-Launch', 'Launch', 'Growth', 'Maturity', 'Decline']
     products = ['ProdX', 'ProdY', 'ProdZ']
-    data = []
-
-    for product in products:
-        for stage in stages:
-            for week in range(1, 5):
-                sales = round(random.uniform(1000, 10000), 2)
-                marketing_spend = round(random.uniform(500, 5000), 2)
-                data.append([product, stage, week, sales, marketing_spend])
+    grid = pd.MultiIndex.from_product([products, stages, range(1, 5)], names=['Product', 'Stage', 'Week'])
+    n = len(grid)
+    df = grid.to_frame(index=False)
+    df['Sales'] = rng.uniform(1000, 10000, size=n).round(2)
+    df['MarketingSpend'] = rng.uniform(500, 5000, size=n).round(2)
+    return df
 
-    df = pd.DataFrame(data, columns=['Product', 'Stage', 'Week', 'Sales', 'MarketingSpend'])
-    df.to_csv("datasets/product_launch.csv", index=False)
 
 # ========== 7. Geo Location Data ==========
-def generate_map_data():
-    cities = [faker.city() for _ in range(100)]
-    data = []
+def generate_map_data(rng, faker, scale=1, **_):
+    n = CITIES * scale
+    cities = name_pool(faker, "city", min(n, 1000))
+    names = cities if n == len(cities) else np.asarray(cities, dtype=object)[rng.integers(0, len(cities), size=n)]
+    return pd.DataFrame({
+        'City': names,
+        'Latitude': rng.uniform(-90, 90, size=n).round(7),
+        'Longitude': rng.uniform(-180, 180, size=n).round(6),
+        'Score': rng.uniform(0, 100, size=n).round(2),
+    })
 
-    for city in cities:
-        lat = faker.latitude()
-        lon = faker.longitude()
-        score = round(random.uniform(0, 100), 2)
-        data.append([city, lat, lon, score])
-
-    df = pd.DataFrame(data, columns=['City', 'Latitude', 'Longitude', 'Score'])
-    df.to_csv("datasets/map_data.csv", index=False)
 
 # ========== 8. Animated Sales Data ==========
-def generate_animated_sales():
+def generate_animated_sales(rng, faker, **_):
     categories = ['Electronics', 'Apparel', 'Books', 'Home']
     months = pd.date_range(start="2022-01-01", periods=12, freq="ME").strftime('%Y-%m')
-    data = []
+    return pd.DataFrame({
+        'Month': np.tile(months, len(categories)),
+        'Category': np.repeat(categories, len(months)),
+        'Sales': rng.uniform(5000, 25000, size=len(categories) * len(months)).round(2),
+    })
+
+
+# Registry name → generator; each gets its own child seed, so a dataset's
+# content does not depend on which other datasets are generated
+GENERATORS = {
+    "superstore": generate_superstore,
+    "covid_data": generate_covid_data,
+    "stock_data": generate_stock_data,
+    "world_population": generate_world_population,
+    "customer_segments": generate_customer_segments,
+    "product_launch": generate_product_launch,
+    "map_data": generate_map_data,
+    "animated_sales": generate_animated_sales,
+}
+
+
+def _seed_sequence(name, seed):
+    return np.random.SeedSequence([seed, list(GENERATORS).index(name)])
+
 
-    for cat in categories:
-        for month in months:
-            sales = round(random.uniform(5000, 25000), 2)
-            data.append([month, cat, sales])
+def _build(name, seed_sequence, **options):
+    faker = Faker()
+    faker.seed_instance(int(seed_sequence.generate_state(1)[0]))
+    return GENERATORS[name](np.random.default_rng(seed_sequence), faker, **options)
+
+
+def generate(name, seed=DEFAULT_SEED, **options):
+    """
+    Builds one dataset deterministically from (seed, dataset name, options).
+    """
+    return _build(name, _seed_sequence(name, seed), **options)
+
+
+# ========== Partitioned Generation ==========
+def partition_rows(rows, partitions, index):
+    """
+    Rows of partition `index` when `rows` are split as evenly as possible.
+    """
+    return rows // partitions + (index < rows % partitions)
+
+
+def generate_partition(name, index, partitions, seed=DEFAULT_SEED, formats=("feather",), **options):
+    """
+    Builds and writes partition `index` of `partitions` (runs inside a worker).
+
+    Its seed is child `index` of the dataset's seed sequence, so the files are
+    identical whatever the number of workers or the order partitions finish in.
+    """
+    seed_sequence = _seed_sequence(name, seed).spawn(partitions)[index]
+    options["rows"] = partition_rows(options.get("rows", SUPERSTORE_ROWS), partitions, index)
+    df = _build(name, seed_sequence, **options)
+    write_partition(df, name, index, formats)
+    return len(df)
+
+
+def generate_partitioned(name, partitions, workers=None, seed=DEFAULT_SEED, formats=("feather",), **options):
+    """
+    Writes a dataset as hive-style month folders (datasets/<name>/date=YYYY-MM/)
+    from `partitions` chunks generated across a process pool. Returns the row count.
+    """
+    clear_partitions(name)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(generate_partition, name, i, partitions, seed, formats, **options)
+            for i in range(partitions)
+        ]
+        return sum(f.result() for f in futures)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the synthetic datasets in ./datasets/")
+    parser.add_argument("--rows", type=int, default=SUPERSTORE_ROWS, help="Superstore orders, e.g. 50_000_000")
+    parser.add_argument("--scale", type=int, default=1, help="Multiplier for the other growable datasets")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--end-date", default=DEFAULT_END_DATE, help="Last order/trading date (YYYY-MM-DD)")
+    parser.add_argument("--format", nargs="+", choices=["csv", "feather"], default=list(OUTPUT_FORMATS), dest="formats")
+    parser.add_argument("--datasets", nargs="+", choices=list(GENERATORS), default=list(GENERATORS))
+    parser.add_argument("--partitions", type=int, default=0,
+                        help="Split partitionable datasets (superstore) into this many generated chunks")
+    parser.add_argument("--workers", type=int, help="Processes for --partitions (default: CPU count)")
+    return parser.parse_args(argv)
 
-    df = pd.DataFrame(data, columns=['Month', 'Category', 'Sales'])
-    df.to_csv("datasets/animated_sales.csv", index=False)
 
 # ========== Main Execution ==========
 if __name__ == "__main__":
-    generate_superstore()
-    generate_covid_data()
-    generate_stock_data()
-    generate_world_population()
-    generate_customer_segments()
-    generate_product_launch()
-    generate_map_data()
-    generate_animated_sales()
+    args = parse_args()
+
+    options = dict(rows=args.rows, scale=args.scale, end_date=args.end_date)
+
+    for name in args.datasets:
+        start = time.perf_counter()
+        if args.partitions and DATASETS[name].get("partition_by"):
+            rows = generate_partitioned(name, args.partitions, args.workers, args.seed, tuple(args.formats), **options)
+            print(f"  {name}: {rows:,} rows in {args.partitions} partitions in {time.perf_counter() - start:.2f}s")
+            continue
+        df = generate(name, seed=args.seed, **options)
+        write_dataset(df, name, tuple(args.formats))
+        print(f"  {name}: {len(df):,} rows in {time.perf_counter() - start:.2f}s")
 
     print("✅ All datasets generated successfully in ./datasets/")
 
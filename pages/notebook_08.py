@@ -1,56 +1,43 @@
 # 📄 pages/notebook_08.py
 
 import streamlit as st
-import pandas as pd
-from utils.plot_utils import (
-    scatter_mapbox,
-    apply_theme,
-    save_fig_as_html,
-    save_fig_as_png,
-)
+from figures import build_page, notebook_08 as page
+from utils.data_utils import load_dataset
+from utils.streamlit_utils import page_figure_cache, save_all_plots
+from utils.plot_utils import theme_template
 
-# 🎨 Apply theme
-apply_theme("plotly_white")
+# 🎨 Theme: a template object set on each figure (no global plotly state)
+theme = theme_template("plotly_white")
 
 # 🧭 Page Config
 st.set_page_config(page_title="Notebook 08 – Mapbox & Projection Styling", layout="wide")
 st.title("🗺️ Notebook 08: Mapbox & Geo Projections")
 
-# 📂 Load Dataset
-df = pd.read_csv("datasets/map_data.csv")
-
 # ✅ Column Check
-required_cols = ["City", "Latitude", "Longitude", "Score"]
-if not all(col in df.columns for col in required_cols):
-    st.error(f"Dataset must contain columns: {', '.join(required_cols)}")
+df = load_dataset("map_data")
+if not all(col in df.columns for col in page.REQUIRED_COLUMNS):
+    st.error(f"Dataset must contain columns: {', '.join(page.REQUIRED_COLUMNS)}")
     st.stop()
 
 # 🎛️ Sidebar Styling Options
 st.sidebar.header("Map Style Options")
-map_style = st.sidebar.selectbox("Select Mapbox Style", ["open-street-map", "carto-positron", "carto-darkmatter"])
+map_style = st.sidebar.selectbox("Select Mapbox Style", page.MAP_STYLES)
 zoom_level = st.sidebar.slider("Zoom Level", min_value=1, max_value=10, value=2)
+aggregate = st.sidebar.selectbox("Aggregate Markers", page.AGGREGATIONS,
+                                 format_func=lambda method: "Off (one marker per row)" if method is None else method)
 
-# 🌍 Mapbox Plot
-fig = scatter_mapbox(
-    df,
-    lat="Latitude",
-    lon="Longitude",
-    color="Score",
-    size="Score",
-    hover_name="City",
-    zoom=zoom_level,
-    title=f"City Scores – {map_style.replace('-', ' ').title()}",
-    mapbox_style=map_style,
-)
+# 🌍 Mapbox Plot (figures/notebook_08.py); rebuilt only when its inputs change
+figs = build_page(page, theme=theme, cache=page_figure_cache(page), map_style=map_style, zoom=zoom_level,
+                  aggregate=aggregate)
 
 # 📊 Display
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(figs[f"city_scores_{map_style}"], use_container_width=True)
 
 # 💾 Save Option
 if st.sidebar.checkbox("💾 Save Plot"):
-    save_fig_as_html(fig, f"city_scores_{map_style}.html", notebook_name="notebook_08")
-    save_fig_as_png(fig, f"city_scores_{map_style}.png", notebook_name="notebook_08")
-    st.success("✅ Plot saved in `exports/` folders")
+    results = save_all_plots(figs, notebook_name=page.NOTEBOOK)
+    if all(result.ok for result in results):
+        st.success("✅ Plot saved in `exports/` folders")
 
 # ✅ Footer
 st.success("✅ Notebook 08 Visualizations Rendered")
@@ -0,0 +1,145 @@
+# utils/binning_utils.py
+
+try:
+    from .cache_utils import LRUCache, frame_cached
+    from .lazy_utils import lazy_import
+except ImportError:  # notebooks import plot_utils as a top-level module
+    from cache_utils import LRUCache, frame_cached
+    from lazy_utils import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# ============================
+# 🧮 SERVER-SIDE BINNING
+# ============================
+# Histograms and 2D densities are counted here with NumPy, so a figure carries
+# one value per bin instead of one per row. Results are cached per frame object
+# (see cache_utils.frame_cached), column names and bin counts.
+
+# Upper bound for the automatic bin count (numpy's "auto" rule can go very high)
+MAX_AUTO_BINS = 200
+
+_BIN_CACHE = LRUCache(max_bytes=64 * 1024 ** 2)
+
+
+def binning_cache_stats():
+    """
+    Hit/miss/eviction counters and byte usage of the bin cache.
+    """
+    return _BIN_CACHE.stats()
+
+
+def clear_binning_cache():
+    """
+    Drops every cached binning result.
+    """
+    _BIN_CACHE.clear()
+
+
+def _numeric(values):
+    # Datetimes are binned on int64 nanoseconds; returns (floats, is_datetime)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        ns = pd.DatetimeIndex(values).asi8.astype(np.float64)
+        ns[pd.isna(values)] = np.nan
+        return ns, True
+    return pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64), False
+
+
+def _edges(values, nbins):
+    finite = values[np.isfinite(values)]
+    if len(finite) == 0:
+        return np.array([0.0, 1.0])
+    if nbins is None:
+        edges = np.histogram_bin_edges(finite, bins="auto")
+        if len(edges) - 1 <= MAX_AUTO_BINS:
+            return edges
+        nbins = MAX_AUTO_BINS
+    return np.histogram_bin_edges(finite, bins=nbins)
+
+
+def _bin_index(values, edges):
+    # Bin of every value (-1 outside the edges / missing); the last bin is closed
+    idx = np.searchsorted(edges, values, side="right") - 1
+    idx[values == edges[-1]] = len(edges) - 2
+    idx[~np.isfinite(values) | (idx >= len(edges) - 1)] = -1
+    return idx
+
+
+def _as_display(edges, is_datetime):
+    return pd.to_datetime(edges.astype(np.int64)) if is_datetime else edges
+
+
+def histogram_bins(df, x, color=None, nbins=None):
+    """
+    Counts df[x] into shared bins, per color group.
+
+    Parameters:
+    - df (DataFrame): Rows to count (already filtered).
+    - x (str): Numeric or datetime column.
+    - color (str | None): Column whose groups are counted separately.
+    - nbins (int | None): Number of bins (default: numpy "auto", at most MAX_AUTO_BINS).
+
+    Returns {"edges": bin edges, "groups": [group labels], "counts": groups × bins array}.
+    Non-numeric columns are counted per distinct value instead ("edges" is None,
+    "labels" lists the values).
+    """
+    return frame_cached(_BIN_CACHE, df, ("hist", x, color, nbins), lambda: _histogram(df, x, color, nbins))
+
+
+def _histogram(df, x, color, nbins):
+    if color is None:
+        codes, groups = np.zeros(len(df), dtype=np.int64), [None]
+    else:
+        codes, uniques = pd.factorize(df[color], sort=False)
+        groups = list(uniques)
+
+    if not (pd.api.types.is_numeric_dtype(df[x]) or pd.api.types.is_datetime64_any_dtype(df[x])):
+        idx, labels = pd.factorize(df[x], sort=False)
+        n = len(labels)
+        valid = (idx >= 0) & (codes >= 0)
+        counts = np.bincount(codes[valid] * n + idx[valid], minlength=len(groups) * n)
+        return {"edges": None, "labels": list(labels), "groups": groups,
+                "counts": counts.reshape(len(groups), n)}
+
+    values, is_datetime = _numeric(df[x])
+    edges = _edges(values, nbins)
+    n = len(edges) - 1
+    idx = _bin_index(values, edges)
+    valid = (idx >= 0) & (codes >= 0)
+    counts = np.bincount(codes[valid] * n + idx[valid], minlength=len(groups) * n)
+    return {"edges": _as_display(edges, is_datetime), "groups": groups,
+            "counts": counts.reshape(len(groups), n)}
+
+
+def histogram2d_bins(df, x, y, nbinsx=None, nbinsy=None):
+    """
+    Counts (df[x], df[y]) pairs into a 2D grid.
+
+    Returns {"x_edges", "y_edges", "counts"} with counts shaped (y bins, x bins),
+    i.e. ready to be a heatmap's z.
+    """
+    key = ("hist2d", x, y, nbinsx, nbinsy)
+    return frame_cached(_BIN_CACHE, df, key, lambda: _histogram2d(df, x, y, nbinsx, nbinsy))
+
+
+def _histogram2d(df, x, y, nbinsx, nbinsy):
+    xv, x_dt = _numeric(df[x])
+    yv, y_dt = _numeric(df[y])
+    keep = np.isfinite(xv) & np.isfinite(yv)
+    x_edges = _edges(xv[keep], nbinsx)
+    y_edges = _edges(yv[keep], nbinsy)
+    counts, _, _ = np.histogram2d(xv[keep], yv[keep], bins=[x_edges, y_edges])
+    return {
+        "x_edges": _as_display(x_edges, x_dt),
+        "y_edges": _as_display(y_edges, y_dt),
+        "counts": counts.T.astype(np.int64),
+    }
+
+
+def bin_centers(edges):
+    """
+    Midpoints of consecutive bin edges (works for numeric and datetime edges).
+    """
+    edges = pd.Series(edges)
+    return (edges.iloc[:-1].to_numpy() + (edges.diff().iloc[1:] / 2).to_numpy())
@@ -0,0 +1,241 @@
+# utils/cache_utils.py
+
+import functools
+import hashlib
+import inspect
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+
+try:
+    from .lazy_utils import lazy_import
+except ImportError:  # notebooks import plot_utils as a top-level module
+    from lazy_utils import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# ============================
+# 🧮 SIZE ACCOUNTING
+# ============================
+
+
+def estimate_nbytes(obj):
+    """
+    Rough in-memory size of a nested dict/list/array structure (e.g. a figure dict).
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, dict):
+        return sum(estimate_nbytes(k) + estimate_nbytes(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return 8 * len(obj) + sum(estimate_nbytes(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
+# ============================
+# 🗃️ BOUNDED LRU CACHE
+# ============================
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache bounded by total (estimated) byte size.
+
+    Parameters:
+    - max_bytes (int): Budget; least recently used entries are evicted beyond it.
+    - sizeof (callable): Returns the byte size of a value (default: estimate_nbytes).
+    """
+
+    def __init__(self, max_bytes=256 * 1024 ** 2, sizeof=estimate_nbytes):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            # Values larger than the whole budget are never stored
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# ============================
+# 🔑 FINGERPRINTS
+# ============================
+
+
+def frame_fingerprint(df):
+    """
+    Cheap content fingerprint of a DataFrame/Series: vectorized row hashes plus
+    column names and dtypes, folded into one digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(df, pd.DataFrame):
+        digest.update(repr(list(zip(df.columns, map(str, df.dtypes)))).encode())
+    else:
+        digest.update(repr((df.name, str(df.dtype))).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def _key_part(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return ("frame", frame_fingerprint(value))
+    if isinstance(value, np.ndarray):
+        return ("array", value.dtype.str, value.shape, hashlib.blake2b(value.tobytes(), digest_size=16).hexdigest())
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((k, _key_part(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_key_part(v) for v in value))
+    return repr(value)
+
+
+def call_key(func, args, kwargs):
+    """
+    Cache key for a call: function name plus normalized arguments, with frames
+    and arrays replaced by content fingerprints.
+    """
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return (func.__module__, func.__qualname__, tuple((k, _key_part(v)) for k, v in bound.arguments.items()))
+
+
+# ============================
+# 🪪 PER-FRAME RESULTS
+# ============================
+# Results derived from a DataFrame (bin counts, map cells) are keyed on the
+# frame object, not on its content: hashing every row (frame_fingerprint) costs
+# more than the NumPy pass it would save. Frames such as load_dataset's cached
+# ones are shared read-only, so a frame must not be modified in place after it
+# was used; a filtered copy is a new object and gets its own entries.
+
+
+def frame_cached(cache, df, key, compute):
+    """
+    compute() cached in an LRUCache under (frame identity, *key).
+
+    The entry holds a weak reference to df, so a recycled id() of a collected
+    frame never returns another frame's result.
+    """
+    key = (id(df), *key)
+    entry = cache.get(key)
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+    result = compute()
+    cache.put(key, (weakref.ref(df), result))
+    return result
+
+
+# ============================
+# 🧠 FIGURE MEMOIZATION (OPT-IN)
+# ============================
+
+_FIGURE_CACHE = None
+
+
+def enable_figure_cache(max_bytes=256 * 1024 ** 2):
+    """
+    Turns on memoization for the plot_utils figure helpers.
+    """
+    global _FIGURE_CACHE
+    _FIGURE_CACHE = LRUCache(max_bytes=max_bytes)
+    return _FIGURE_CACHE
+
+
+def disable_figure_cache():
+    """
+    Turns memoization off and frees the cached figures.
+    """
+    global _FIGURE_CACHE
+    _FIGURE_CACHE = None
+
+
+def clear_figure_cache():
+    """
+    Empties the figure cache (if enabled), e.g. after a global rendering setting changed.
+    """
+    if _FIGURE_CACHE is not None:
+        _FIGURE_CACHE.clear()
+
+
+def figure_cache_stats():
+    """
+    Hit/miss/eviction counters and byte usage of the figure cache (None when disabled).
+    """
+    return _FIGURE_CACHE.stats() if _FIGURE_CACHE is not None else None
+
+
+def memoize_figure(func):
+    """
+    Decorator for helpers that build a Plotly figure from a DataFrame.
+
+    While the figure cache is enabled, identical calls (same frame content and
+    arguments) reuse the cached figure spec. Every call returns a fresh Figure,
+    so callers can mutate it without touching the cached copy.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _FIGURE_CACHE
+        if cache is None:
+            return func(*args, **kwargs)
+
+        import plotly.graph_objects as go
+
+        key = call_key(func, args, kwargs)
+        spec = cache.get(key)
+        if spec is not None:
+            return go.Figure(spec)
+
+        fig = func(*args, **kwargs)
+        cache.put(key, fig.to_dict())
+        return fig
+
+    return wrapper
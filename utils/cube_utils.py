@@ -0,0 +1,230 @@
+# utils/cube_utils.py
+
+import hashlib
+import io
+import json
+import threading
+
+import pandas as pd
+
+from utils.data_utils import (
+    COLUMNAR_SUFFIX,
+    DATA_DIR,
+    coerce_dataset,
+    columnar_path,
+    dataset_path,
+    load_dataset,
+    parse_csv,
+    path_stat,
+    source_path,
+    write_dataset,
+)
+
+# ============================
+# 🧊 SUPERSTORE AGGREGATE CUBE
+# ============================
+# One row per (OrderDate, Region, Category, SubCategory) with additive measures,
+# so every roll-up the pages need is a cheap group-by over the cube instead of
+# the raw orders.
+
+CUBE_DATASET = "superstore"
+CUBE_DIMS = ["OrderDate", "Region", "Category", "SubCategory"]
+CUBE_SUMS = ["Sales", "Profit"]
+CUBE_MEASURES = CUBE_SUMS + ["Orders"]
+
+CUBE_STEM = DATA_DIR / f"{CUBE_DATASET}_cube"
+CUBE_META_PATH = CUBE_STEM.with_suffix(".json")
+
+# Bytes hashed just before the previously processed end of the source file,
+# used to tell an append apart from a rewrite
+_TAIL_BYTES = 64 * 1024
+
+_STATE = {"meta": None, "frame": None}
+_LOCK = threading.Lock()
+
+
+def _tail_digest(path, end):
+    start = max(0, end - _TAIL_BYTES)
+    with open(path, "rb") as f:
+        f.seek(start)
+        return hashlib.sha256(f.read(end - start)).hexdigest()
+
+
+def _tracked_path():
+    # The CSV stands for the single-file copies: appends go to it (append_orders
+    # keeps the Feather copy in step), so the cube never mistakes the loaded
+    # copy switching between them for a rewrite
+    path = source_path(CUBE_DATASET)
+    csv_path = dataset_path(CUBE_DATASET)
+    return csv_path if path.is_file() and csv_path.exists() else path
+
+
+def _source_meta(path, rows):
+    mtime_ns, size = path_stat(path)
+    return {
+        "source": path.name,
+        "size": size,
+        "mtime_ns": mtime_ns,
+        "rows": rows,
+        # Partition folders are never appended to in place, only rewritten
+        "tail_digest": _tail_digest(path, size) if path.is_file() else None,
+    }
+
+
+def aggregate_orders(df):
+    """
+    Aggregates raw superstore rows to cube granularity (sum of Sales/Profit, order count).
+    """
+    grouped = df.groupby(CUBE_DIMS, observed=True)
+    cube = grouped[CUBE_SUMS].sum()
+    cube["Orders"] = grouped.size()
+    return cube.reset_index()
+
+
+def _merge(cube, delta):
+    merged = pd.concat([cube, delta], ignore_index=True)
+    for col in CUBE_DIMS[1:]:
+        merged[col] = merged[col].astype("category")
+    return merged.groupby(CUBE_DIMS, observed=True)[CUBE_MEASURES].sum().reset_index()
+
+
+def _cube_file():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return CUBE_STEM.with_suffix(".csv")
+    return CUBE_STEM.with_suffix(COLUMNAR_SUFFIX)
+
+
+def _save(cube, meta):
+    path = _cube_file()
+    if path.suffix == COLUMNAR_SUFFIX:
+        cube.to_feather(path)
+    else:
+        cube.to_csv(path, index=False, date_format="%Y-%m-%d")
+    meta = dict(meta, cube_file=path.name)
+    CUBE_META_PATH.write_text(json.dumps(meta, indent=2))
+    return meta
+
+
+def _load_saved():
+    if not CUBE_META_PATH.exists():
+        return None, None
+    meta = json.loads(CUBE_META_PATH.read_text())
+    path = DATA_DIR / meta.get("cube_file", "")
+    if not path.is_file():
+        return None, None
+    if path.suffix == COLUMNAR_SUFFIX:
+        cube = pd.read_feather(path)
+    else:
+        cube = pd.read_csv(path, parse_dates=["OrderDate"])
+        cube = cube.astype({col: "category" for col in CUBE_DIMS[1:]})
+    return meta, cube
+
+
+def _read_appended(path, start):
+    # Re-use the CSV header so the appended bytes parse with the registry schema
+    with open(path, "rb") as f:
+        header = f.readline()
+        f.seek(start)
+        tail = f.read()
+    return parse_csv(CUBE_DATASET, io.BytesIO(header + tail), columns=CUBE_DIMS + CUBE_SUMS)
+
+
+def build_cube():
+    """
+    Rebuilds the cube from the full superstore dataset and persists it next to it.
+    """
+    path = _tracked_path()
+    df = load_dataset(CUBE_DATASET, columns=CUBE_DIMS + CUBE_SUMS)
+    cube = aggregate_orders(df)
+    meta = _save(cube, _source_meta(path, len(df)))
+    _STATE.update(meta=meta, frame=cube)
+    return cube
+
+
+def refresh_cube():
+    """
+    Brings the cube up to date with the superstore source file.
+
+    - Unchanged source → the cached cube is returned as is.
+    - Rows appended to the CSV → only the new rows are aggregated and merged in.
+    - Anything else (rewrite, format switch, missing cube) → full rebuild.
+    """
+    with _LOCK:
+        if _STATE["meta"] is None:
+            meta, cube = _load_saved()
+            _STATE.update(meta=meta, frame=cube)
+
+        meta, cube = _STATE["meta"], _STATE["frame"]
+        path = _tracked_path()
+        mtime_ns, size = path_stat(path)
+
+        if meta is None or meta["source"] != path.name:
+            return build_cube()
+
+        if size == meta["size"] and mtime_ns == meta["mtime_ns"]:
+            return cube
+
+        appended = (
+            path.suffix == ".csv"
+            and size > meta["size"]
+            and _tail_digest(path, meta["size"]) == meta["tail_digest"]
+        )
+        if not appended:
+            return build_cube()
+
+        new_rows = _read_appended(path, meta["size"])
+        cube = _merge(cube, aggregate_orders(new_rows))
+        meta = _save(cube, _source_meta(path, meta["rows"] + len(new_rows)))
+        _STATE.update(meta=meta, frame=cube)
+        return cube
+
+
+def append_orders(new_orders):
+    """
+    Appends new superstore orders to the CSV (and the Feather copy, if any) and
+    folds them into the cube without re-aggregating existing rows.
+    """
+    rows = coerce_dataset(new_orders, CUBE_DATASET)
+    rows.to_csv(dataset_path(CUBE_DATASET), mode="a", header=False, index=False, date_format="%Y-%m-%d")
+
+    arrow_path = columnar_path(CUBE_DATASET)
+    if arrow_path.exists():
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            pass  # load_dataset reads the (now newer) CSV without pyarrow anyway
+        else:
+            # Rewritten from the memory-mapped copy, so load_dataset keeps reading Feather
+            write_dataset(pd.concat([pd.read_feather(arrow_path), rows], ignore_index=True),
+                          CUBE_DATASET, formats=("feather",))
+    return refresh_cube()
+
+
+def query_cube(by=None, measures=None, filters=None):
+    """
+    Answers a roll-up from the cube without touching raw rows.
+
+    Parameters:
+    - by (str | list[str] | None): Cube dimensions to group by (None → grand total).
+    - measures (str | list[str] | None): Any of "Sales", "Profit", "Orders" (default: all).
+    - filters (dict | None): {dimension: value or list of values} applied before rolling up.
+
+    Example: query_cube(["OrderDate", "Region"], "Sales")
+    """
+    cube = refresh_cube()
+    by = [by] if isinstance(by, str) else list(by or [])
+    measures = [measures] if isinstance(measures, str) else list(measures or CUBE_MEASURES)
+
+    unknown = [c for c in by if c not in CUBE_DIMS] + [m for m in measures if m not in CUBE_MEASURES]
+    if unknown:
+        raise ValueError(f"Not in the cube: {', '.join(unknown)}")
+
+    for col, value in (filters or {}).items():
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        cube = cube[cube[col].isin(values)]
+
+    if not by:
+        return cube[measures].agg(["sum"]).reset_index(drop=True)
+    return cube.groupby(by, observed=True)[measures].sum().reset_index()
@@ -0,0 +1,455 @@
+# utils/data_utils.py
+
+import hashlib
+import shutil
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+# 📂 Datasets live next to utils/, independent of the current working directory
+DATA_DIR = Path(__file__).resolve().parent.parent / "datasets"
+
+# 🧱 Columnar copies (Arrow IPC / Feather v2) sit next to the CSVs with this suffix
+COLUMNAR_SUFFIX = ".feather"
+
+# 🗂️ Partitioned copies: datasets/<name>/date=YYYY-MM/part-00000.feather (hive-style)
+PARTITION_KEY = "date"
+
+# ============================
+# 📚 DATASET REGISTRY
+# ============================
+# file     → file name inside DATA_DIR
+# dtypes   → column dtypes applied while parsing (low-cardinality text → category)
+# dates    → columns parsed as datetime64
+# sort_by  → columns the returned frame is pre-sorted by (stable sort)
+# partition_by → optional date column whose month names the partition folders
+
+DATASETS = {
+    "superstore": {
+        "file": "superstore.csv",
+        "dtypes": {
+            "Category": "category",
+            "SubCategory": "category",
+            "Region": "category",
+            "Sales": "float64",
+            "Profit": "float64",
+        },
+        "dates": ["OrderDate"],
+        "sort_by": ["OrderDate"],
+        "partition_by": "OrderDate",
+    },
+    "covid_data": {
+        "file": "covid_data.csv",
+        "dtypes": {"Country": "category", "Cases": "int64", "Deaths": "int64"},
+        "dates": ["Date"],
+        "sort_by": ["Country", "Date"],
+    },
+    "stock_data": {
+        "file": "stock_data.csv",
+        "dtypes": {
+            "Company": "category",
+            "Open": "float64",
+            "Close": "float64",
+            "High": "float64",
+            "Low": "float64",
+            "Volume": "int64",
+        },
+        "dates": ["Date"],
+        "sort_by": ["Company", "Date"],
+    },
+    "world_population": {
+        "file": "world_population.csv",
+        "dtypes": {
+            "Population": "int64",
+            "GDP_per_capita": "float64",
+            "Life_Expectancy": "float64",
+            "Continent": "category",
+        },
+        "dates": [],
+        "sort_by": [],
+    },
+    "customer_segments": {
+        "file": "customer_segments.csv",
+        "dtypes": {
+            "Gender": "category",
+            "Age": "int64",
+            "Income": "int64",
+            "Segment": "category",
+        },
+        "dates": [],
+        "sort_by": [],
+    },
+    "product_launch": {
+        "file": "product_launch.csv",
+        "dtypes": {
+            "Product": "category",
+            "Stage": "category",
+            "Week": "int64",
+            "Sales": "float64",
+            "MarketingSpend": "float64",
+        },
+        "dates": [],
+        "sort_by": [],
+    },
+    "map_data": {
+        "file": "map_data.csv",
+        "dtypes": {"Latitude": "float64", "Longitude": "float64", "Score": "float64"},
+        "dates": [],
+        "sort_by": [],
+    },
+    "animated_sales": {
+        "file": "animated_sales.csv",
+        "dtypes": {"Category": "category", "Sales": "float64"},
+        "dates": [],
+        "sort_by": ["Month"],
+    },
+}
+
+# ============================
+# 🧠 PROCESS-WIDE CACHE
+# ============================
+# One entry per (dataset, column selection), shared by every Streamlit session
+# in this process: key → {"stat": (path, mtime_ns, size), "digest": sha256 hex,
+# "frame": DataFrame}
+
+_CACHE = {}
+_LOCKS = {}
+
+
+def dataset_path(name):
+    """
+    Returns the on-disk path of a registered dataset.
+    """
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset '{name}'. Available: {', '.join(sorted(DATASETS))}")
+    return DATA_DIR / DATASETS[name]["file"]
+
+
+def _file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def columnar_path(name):
+    """
+    Returns the path of the Feather copy of a registered dataset (it may not exist).
+    """
+    return dataset_path(name).with_suffix(COLUMNAR_SUFFIX)
+
+
+def _has_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def partition_dir(name):
+    """
+    Returns the folder holding a dataset's partitions (it may not exist).
+    """
+    return dataset_path(name).with_suffix("")
+
+
+def _month_bounds(date_range):
+    # (start, end) dates → ("YYYY-MM" | None, "YYYY-MM" | None)
+    if date_range is None:
+        return None, None
+    return tuple(None if d is None else pd.Timestamp(d).strftime("%Y-%m") for d in date_range)
+
+
+def partition_files(name, date_range=None):
+    """
+    Part files of a partitioned dataset, oldest month first.
+
+    Parameters:
+    - name (str): Registry key.
+    - date_range (tuple | None): (start, end) dates, either may be None; only
+      the months overlapping it are listed.
+
+    Feather parts are listed when pyarrow is installed, CSV parts otherwise.
+    """
+    root = partition_dir(name)
+    if not root.is_dir():
+        return []
+    first, last = _month_bounds(date_range)
+    suffix = ".csv"
+    if _has_pyarrow() and next(root.glob(f"{PARTITION_KEY}=*/part-*{COLUMNAR_SUFFIX}"), None):
+        suffix = COLUMNAR_SUFFIX
+    files = []
+    for folder in sorted(root.glob(f"{PARTITION_KEY}=*")):
+        month = folder.name.split("=", 1)[1]
+        if (first and month < first) or (last and month > last):
+            continue
+        files.extend(sorted(folder.glob(f"part-*{suffix}")))
+    return files
+
+
+def path_stat(path):
+    """
+    (mtime_ns, size) of a dataset source; for a partition folder, the newest
+    mtime and the total size of its part files.
+    """
+    if path.is_dir():
+        stats = [p.stat() for p in path.glob(f"{PARTITION_KEY}=*/part-*")]
+        return max((s.st_mtime_ns for s in stats), default=0), sum(s.st_size for s in stats)
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def source_path(name):
+    """
+    Returns what load_dataset reads for a dataset: the partition folder if it
+    is newer than the single-file copies, else the Feather copy unless pyarrow
+    is missing or the CSV is newer, otherwise the CSV.
+    """
+    csv_path = dataset_path(name)
+    arrow_path = columnar_path(name)
+    flat = csv_path
+    if arrow_path.exists() and _has_pyarrow():
+        if not csv_path.exists() or arrow_path.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns:
+            flat = arrow_path
+
+    if partition_files(name):
+        root = partition_dir(name)
+        if not flat.exists() or path_stat(root)[0] >= flat.stat().st_mtime_ns:
+            return root
+    return flat
+
+
+def dataset_version(names=None):
+    """
+    Signature of what load_dataset would read for the given datasets (default:
+    all): ((name, (mtime_ns, size) or None if missing), ...). Caches of anything
+    derived from the data compare it to notice regenerated files.
+    """
+    version = []
+    for name in names or DATASETS:
+        path = source_path(name)
+        version.append((name, path_stat(path) if path.exists() else None))
+    return tuple(version)
+
+
+def _sort(name, df):
+    sort_by = [c for c in DATASETS[name]["sort_by"] if c in df.columns]
+    if sort_by:
+        df.sort_values(sort_by, kind="stable", inplace=True, ignore_index=True)
+    return df
+
+
+def parse_csv(name, source, columns=None):
+    """
+    Parses CSV text (a path or file-like object) with the registry dtypes, date
+    columns and sort order of a dataset.
+    """
+    spec = DATASETS[name]
+    dates = [c for c in spec["dates"] if columns is None or c in columns]
+    df = pd.read_csv(
+        source,
+        usecols=columns,
+        dtype=spec["dtypes"],
+        parse_dates=dates or False,
+        date_format="%Y-%m-%d",
+    )
+    return _sort(name, df)
+
+
+def _read_columnar(path, columns=None):
+    # Memory-mapped read: only the selected columns are paged in, and numeric
+    # columns without nulls are handed to pandas without copying.
+    import pyarrow.feather as feather
+
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    return table.to_pandas(date_as_object=False, split_blocks=True)
+
+
+def _read_partitions(name, files, columns=None):
+    # Parts are concatenated, then put in registry order across partitions
+    if files[0].suffix == COLUMNAR_SUFFIX:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+
+        tables = [feather.read_table(f, columns=columns, memory_map=True) for f in files]
+        table = pa.concat_tables(tables).unify_dictionaries()
+        df = table.to_pandas(date_as_object=False, split_blocks=True)
+    else:
+        df = pd.concat([parse_csv(name, f, columns) for f in files], ignore_index=True)
+        for col, dtype in DATASETS[name]["dtypes"].items():
+            if dtype == "category" and col in df.columns:
+                df[col] = df[col].astype("category")
+    return _sort(name, df)
+
+
+def _date_column(name):
+    spec = DATASETS[name]
+    column = spec.get("partition_by") or (spec["dates"][0] if spec["dates"] else None)
+    if column is None:
+        raise ValueError(f"Dataset '{name}' has no date column to filter on")
+    return column
+
+
+def _in_range(df, column, date_range):
+    start, end = date_range
+    keep = pd.Series(True, index=df.index)
+    if start is not None:
+        keep &= df[column] >= pd.Timestamp(start)
+    if end is not None:
+        keep &= df[column] <= pd.Timestamp(end)
+    return df[keep].reset_index(drop=True)
+
+
+def load_dataset(name, columns=None, date_range=None):
+    """
+    Load a dataset from datasets/ as a typed, pre-sorted DataFrame.
+
+    Reads the partition folder when it is the newest copy (see write_partition),
+    else the memory-mapped Feather copy when one exists (see write_dataset),
+    otherwise parses the CSV. Each (dataset, columns, date_range) combination is
+    loaded once per process and shared across sessions. The cached frame is
+    reused while the files' mtime and size are unchanged; if they change, the
+    content hash decides whether the files are actually re-read.
+
+    Parameters:
+    - name (str): Registry key, e.g. "superstore" or "covid_data".
+    - columns (list[str] | None): Only load these columns (default: all).
+    - date_range (tuple | None): (start, end) dates, inclusive, either may be
+      None. Filters on the partition (or first date) column; partitioned
+      datasets only read the months that overlap it.
+
+    Returns a shallow copy: adding or replacing columns is safe, in-place edits
+    of existing columns are not.
+    """
+    dataset_path(name)
+    columns = list(columns) if columns is not None else None
+    if date_range is not None:
+        date_range = tuple(None if d is None else pd.Timestamp(d) for d in date_range)
+    key = (name, tuple(columns) if columns is not None else None, date_range)
+    lock = _LOCKS.setdefault(key, threading.Lock())
+
+    with lock:
+        path = source_path(name)
+        if path.is_dir():
+            # An empty selection still reads one part so the frame keeps its schema
+            files = partition_files(name, date_range) or partition_files(name)[:1]
+        else:
+            files = [path]
+        signature = tuple((f, *path_stat(f)) for f in files)
+        entry = _CACHE.get(key)
+
+        if entry is None or entry["stat"] != signature:
+            digest = "".join(_file_digest(f) for f in files)
+            if entry is None or entry["digest"] != digest:
+                entry = {"frame": _read(name, path, files, columns, date_range), "digest": digest}
+            entry["stat"] = signature
+            _CACHE[key] = entry
+
+        return entry["frame"].copy(deep=False)
+
+
+def _read(name, path, files, columns, date_range):
+    read_columns = columns
+    if date_range is not None:
+        date_column = _date_column(name)
+        if columns is not None and date_column not in columns:
+            read_columns = columns + [date_column]
+
+    if path.is_dir():
+        frame = _read_partitions(name, files, read_columns)
+    elif path.suffix == COLUMNAR_SUFFIX:
+        frame = _read_columnar(path, read_columns)
+    else:
+        frame = parse_csv(name, path, read_columns)
+
+    if date_range is not None:
+        frame = _in_range(frame, date_column, date_range)
+        if read_columns is not columns:
+            frame = frame[columns]
+    return frame
+
+
+def coerce_dataset(df, name):
+    """
+    Applies the registry schema to a freshly generated frame: declared dtypes,
+    datetime columns and the registry sort order.
+    """
+    spec = DATASETS[name]
+    df = df.astype({c: t for c, t in spec["dtypes"].items() if c in df.columns})
+    for col in spec["dates"]:
+        df[col] = pd.to_datetime(df[col])
+    if spec["sort_by"]:
+        df = df.sort_values(spec["sort_by"], kind="stable", ignore_index=True)
+    return df
+
+
+def _write_files(df, name, csv_path, arrow_path, formats):
+    if "csv" in formats:
+        df.to_csv(csv_path, index=False, date_format="%Y-%m-%d")
+
+    if "feather" in formats:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        for col in DATASETS[name]["dates"]:
+            idx = table.schema.get_field_index(col)
+            table = table.set_column(idx, col, table.column(col).cast(pa.date32()))
+        feather.write_feather(table, arrow_path, compression="uncompressed")
+
+
+def write_dataset(df, name, formats=("csv", "feather")):
+    """
+    Writes a dataset to datasets/ in one or more formats.
+
+    - "csv": plain text, as before.
+    - "feather": uncompressed Arrow IPC so reads can be memory-mapped. Category
+      columns are stored dictionary-encoded and date columns as date32.
+      Requires `pyarrow` installed.
+    """
+    df = coerce_dataset(df, name)
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    _write_files(df, name, dataset_path(name), columnar_path(name), formats)
+    clear_dataset_cache(name)
+
+
+def write_partition(df, name, index, formats=("feather",)):
+    """
+    Writes one generated chunk of a partitioned dataset, split by month:
+    datasets/<name>/date=YYYY-MM/part-<index>.<format>.
+
+    Every chunk (e.g. one per worker task) gets its own index, so chunks can be
+    written concurrently. Only datasets with a "partition_by" column qualify.
+    """
+    column = DATASETS[name].get("partition_by")
+    if column is None:
+        raise ValueError(f"Dataset '{name}' has no partition column")
+
+    df = coerce_dataset(df, name)
+    root = partition_dir(name)
+    for month, part in df.groupby(df[column].dt.to_period("M"), sort=True):
+        folder = root / f"{PARTITION_KEY}={month}"
+        folder.mkdir(parents=True, exist_ok=True)
+        stem = folder / f"part-{index:05d}"
+        _write_files(part, name, stem.with_suffix(".csv"), stem.with_suffix(COLUMNAR_SUFFIX), formats)
+    clear_dataset_cache(name)
+
+
+def clear_partitions(name):
+    """
+    Deletes a dataset's partition folder (before writing a new set of partitions).
+    """
+    shutil.rmtree(partition_dir(name), ignore_errors=True)
+    clear_dataset_cache(name)
+
+
+def clear_dataset_cache(name=None):
+    """
+    Drops one cached dataset (or all of them) so the next load re-parses from disk.
+    """
+    for key in list(_CACHE):
+        if name is None or key[0] == name:
+            _CACHE.pop(key, None)
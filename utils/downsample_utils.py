@@ -0,0 +1,296 @@
+# utils/downsample_utils.py
+
+from dataclasses import dataclass
+
+try:
+    from .lazy_utils import lazy_import
+except ImportError:  # notebooks import plot_utils as a top-level module
+    from lazy_utils import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# ============================
+# 📉 DOWNSAMPLING
+# ============================
+# Large series are reduced to a point budget before they are handed to Plotly,
+# so the browser receives roughly as many points as the chart has pixels.
+#
+# - "lttb": Largest-Triangle-Three-Buckets; keeps the visual shape of a line.
+#   The global min and max of y are kept as well (two of the budget's points).
+# - "minmax": the lowest and highest point of every bucket; keeps every peak.
+#
+# Both run in O(n) NumPy passes (plus one sort) with no Python loop over points.
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+# About two points per pixel of a wide (~2000 px) chart
+DEFAULT_MAX_POINTS = 4000
+
+# Fewest points a downsampled group keeps (first, last, min, max and one bucket)
+MIN_GROUP_POINTS = 5
+
+# Trace attributes that hold one value per point and must be subset together
+_POINT_ATTRS = ("x", "y", "text", "hovertext", "customdata", "ids", "marker.size", "marker.color", "marker.symbol")
+
+
+def points_for_width(width_px, points_per_px=2):
+    """
+    Point budget for a chart of the given pixel width.
+    """
+    return max(3, int(width_px * points_per_px))
+
+
+def _as_numeric(values):
+    # Datetimes → int64 ns, numbers as float; anything else (text, categories) → position
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return pd.DatetimeIndex(values).asi8.astype(np.float64)
+    arr = np.asarray(values)
+    if arr.dtype.kind in "biuf":
+        return arr.astype(np.float64)
+    return np.arange(len(arr), dtype=np.float64)
+
+
+def _bucket_ids(n, n_buckets):
+    # Splits the n points between the fixed first and last point into
+    # n_buckets contiguous, nearly equal buckets (every bucket is non-empty)
+    return (np.arange(n) * n_buckets) // n
+
+
+def _extreme_per_bucket(values, bucket, n_buckets):
+    # Positions of the min and max value in each bucket: one lexsort instead of a loop
+    order = np.lexsort((values, bucket))
+    ends = np.cumsum(np.bincount(bucket, minlength=n_buckets))
+    return order[np.r_[0, ends[:-1]]], order[ends - 1]
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: indices of at most n_out points that keep
+    the shape of the (x-sorted) series. Each bucket keeps the point forming the
+    largest triangle with the previous and next bucket averages.
+    """
+    x = _as_numeric(x)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Two slots go to the global min and max of y when the budget allows
+    extremes = n_out >= MIN_GROUP_POINTS
+    n_buckets = n_out - (4 if extremes else 2)
+    xi, yi = x[1:-1], y[1:-1]
+    bucket = _bucket_ids(n - 2, n_buckets)
+    counts = np.bincount(bucket, minlength=n_buckets)
+    mean_x = np.bincount(bucket, weights=xi, minlength=n_buckets) / counts
+    mean_y = np.bincount(bucket, weights=yi, minlength=n_buckets) / counts
+
+    # Anchors: previous bucket's average (first point for bucket 0) and next
+    # bucket's average (last point for the final bucket)
+    ax = np.r_[x[0], mean_x[:-1]][bucket]
+    ay = np.r_[y[0], mean_y[:-1]][bucket]
+    cx = np.r_[mean_x[1:], x[-1]][bucket]
+    cy = np.r_[mean_y[1:], y[-1]][bucket]
+    area = np.abs((ax - cx) * (yi - ay) - (ax - xi) * (cy - ay))
+
+    _, largest = _extreme_per_bucket(area, bucket, n_buckets)
+    keep = np.r_[0, largest + 1, n - 1]
+    if extremes:
+        keep = np.r_[keep, np.argmin(y), np.argmax(y)]
+    return np.unique(keep)
+
+
+def minmax_indices(x, y, n_out):
+    """
+    Min/max per bucket: indices of at most n_out points, keeping the lowest and
+    highest y of every bucket (plus the first and last point).
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+
+    n_buckets = (n_out - 2) // 2
+    bucket = _bucket_ids(n - 2, n_buckets)
+    lows, highs = _extreme_per_bucket(y[1:-1], bucket, n_buckets)
+    return np.unique(np.r_[0, lows + 1, highs + 1, n - 1])
+
+
+def downsample_indices(x, y, n_out, method="lttb"):
+    """
+    Indices of the points to keep. Points with a missing/non-finite y are dropped.
+
+    Parameters:
+    - x, y (array-like): Series sorted by x (numbers, datetimes or categories).
+    - n_out (int): Target number of points.
+    - method (str): "lttb" or "minmax".
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unknown downsampling method '{method}'. Use one of: {', '.join(DOWNSAMPLE_METHODS)}")
+    y = np.asarray(y, dtype=np.float64)
+    finite = np.flatnonzero(np.isfinite(y))
+    if len(finite) < len(y):
+        x = np.asarray(x)[finite]
+        y = y[finite]
+    else:
+        finite = None
+
+    pick = lttb_indices if method == "lttb" else minmax_indices
+    keep = pick(x, y, n_out)
+    return keep if finite is None else finite[keep]
+
+
+# ============================
+# 🧾 PAYLOAD REPORT
+# ============================
+
+
+@dataclass
+class DownsampleReport:
+    method: str
+    rows_in: int
+    rows_out: int
+    bytes_in: int
+    bytes_out: int
+
+    @property
+    def reduction(self):
+        return 1 - self.rows_out / self.rows_in if self.rows_in else 0.0
+
+    def __str__(self):
+        return (
+            f"📉 {self.method}: {self.rows_in:,} → {self.rows_out:,} points "
+            f"(~{self.bytes_in / 1e6:.2f} MB → {self.bytes_out / 1e6:.2f} MB JSON, "
+            f"-{self.reduction:.1%})"
+        )
+
+
+def _json_bytes_per_row(df, sample=1000):
+    # Serialized size of one row, measured on an evenly spaced sample
+    if len(df) == 0:
+        return 0
+    step = max(1, len(df) // sample)
+    part = df.iloc[::step]
+    return len(part.to_json(orient="values", date_format="iso")) / len(part)
+
+
+def _report(method, columns_in, columns_out):
+    per_row = _json_bytes_per_row(columns_out if len(columns_out) else columns_in)
+    return DownsampleReport(
+        method=method,
+        rows_in=len(columns_in),
+        rows_out=len(columns_out),
+        bytes_in=int(per_row * len(columns_in)),
+        bytes_out=int(per_row * len(columns_out)),
+    )
+
+
+# ============================
+# 🧮 FRAMES & TRACES
+# ============================
+
+
+def _sorted_positions(df, x):
+    # Row positions of df ordered by x; LTTB/min-max assume a monotonic x
+    values = df[x]
+    if values.is_monotonic_increasing or not (
+        pd.api.types.is_numeric_dtype(values) or pd.api.types.is_datetime64_any_dtype(values)
+    ):
+        return np.arange(len(df))
+    return np.argsort(values.to_numpy(), kind="stable")
+
+
+def _group_budgets(sizes, max_points):
+    # Splits max_points between groups in proportion to their size. Groups of at
+    # most MIN_GROUP_POINTS rows keep them all; every other group keeps at least
+    # MIN_GROUP_POINTS, taken from the shares of the larger ones. The total stays
+    # within max_points unless those minimums alone exceed it.
+    sizes = np.asarray(sizes, dtype=np.int64)
+    budgets = np.minimum(sizes, MIN_GROUP_POINTS)
+    floored = sizes <= MIN_GROUP_POINTS
+    while True:
+        rest = ~floored
+        available = max_points - budgets[floored].sum()
+        share = np.zeros_like(sizes)
+        if rest.any() and available > 0:
+            share[rest] = available * sizes[rest] // sizes[rest].sum()
+        low = rest & (share < MIN_GROUP_POINTS)
+        if not low.any():
+            return np.where(floored, budgets, np.minimum(share, sizes))
+        floored |= low
+
+
+def downsample_frame(df, x, y, max_points=DEFAULT_MAX_POINTS, method="lttb", group=None):
+    """
+    Reduces a DataFrame to about max_points rows for plotting.
+
+    Parameters:
+    - df (DataFrame): Source rows; every column of a kept row is kept.
+    - x, y (str): Columns the shape is judged on.
+    - max_points (int): Point budget across all groups.
+    - method (str): "lttb" or "minmax".
+    - group (str | None): Column (e.g. the plot's color) downsampled group by
+      group; each group gets a share of the budget proportional to its size,
+      but no fewer than MIN_GROUP_POINTS (or all its rows, if it has fewer).
+      With more groups than max_points / MIN_GROUP_POINTS, those minimums
+      alone exceed the budget and more than max_points rows are returned.
+
+    Returns (downsampled DataFrame in the original row order, DownsampleReport).
+    """
+    if len(df) <= max_points:
+        return df, _report(method, df[[x, y]], df[[x, y]])
+
+    if group is None:
+        parts = [np.arange(len(df))]
+    else:
+        parts = list(df.groupby(group, observed=True, sort=False).indices.values())
+
+    keep = []
+    for rows, budget in zip(parts, _group_budgets([len(rows) for rows in parts], max_points)):
+        sub = df.iloc[rows]
+        order = _sorted_positions(sub, x)
+        picked = downsample_indices(sub[x].to_numpy()[order], sub[y].to_numpy()[order], budget, method)
+        keep.append(rows[order[picked]])
+
+    out = df.iloc[np.sort(np.concatenate(keep))]
+    return out, _report(method, df[[x, y]], out[[x, y]])
+
+
+def downsample_trace(trace, max_points=DEFAULT_MAX_POINTS, method="lttb"):
+    """
+    Downsamples a go.Scatter/go.Scattergl trace in place: x, y and every other
+    per-point attribute (text, customdata, marker size/color, ...) are subset
+    together. Returns a DownsampleReport, or None if the trace was left as is.
+    """
+    if trace.x is None or trace.y is None or len(trace.y) <= max_points:
+        return None
+
+    x = pd.Series(trace.x)
+    y = pd.to_numeric(pd.Series(trace.y), errors="coerce")
+    order = _sorted_positions(pd.DataFrame({"x": x}), "x")
+    keep = np.sort(order[downsample_indices(x.to_numpy()[order], y.to_numpy()[order], max_points, method)])
+
+    n = len(trace.y)
+    for attr in _POINT_ATTRS:
+        values = trace[attr]
+        if values is not None and not isinstance(values, str) and np.ndim(values) >= 1 and len(values) == n:
+            trace[attr] = np.asarray(values)[keep]
+
+    return _report(method, pd.DataFrame({"x": x, "y": y}), pd.DataFrame({"x": x.iloc[keep], "y": y.iloc[keep]}))
+
+
+def downsample_figure(fig, max_points=DEFAULT_MAX_POINTS, method="lttb", verbose=True):
+    """
+    Downsamples every x/y trace of a figure with more than max_points points.
+    Returns {trace name or index: DownsampleReport}.
+    """
+    reports = {}
+    for i, trace in enumerate(fig.data):
+        if "x" not in trace or "y" not in trace:
+            continue
+        report = downsample_trace(trace, max_points, method)
+        if report is not None:
+            reports[trace.name or i] = report
+            if verbose:
+                print(f"{trace.name or f'trace {i}'} – {report}")
+    return reports
@@ -0,0 +1,438 @@
+# utils/export_utils.py
+
+import atexit
+import hashlib
+import html
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+
+# ============================
+# 📁 EXPORT LOCATIONS
+# ============================
+
+EXPORT_KINDS = {".html": "html", ".png": "images"}
+
+# PNG worker processes; each holds a headless browser, so keep this modest
+DEFAULT_EXPORT_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def default_export_root():
+    """
+    Default exports/ folder: one level above the working directory, matching
+    the notebooks (which run from notebooks/).
+    """
+    return Path.cwd().parent / "exports"
+
+
+def export_path(filename, notebook_name="general", export_root=None):
+    """
+    Resolves exports/{html|images}/{notebook_name}/{filename} from the file
+    extension and creates the folder.
+    """
+    suffix = Path(filename).suffix.lower()
+    if suffix not in EXPORT_KINDS:
+        raise ValueError(f"Unsupported export type '{suffix}'. Use .html or .png")
+    export_dir = Path(export_root or default_export_root()) / EXPORT_KINDS[suffix] / notebook_name
+    export_dir.mkdir(parents=True, exist_ok=True)
+    return export_dir / filename
+
+
+# ============================
+# 🧾 EXPORT MANIFEST
+# ============================
+# Every exports/<kind>/<notebook> folder keeps a manifest.json mapping each
+# exported file to the hash of the figure spec it was rendered from. A figure
+# whose hash matches its manifest entry (and whose file still exists) is not
+# rendered again.
+
+MANIFEST_NAME = "manifest.json"
+
+
+def _png_opts():
+    import plotly.io as pio
+
+    defaults = getattr(pio, "defaults", None)
+    return {
+        "format": "png",
+        "width": getattr(defaults, "default_width", 700),
+        "height": getattr(defaults, "default_height", 500),
+        "scale": getattr(defaults, "default_scale", 1),
+    }
+
+
+def figure_digest(fig, path, plotlyjs="inline"):
+    """
+    SHA-256 of the figure's serialized spec plus the output type (and PNG render
+    size or HTML plotly.js mode), i.e. everything that determines the exported bytes.
+    """
+    digest = hashlib.sha256(fig.to_json().encode("utf-8"))
+    suffix = Path(path).suffix.lower()
+    digest.update(suffix.encode())
+    if suffix == ".png":
+        digest.update(json.dumps(_png_opts(), sort_keys=True).encode())
+    elif plotlyjs != "inline":
+        digest.update(plotlyjs.encode())
+    return digest.hexdigest()
+
+
+def load_manifest(export_dir):
+    """
+    Reads {filename: {"digest": ..., "bytes": ...}} for an export folder ({} if none).
+    """
+    path = Path(export_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except ValueError:
+        return {}
+
+
+def save_manifest(export_dir, manifest):
+    """
+    Atomically replaces an export folder's manifest.
+    """
+    path = Path(export_dir) / MANIFEST_NAME
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def is_up_to_date(path, digest, manifest=None):
+    """
+    True when `path` exists and was exported from a figure with this digest.
+    """
+    path = Path(path)
+    manifest = load_manifest(path.parent) if manifest is None else manifest
+    return path.exists() and manifest.get(path.name, {}).get("digest") == digest
+
+
+def record_export(path, digest, manifest=None):
+    """
+    Stores the digest of a freshly written export in its folder's manifest.
+    """
+    path = Path(path)
+    manifest = load_manifest(path.parent) if manifest is None else manifest
+    manifest[path.name] = {"digest": digest, "bytes": path.stat().st_size}
+    save_manifest(path.parent, manifest)
+    return manifest
+
+
+def gc_exports(export_dir, keep):
+    """
+    Deletes exported files (and manifest entries) in a folder that are not in
+    `keep`. Returns the removed paths.
+    """
+    export_dir = Path(export_dir)
+    keep = set(keep)
+    manifest = load_manifest(export_dir)
+    removed = []
+    for path in export_dir.iterdir():
+        if path.is_file() and path.suffix.lower() in EXPORT_KINDS and path.name not in keep:
+            path.unlink()
+            removed.append(path)
+    for name in [n for n in manifest if n not in keep]:
+        del manifest[name]
+    if export_dir.exists():
+        save_manifest(export_dir, manifest)
+    return removed
+
+
+# ============================
+# 📜 SHARED PLOTLY.JS
+# ============================
+# - "inline": every HTML file embeds its own copy of plotly.js (~3.5 MB), so
+#   it works anywhere on its own.
+# - "shared": plotly.js is written once per export root, to
+#   exports/html/plotly-<version>.min.js, and every HTML file loads it through
+#   a relative <script src>, so the exports/ tree must be kept together.
+
+PLOTLYJS_MODES = ("inline", "shared")
+
+
+def plotlyjs_asset(export_root=None):
+    """
+    Path of the shared plotly.js bundle of an export root, written on first use.
+    """
+    from plotly.offline import get_plotlyjs, get_plotlyjs_version
+
+    path = Path(export_root or default_export_root()) / "html" / f"plotly-{get_plotlyjs_version()}.min.js"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(get_plotlyjs(), encoding="utf-8")
+        os.replace(tmp, path)
+    return path
+
+
+def include_plotlyjs(path, plotlyjs="inline", export_root=None):
+    """
+    The include_plotlyjs value for writing `path`: True (inline) or the relative
+    URL of the shared bundle.
+    """
+    if plotlyjs not in PLOTLYJS_MODES:
+        raise ValueError(f"Unknown plotlyjs mode '{plotlyjs}'. Use one of: {', '.join(PLOTLYJS_MODES)}")
+    if plotlyjs == "inline":
+        return True
+    return Path(os.path.relpath(plotlyjs_asset(export_root), Path(path).parent)).as_posix()
+
+
+# ============================
+# 🖨️ PERSISTENT PNG RENDERERS
+# ============================
+# Each worker process keeps one headless browser (Kaleido v1) open for its whole
+# lifetime, so a batch pays the browser start-up once per worker instead of
+# once per image. Older Kaleido versions fall back to fig.write_image.
+
+
+class _PngRenderer:
+    def __init__(self):
+        import asyncio
+
+        import kaleido
+
+        self._loop = None
+        if hasattr(kaleido, "Kaleido"):
+            self._loop = asyncio.new_event_loop()
+            self._kaleido = self._loop.run_until_complete(kaleido.Kaleido(n=1).__aenter__())
+            atexit.register(self.close)
+
+    def render(self, fig, path, opts):
+        import plotly.io as pio
+
+        if self._loop is None:
+            pio.write_image(fig, path, engine="kaleido", width=opts["width"], height=opts["height"],
+                            scale=opts["scale"])
+            return
+        self._loop.run_until_complete(self._kaleido.write_fig(fig, path=path, opts=opts))
+
+    def close(self):
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.run_until_complete(self._kaleido.__aexit__(None, None, None))
+            self._loop.close()
+
+
+_RENDERER = None
+
+
+def _render_png(fig, path, opts):
+    # Runs inside a worker process, whose pio.defaults are fresh: opts come from
+    # the parent (the ones hashed into the digest). Returns (seconds, error or None)
+    global _RENDERER
+    start = time.perf_counter()
+    try:
+        if _RENDERER is None:
+            _RENDERER = _PngRenderer()
+        _RENDERER.render(fig, path, opts)
+        return time.perf_counter() - start, None
+    except Exception as e:
+        return time.perf_counter() - start, f"{type(e).__name__}: {e}"
+
+
+_POOL = {"executor": None, "workers": 0}
+
+
+def _png_pool(workers):
+    # Reused across batches; spawn keeps the browsers out of a forked server process
+    if _POOL["executor"] is None or _POOL["workers"] != workers:
+        shutdown_export_pool()
+        _POOL["executor"] = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        _POOL["workers"] = workers
+    return _POOL["executor"]
+
+
+def shutdown_export_pool():
+    """
+    Stops the PNG worker processes (and their browsers).
+    """
+    if _POOL["executor"] is not None:
+        _POOL["executor"].shutdown(wait=True)
+        _POOL["executor"] = None
+        _POOL["workers"] = 0
+
+
+atexit.register(shutdown_export_pool)
+
+
+# ============================
+# 📦 BATCH EXPORT
+# ============================
+
+
+@dataclass
+class ExportResult:
+    filename: str
+    notebook_name: str
+    path: Path
+    seconds: float
+    error: str = None
+    skipped: bool = False
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _write_html(fig, path, include=True):
+    start = time.perf_counter()
+    try:
+        fig.write_html(path, include_plotlyjs=include)
+        return time.perf_counter() - start, None
+    except Exception as e:
+        return time.perf_counter() - start, f"{type(e).__name__}: {e}"
+
+
+def export_figures(jobs, workers=None, export_root=None, skip_unchanged=True, prune=False, plotlyjs="inline"):
+    """
+    Exports many figures in one call.
+
+    Parameters:
+    - jobs (list[tuple]): (figure, filename, notebook_name) triples; the extension
+      (.html / .png) picks the output folder, as in save_fig_as_html/png.
+    - workers (int | None): PNG worker processes (default: DEFAULT_EXPORT_WORKERS).
+    - export_root (Path | None): exports/ folder (default: ../exports).
+    - skip_unchanged (bool): Skip figures whose spec hash matches the folder manifest.
+    - prune (bool): Delete files in the touched folders that are not part of this batch.
+    - plotlyjs (str): "inline" or "shared" plotly.js for HTML files (see PLOTLYJS_MODES).
+
+    HTML files are written concurrently on a thread pool; PNGs are rendered on a
+    reusable pool of worker processes, each keeping its Kaleido browser alive.
+
+    Returns one ExportResult per job, in input order, with the time spent on
+    that job, whether it was skipped and the error message if it failed.
+    """
+    paths = [export_path(filename, nb, export_root) for _, filename, nb in jobs]
+    manifests = {path.parent: load_manifest(path.parent) for path in paths}
+    outcomes = [None] * len(jobs)
+    digests = [None] * len(jobs)
+    skipped = [False] * len(jobs)
+
+    for i, (fig, _, _) in enumerate(jobs):
+        start = time.perf_counter()
+        digests[i] = figure_digest(fig, paths[i], plotlyjs)
+        if skip_unchanged and is_up_to_date(paths[i], digests[i], manifests[paths[i].parent]):
+            outcomes[i] = (time.perf_counter() - start, None)
+            skipped[i] = True
+
+    pending = [i for i in range(len(jobs)) if not skipped[i]]
+    png_idx = [i for i in pending if paths[i].suffix.lower() == ".png"]
+    html_idx = [i for i in pending if paths[i].suffix.lower() == ".html"]
+
+    png_futures = {}
+    if png_idx:
+        pool = _png_pool(workers or DEFAULT_EXPORT_WORKERS)
+        opts = _png_opts()
+        for i in png_idx:
+            png_futures[i] = pool.submit(_render_png, jobs[i][0].to_dict(), str(paths[i]), opts)
+
+    if html_idx:
+        with ThreadPoolExecutor(max_workers=min(len(html_idx), os.cpu_count() or 1)) as threads:
+            html_futures = {
+                i: threads.submit(_write_html, jobs[i][0], paths[i], include_plotlyjs(paths[i], plotlyjs, export_root))
+                for i in html_idx
+            }
+            for i, future in html_futures.items():
+                outcomes[i] = future.result()
+
+    for i, future in png_futures.items():
+        try:
+            outcomes[i] = future.result()
+        except BrokenProcessPool as e:  # a worker died; start fresh next batch
+            outcomes[i] = (0.0, f"{type(e).__name__}: {e}")
+            _POOL["executor"] = None
+
+    for i in pending:
+        if outcomes[i][1] is None:
+            manifests[paths[i].parent][paths[i].name] = {
+                "digest": digests[i],
+                "bytes": paths[i].stat().st_size,
+            }
+    for export_dir, manifest in manifests.items():
+        save_manifest(export_dir, manifest)
+        if prune:
+            gc_exports(export_dir, keep=[p.name for p in paths if p.parent == export_dir])
+
+    return [
+        ExportResult(filename, nb, paths[i], seconds, error, skipped[i])
+        for i, ((_, filename, nb), (seconds, error)) in enumerate(zip(jobs, outcomes))
+    ]
+
+
+# ============================
+# 📚 MULTI-FIGURE HTML REPORTS
+# ============================
+
+_REPORT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+{script}
+<style>body {{ font-family: sans-serif; margin: 24px; }} section {{ margin-bottom: 32px; }}</style>
+</head>
+<body>
+<h1>{title}</h1>
+{sections}
+</body>
+</html>
+"""
+
+
+def export_report(figures, notebook_name, filename=None, export_root=None, plotlyjs="shared",
+                  title=None, skip_unchanged=True):
+    """
+    Packs several figures into one HTML file that loads plotly.js once.
+
+    Parameters:
+    - figures (dict): {stem: figure}, in display order.
+    - notebook_name (str): Folder under exports/html.
+    - filename (str | None): Default "<notebook_name>_report.html".
+    - export_root (Path | None): exports/ folder (default: ../exports).
+    - plotlyjs (str): "shared" (reference the export root's bundle) or "inline".
+    - title (str | None): Page heading (default: notebook_name).
+    - skip_unchanged (bool): Skip when the manifest shows the same figures were written.
+
+    Returns an ExportResult.
+    """
+    import plotly.io as pio
+    from plotly.offline import get_plotlyjs
+
+    filename = filename or f"{notebook_name}_report.html"
+    path = export_path(filename, notebook_name, export_root)
+    start = time.perf_counter()
+
+    digest = hashlib.sha256(f"report:{plotlyjs}".encode())
+    for stem, fig in figures.items():
+        digest.update(stem.encode())
+        digest.update(figure_digest(fig, path, plotlyjs).encode())
+    digest = digest.hexdigest()
+    if skip_unchanged and is_up_to_date(path, digest):
+        return ExportResult(filename, notebook_name, path, time.perf_counter() - start, skipped=True)
+
+    try:
+        include = include_plotlyjs(path, plotlyjs, export_root)
+        if include is True:
+            script = f'<script type="text/javascript">{get_plotlyjs()}</script>'
+        else:
+            script = f'<script charset="utf-8" src="{html.escape(include)}"></script>'
+        sections = "\n".join(
+            f'<section id="{html.escape(stem)}">'
+            + pio.to_html(fig, full_html=False, include_plotlyjs=False, div_id=stem,
+                          default_height=f"{fig.layout.height or 500}px")
+            + "</section>"
+            for stem, fig in figures.items()
+        )
+        page = _REPORT_TEMPLATE.format(title=html.escape(title or notebook_name), script=script, sections=sections)
+        path.write_text(page, encoding="utf-8")
+        record_export(path, digest)
+    except Exception as e:
+        return ExportResult(filename, notebook_name, path, time.perf_counter() - start, f"{type(e).__name__}: {e}")
+    return ExportResult(filename, notebook_name, path, time.perf_counter() - start)
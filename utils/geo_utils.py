@@ -0,0 +1,346 @@
+# utils/geo_utils.py
+
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+try:
+    from .cache_utils import LRUCache, frame_cached
+    from .lazy_utils import lazy_import
+except ImportError:  # notebooks import plot_utils as a top-level module
+    from cache_utils import LRUCache, frame_cached
+    from lazy_utils import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# ============================
+# 🗺️ SPATIAL AGGREGATION
+# ============================
+# Point clouds are reduced to one marker per map cell before they reach Plotly.
+# Every row gets an integer cell key in one vectorized pass; the keys are then
+# factorized and counted/averaged with np.bincount.
+#
+# - "grid": square lat/lon cells
+# - "hex": pointy-top hexagons on the lon/lat plane (axial coordinates)
+# - "geohash": geohash cells, at the precision closest to the cell size
+#
+# Cells are sized for the map's zoom (Web-Mercator convention: the world is
+# 256 · 2^zoom px wide), so each marker stands for about CELL_PIXELS px on
+# screen. Results are cached per frame object (load_dataset's cached frame stands
+# for a dataset version; see cache_utils.frame_cached), method and integer zoom level.
+
+AGGREGATION_METHODS = ("grid", "hex", "geohash")
+
+# Screen pixels one aggregated marker stands for
+CELL_PIXELS = 24
+
+COUNT_COLUMN = "count"
+
+# Deepest zoom cells are sized for (map subplots go to 22; deeper zooms reuse these cells)
+MAX_ZOOM = 24
+
+_GEOHASH_CHARS = "0123456789bcdefghjkmnpqrstuvwxyz"
+MAX_GEOHASH_PRECISION = 12
+
+_GEO_CACHE = LRUCache(max_bytes=64 * 1024 ** 2)
+
+
+def geo_cache_stats():
+    """
+    Hit/miss/eviction counters and byte usage of the spatial aggregation cache.
+    """
+    return _GEO_CACHE.stats()
+
+
+def clear_geo_cache():
+    """
+    Drops every cached spatial aggregation.
+    """
+    _GEO_CACHE.clear()
+
+
+def zoom_level(zoom):
+    """
+    Integer zoom level cells are sized (and cached) for, at most MAX_ZOOM.
+    """
+    return min(max(0, int(np.floor(zoom or 0))), MAX_ZOOM)
+
+
+def cell_size_for_zoom(zoom, cell_pixels=CELL_PIXELS):
+    """
+    Cell size in degrees of longitude covering about cell_pixels px at the zoom level.
+    """
+    return 360.0 * cell_pixels / (256 * 2 ** zoom_level(zoom))
+
+
+def geohash_precision(cell_size):
+    """
+    Geohash precision whose cell width is closest (on a log scale) to cell_size degrees.
+    """
+    precisions = np.arange(1, MAX_GEOHASH_PRECISION + 1)
+    widths = 360.0 / 2.0 ** np.ceil(precisions * 5 / 2)
+    return int(precisions[np.argmin(np.abs(np.log(widths / cell_size)))])
+
+
+# ============================
+# 🔑 CELL KEYS
+# ============================
+# Each returns (int64 key per point, function key → (cell center lat, lon)).
+
+
+def _grid_cells(lat, lon, size):
+    cols = int(np.ceil(360.0 / size)) + 1
+    row = np.floor((lat + 90.0) / size).astype(np.int64)
+    col = np.floor((lon + 180.0) / size).astype(np.int64)
+
+    def centers(keys):
+        return (keys // cols + 0.5) * size - 90.0, (keys % cols + 0.5) * size - 180.0
+
+    return row * cols + col, centers
+
+
+def _hex_cells(lat, lon, size):
+    # size is the hexagon width (flat side to flat side); cube rounding picks the hexagon
+    radius = size / np.sqrt(3.0)
+    q = (np.sqrt(3.0) / 3.0 * lon - lat / 3.0) / radius
+    r = (2.0 / 3.0 * lat) / radius
+    s = -q - r
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+
+    # |q|, |r| grow as 2^zoom: about 2^25 at MAX_ZOOM, inside ±2^30 (the key stays below 2^62)
+    offset = 1 << 30
+    key = (rq.astype(np.int64) + offset) * (2 * offset) + (rr.astype(np.int64) + offset)
+
+    def centers(keys):
+        aq = keys // (2 * offset) - offset
+        ar = keys % (2 * offset) - offset
+        return radius * 1.5 * ar, radius * np.sqrt(3.0) * (aq + ar / 2.0)
+
+    return key, centers
+
+
+def _interleave(lon_idx, lat_idx, lon_bits, lat_bits):
+    # Geohash bit order: longitude bit first, then alternating, most significant first
+    key = np.zeros(len(lon_idx), dtype=np.int64)
+    for i in range(lon_bits + lat_bits):
+        if i % 2 == 0:
+            bit = (lon_idx >> (lon_bits - 1 - i // 2)) & 1
+        else:
+            bit = (lat_idx >> (lat_bits - 1 - i // 2)) & 1
+        key = (key << 1) | bit
+    return key
+
+
+def _geohash_cells(lat, lon, size):
+    precision = geohash_precision(size)
+    bits = precision * 5
+    lon_bits, lat_bits = (bits + 1) // 2, bits // 2
+    lon_idx = np.clip(np.floor((lon + 180.0) / 360.0 * 2 ** lon_bits), 0, 2 ** lon_bits - 1).astype(np.int64)
+    lat_idx = np.clip(np.floor((lat + 90.0) / 180.0 * 2 ** lat_bits), 0, 2 ** lat_bits - 1).astype(np.int64)
+
+    def centers(keys):
+        lon_c, lat_c = np.zeros(len(keys), dtype=np.int64), np.zeros(len(keys), dtype=np.int64)
+        for i in range(bits):
+            bit = (keys >> (bits - 1 - i)) & 1
+            if i % 2 == 0:
+                lon_c = (lon_c << 1) | bit
+            else:
+                lat_c = (lat_c << 1) | bit
+        return (lat_c + 0.5) * 180.0 / 2 ** lat_bits - 90.0, (lon_c + 0.5) * 360.0 / 2 ** lon_bits - 180.0
+
+    return _interleave(lon_idx, lat_idx, lon_bits, lat_bits), centers
+
+
+def geohash_strings(keys, precision):
+    """
+    Base32 geohash text for integer geohash keys of the given precision.
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    chars = np.frombuffer(_GEOHASH_CHARS.encode(), dtype=np.uint8)
+    shifts = 5 * np.arange(precision - 1, -1, -1)
+    text = chars[(keys[:, None] >> shifts) & 31]  # one ASCII byte per character
+    return np.ascontiguousarray(text).view(f"S{precision}").ravel().astype(str)
+
+
+_CELLS = {"grid": _grid_cells, "hex": _hex_cells, "geohash": _geohash_cells}
+
+
+# ============================
+# 📍 AGGREGATION
+# ============================
+
+
+def aggregate_points(df, lat, lon, values=(), method="grid", zoom=1, cell_pixels=CELL_PIXELS):
+    """
+    One row per occupied map cell.
+
+    Parameters:
+    - df (DataFrame): Point rows.
+    - lat, lon (str): Coordinate columns (degrees).
+    - values (list[str]): Numeric columns averaged per cell.
+    - method (str): "grid", "hex" or "geohash".
+    - zoom (float): Map zoom the cells are sized for.
+    - cell_pixels (int): Screen pixels per cell at that zoom.
+
+    Returns a DataFrame with the lat/lon of each cell's mean position, COUNT_COLUMN,
+    the mean of every values column (same names), the cell center
+    ("cell_lat", "cell_lon") and a "cell" id (geohash text, else the integer cell key).
+    """
+    if method not in AGGREGATION_METHODS:
+        raise ValueError(f"Unknown aggregation method '{method}'. Use one of: {', '.join(AGGREGATION_METHODS)}")
+    values = [v for v in dict.fromkeys(values) if v not in (lat, lon)]
+    level = zoom_level(zoom)
+    key = ("geo", lat, lon, tuple(values), method, level, cell_pixels)
+    return frame_cached(_GEO_CACHE, df, key,
+                        lambda: _aggregate(df, lat, lon, values, method, cell_size_for_zoom(level, cell_pixels)))
+
+
+def _aggregate(df, lat, lon, values, method, size):
+    lat_v = pd.to_numeric(df[lat], errors="coerce").to_numpy(dtype=np.float64)
+    lon_v = pd.to_numeric(df[lon], errors="coerce").to_numpy(dtype=np.float64)
+    keep = np.isfinite(lat_v) & np.isfinite(lon_v)
+    lat_v, lon_v = lat_v[keep], lon_v[keep]
+
+    keys, centers = _CELLS[method](lat_v, lon_v, size)
+    codes, cells = pd.factorize(keys)
+    n = len(cells)
+    counts = np.bincount(codes, minlength=n)
+
+    out = {
+        lat: np.bincount(codes, weights=lat_v, minlength=n) / counts,
+        lon: np.bincount(codes, weights=lon_v, minlength=n) / counts,
+        COUNT_COLUMN: counts,
+    }
+    for column in values:
+        v = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=np.float64)[keep]
+        finite = np.isfinite(v)
+        totals = np.bincount(codes[finite], weights=v[finite], minlength=n)
+        filled = np.bincount(codes[finite], minlength=n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[column] = np.where(filled > 0, totals / filled, np.nan)
+
+    cell_lat, cell_lon = centers(cells)
+    out["cell_lat"], out["cell_lon"] = cell_lat, cell_lon
+    out["cell"] = geohash_strings(cells, geohash_precision(size)) if method == "geohash" else cells
+    return pd.DataFrame(out).sort_values(COUNT_COLUMN, ascending=False, ignore_index=True)
+
+
+# ============================
+# 🌐 OFFLINE COUNTRY GEOMETRY
+# ============================
+# build_geometry.py writes a local country bundle to datasets/geo/:
+#
+# - countries_z<level>.geojson: one Feature per country (id = ISO-3), simplified
+#   more at lower levels (GEOMETRY_LEVELS: tolerance in degrees, coordinate decimals)
+# - country_index.json: {"names": {normalized name: ISO-3}, "countries": {ISO-3: name}}
+#
+# With it, country names are resolved here instead of in the browser and a
+# choropleth embeds only the shapes its rows use, so nothing is fetched.
+
+GEOMETRY_DIR = Path(__file__).resolve().parent.parent / "datasets" / "geo"
+GEOMETRY_LEVELS = {0: (0.25, 2), 1: (0.05, 3), 2: (0.01, 4)}
+COUNTRY_INDEX_FILE = "country_index.json"
+LOCATION_MODES = ("country names", "ISO-3")
+
+_GEOMETRY_FILES = {}
+
+
+def geometry_path(level):
+    """
+    Bundle file for a simplification level.
+    """
+    return GEOMETRY_DIR / f"countries_z{level}.geojson"
+
+
+def has_country_geometry():
+    """
+    True when the country index and every geometry level are present.
+    """
+    paths = [GEOMETRY_DIR / COUNTRY_INDEX_FILE, *map(geometry_path, GEOMETRY_LEVELS)]
+    return all(path.exists() for path in paths)
+
+
+def geometry_level(zoom):
+    """
+    Simplification level used for a zoom (the most detailed beyond the last level).
+    """
+    return min(zoom_level(zoom), max(GEOMETRY_LEVELS))
+
+
+def normalize_country_name(name):
+    """
+    Lookup form of a country name: accents, case, "&" and punctuation folded.
+    """
+    text = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode()
+    text = text.casefold().replace("&", " and ")
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+def _load_json(path):
+    # Parsed once per file version
+    if not path.exists():
+        raise FileNotFoundError(f"{path} not found. Build the country bundle with: python build_geometry.py")
+    signature = (path, path.stat().st_mtime_ns)
+    if signature not in _GEOMETRY_FILES:
+        with open(path, encoding="utf-8") as f:
+            _GEOMETRY_FILES[signature] = json.load(f)
+    return _GEOMETRY_FILES[signature]
+
+
+def country_index():
+    """
+    The bundled name → ISO-3 index (see build_geometry.py).
+    """
+    return _load_json(GEOMETRY_DIR / COUNTRY_INDEX_FILE)
+
+
+def _resolve_name(name, names):
+    # Exact normalized name, then the part before a "(" or "," qualifier
+    key = normalize_country_name(name)
+    if key in names:
+        return names[key]
+    short = normalize_country_name(re.split(r"[(,]", str(name))[0])
+    return names.get(short)
+
+
+def resolve_countries(values, locationmode="country names"):
+    """
+    ISO-3 code for every value, resolved against the bundled index.
+
+    Parameters:
+    - values (array-like): Country names or ISO-3 codes.
+    - locationmode (str): "country names" or "ISO-3".
+
+    Returns (object array of ISO-3 codes, None where unmatched; sorted unmatched values).
+    """
+    if locationmode not in LOCATION_MODES:
+        raise ValueError(f"Unknown locationmode '{locationmode}'. Use one of: {', '.join(LOCATION_MODES)}")
+    index = country_index()
+    codes, uniques = pd.factorize(pd.Series(values), sort=False)
+    if locationmode == "ISO-3":
+        resolved = [str(v).upper() if str(v).upper() in index["countries"] else None for v in uniques]
+    else:
+        resolved = [_resolve_name(v, index["names"]) for v in uniques]
+
+    lookup = np.array(resolved + [None], dtype=object)  # code -1 (missing) → None
+    unmatched = sorted(str(v) for v, iso in zip(uniques, resolved) if iso is None)
+    return lookup[codes], unmatched
+
+
+def country_shapes(iso3_codes, zoom=0):
+    """
+    GeoJSON FeatureCollection with just the given countries, simplified for zoom.
+    """
+    wanted = set(iso3_codes) - {None}
+    bundle = _load_json(geometry_path(geometry_level(zoom)))
+    return {
+        "type": "FeatureCollection",
+        "features": [feature for feature in bundle["features"] if feature["id"] in wanted],
+    }
@@ -0,0 +1,48 @@
+# utils/lazy_utils.py
+
+import importlib
+import sys
+
+# ============================
+# 💤 LAZY MODULE IMPORTS
+# ============================
+# plotly.express, pandas and friends cost hundreds of milliseconds to import.
+# Modules bind them with lazy_import() instead, so the real import happens the
+# first time a helper touches them rather than when the module is imported.
+
+
+class LazyModule:
+    """
+    Stand-in for a module that imports it on first attribute access.
+    """
+
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            module = importlib.import_module(self.__dict__["_name"])
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_import(name):
+    """
+    Returns the module if it is already imported, otherwise a LazyModule for it.
+
+    Example: px = lazy_import("plotly.express")
+    """
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
@@ -1,31 +1,145 @@
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import numpy as np
-import pandas as pd
-from sklearn.linear_model import LinearRegression
-import plotly.io as pio
+try:
+    from .lazy_utils import lazy_import
+    from .animation_utils import AnimationReport, build_animation, frame_positions
+    from .binning_utils import bin_centers, histogram2d_bins, histogram_bins
+    from .cache_utils import clear_figure_cache, disable_figure_cache, enable_figure_cache, figure_cache_stats, memoize_figure
+    from .downsample_utils import DEFAULT_MAX_POINTS, downsample_figure, downsample_frame
+    from .export_utils import (
+        export_figures, export_path, export_report, figure_digest, include_plotlyjs, is_up_to_date, record_export,
+    )
+    from .geo_utils import (
+        AGGREGATION_METHODS, COUNT_COLUMN, LOCATION_MODES, aggregate_points, clear_geo_cache, country_shapes,
+        geo_cache_stats, has_country_geometry, resolve_countries, zoom_level,
+    )
+    from .serialize_utils import compact_figure, figure_to_json, serialization_report
+    from .stats_utils import RollingMean, RunningStats, ZScoreBand, fit_linear, trend_points
+except ImportError:  # notebooks import plot_utils as a top-level module
+    from lazy_utils import lazy_import
+    from animation_utils import AnimationReport, build_animation, frame_positions
+    from binning_utils import bin_centers, histogram2d_bins, histogram_bins
+    from cache_utils import clear_figure_cache, disable_figure_cache, enable_figure_cache, figure_cache_stats, memoize_figure
+    from downsample_utils import DEFAULT_MAX_POINTS, downsample_figure, downsample_frame
+    from export_utils import (
+        export_figures, export_path, export_report, figure_digest, include_plotlyjs, is_up_to_date, record_export,
+    )
+    from geo_utils import (
+        AGGREGATION_METHODS, COUNT_COLUMN, LOCATION_MODES, aggregate_points, clear_geo_cache, country_shapes,
+        geo_cache_stats, has_country_geometry, resolve_countries, zoom_level,
+    )
+    from serialize_utils import compact_figure, figure_to_json, serialization_report
+    from stats_utils import RollingMean, RunningStats, ZScoreBand, fit_linear, trend_points
+
+# 💤 Heavy dependencies load on first use, not on import (see lazy_utils)
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+pio = lazy_import("plotly.io")
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+subplots = lazy_import("plotly.subplots")
+
+# ============================
+# ⚡ WEBGL POLICY
+# ============================
+# Traces with more points than the threshold are drawn with WebGL (Scattergl /
+# render_mode="webgl"), which stays responsive long after SVG does not. The
+# default matches plotly express' own render_mode="auto" cutoff.
+
+WEBGL_MODES = ("auto", "always", "never")
+_WEBGL = {"mode": "auto", "threshold": 1000}
+
+
+def set_webgl_policy(mode="auto", threshold=None):
+    """
+    Sets when the plot helpers switch to WebGL traces.
+
+    Parameters:
+    - mode (str): "auto" (above threshold points), "always" or "never".
+    - threshold (int | None): Point count above which "auto" uses WebGL (unchanged if None).
+    """
+    if mode not in WEBGL_MODES:
+        raise ValueError(f"Unknown WebGL mode '{mode}'. Use one of: {', '.join(WEBGL_MODES)}")
+    _WEBGL["mode"] = mode
+    if threshold is not None:
+        _WEBGL["threshold"] = int(threshold)
+    # Memoized figures were built under the previous policy
+    clear_figure_cache()
+
+
+def webgl_policy():
+    """
+    Current policy as {"mode": ..., "threshold": ...}.
+    """
+    return dict(_WEBGL)
+
+
+def use_webgl(n_points):
+    """
+    True if a trace with n_points points should be drawn with WebGL.
+    """
+    if _WEBGL["mode"] == "auto":
+        return n_points > _WEBGL["threshold"]
+    return _WEBGL["mode"] == "always"
+
+
+def scatter_trace(x, y, **kwargs):
+    """
+    go.Scatter, or go.Scattergl when the WebGL policy calls for it.
+    """
+    trace_cls = go.Scattergl if use_webgl(len(y)) else go.Scatter
+    return trace_cls(x=x, y=y, **kwargs)
+
+
+def _render_mode(n_points):
+    return "webgl" if use_webgl(n_points) else "svg"
 
 # ============================
 # 📊 EXPRESS HELPERS
 # ============================
 
-def line_plot(df, x, y, color=None, title="", markers=True, template="plotly_white"):
+def _downsample_for_plot(df, x, y, color, max_points, method):
+    """
+    Opt-in point budget for line/scatter helpers: reduces df to about
+    max_points rows (per color group when color is categorical) and prints
+    the payload reduction.
+    """
+    if not max_points or len(df) <= max_points:
+        return df
+    group = color if color is not None and not pd.api.types.is_numeric_dtype(df[color]) else None
+    df, report = downsample_frame(df, x, y, max_points=max_points, method=method, group=group)
+    print(f"{y} vs {x} – {report}")
+    return df
+
+@memoize_figure
+def line_plot(df, x, y, color=None, title="", markers=True, template="plotly_white",
+              max_points=None, downsample="lttb"):
+    """
+    Line chart. With max_points set, series longer than that are reduced with
+    downsample="lttb" (shape-preserving) or "minmax" (keeps every peak) first.
+    """
+    df = _downsample_for_plot(df, x, y, color, max_points, downsample)
     fig = px.line(
         df, x=x, y=y, color=color,
         title=title,
         markers=markers,
-        template=template
+        template=template,
+        render_mode=_render_mode(len(df))
     )
     fig.update_layout(legend_title_text=color if color else "")
     return fig
 
-def scatter_plot(df, x, y, color=None, size=None, hover_name=None, title="", template="plotly_white"):
+@memoize_figure
+def scatter_plot(df, x, y, color=None, size=None, hover_name=None, title="", template="plotly_white",
+                 max_points=None, downsample="lttb"):
+    """
+    Scatter chart; max_points/downsample work as in line_plot.
+    """
+    df = _downsample_for_plot(df, x, y, color, max_points, downsample)
     fig = px.scatter(
         df, x=x, y=y, color=color, size=size,
         hover_name=hover_name,
         title=title,
-        template=template
+        template=template,
+        render_mode=_render_mode(len(df))
     )
     fig.update_layout(legend_title_text=color if color else "")
     return fig
@@ -58,31 +172,45 @@ def apply_custom_layout(fig, title=None, xaxis_title=None, yaxis_title=None, leg
 # 💾 EXPORT UTILITIES
 # ============================
 
+import functools
 from pathlib import Path
 
 # ============================
 # 💾 EXPORT UTILITIES
 # ============================
 
-def save_fig_as_html(fig, filename, notebook_name="general"):
+def save_fig_as_html(fig, filename, notebook_name="general", plotlyjs="inline"):
     """
     Saves the figure as HTML in exports/html/{notebook_name}/
+    Numeric arrays are written as compact typed arrays (see compact_figure).
+    plotlyjs="shared" references one plotly.js file per export root instead of
+    embedding ~3.5 MB in every file.
+    Skipped when the folder manifest shows the same figure was already exported.
+    For many figures at once, use export_figures().
     """
-    export_dir = Path.cwd().parent / "exports/html" / notebook_name
-    export_dir.mkdir(parents=True, exist_ok=True)
-    full_path = export_dir / filename
-    fig.write_html(full_path)
+    full_path = export_path(filename, notebook_name)
+    compact_figure(fig)
+    digest = figure_digest(fig, full_path, plotlyjs)
+    if is_up_to_date(full_path, digest):
+        print(f"⏭️ HTML unchanged: {full_path}")
+        return
+    fig.write_html(full_path, include_plotlyjs=include_plotlyjs(full_path, plotlyjs))
+    record_export(full_path, digest)
     print(f"✅ HTML saved to: {full_path}")
 
 def save_fig_as_png(fig, filename, notebook_name="general"):
     """
     Saves the figure as PNG in exports/images/{notebook_name}/
-    Requires `kaleido` installed.
+    Requires `kaleido` installed. Skipped when the folder manifest shows the same
+    figure was already exported. For many figures at once, use export_figures().
     """
-    export_dir = Path.cwd().parent / "exports/images" / notebook_name
-    export_dir.mkdir(parents=True, exist_ok=True)
-    full_path = export_dir / filename
+    full_path = export_path(filename, notebook_name)
+    digest = figure_digest(fig, full_path)
+    if is_up_to_date(full_path, digest):
+        print(f"⏭️ PNG unchanged: {full_path}")
+        return
     fig.write_image(full_path, engine="kaleido")
+    record_export(full_path, digest)
     print(f"✅ PNG saved to: {full_path}")
 
 # ============================
@@ -102,6 +230,7 @@ def quick_preview(df, chart_type="line", **kwargs):
 
 # 📊 Bar Plot Utility
 
+@memoize_figure
 def bar_plot(df, x, y, color=None, barmode="group", title="", template="plotly_white", orientation="v"):
     fig = px.bar(
         df,
@@ -118,6 +247,7 @@ def bar_plot(df, x, y, color=None, barmode="group", title="", template="plotly_w
 
 # 🥧 Pie Chart Utility
 
+@memoize_figure
 def pie_chart(df, names, values, title=""):
     fig = px.pie(
         df,
@@ -131,6 +261,7 @@ def pie_chart(df, names, values, title=""):
 
 # 📦 Box Plot Utility
 
+@memoize_figure
 def box_plot(df, x, y, color=None, title="", template="plotly_white", points="outliers"):
     fig = px.box(
         df,
@@ -145,7 +276,56 @@ def box_plot(df, x, y, color=None, title="", template="plotly_white", points="ou
 
 # 📊 Histogram Utility
 
-def histogram_plot(df, x, color=None, nbins=None, title="", template="plotly_white", barmode="overlay"):
+BINNING_MODES = ("client", "server")
+
+def _check_binning(binning):
+    if binning not in BINNING_MODES:
+        raise ValueError(f"Unknown binning mode '{binning}'. Use one of: {', '.join(BINNING_MODES)}")
+
+def _binned_histogram(df, x, color, nbins, title, template, barmode):
+    bins = histogram_bins(df, x, color=color, nbins=nbins)
+    if bins["edges"] is None:
+        positions, widths = bins["labels"], None
+    else:
+        positions = bin_centers(bins["edges"])
+        widths = np.diff(pd.Series(bins["edges"]).to_numpy())
+        if widths.dtype.kind == "m":
+            widths = widths / np.timedelta64(1, "ms")  # date axes measure bar width in ms
+
+    fig = go.Figure()
+    overlay = barmode == "overlay" and len(bins["groups"]) > 1
+    for group, counts in zip(bins["groups"], bins["counts"]):
+        fig.add_trace(go.Bar(
+            x=positions,
+            y=counts,
+            width=widths,
+            name=str(group) if group is not None else x,
+            showlegend=group is not None,
+            opacity=0.6 if overlay else None,
+        ))
+    fig.update_layout(
+        title=title,
+        template=template,
+        barmode=barmode,
+        bargap=0,
+        xaxis_title=x,
+        yaxis_title="count",
+        legend_title_text=color if color else "",
+    )
+    return fig
+
+@memoize_figure
+def histogram_plot(df, x, color=None, nbins=None, title="", template="plotly_white", barmode="overlay",
+                   binning="client"):
+    """
+    Histogram of df[x], optionally split by color.
+
+    binning="client" lets plotly.js bin the raw rows; binning="server" counts
+    them here (see binning_utils) and ships one go.Bar point per bin.
+    """
+    _check_binning(binning)
+    if binning == "server":
+        return _binned_histogram(df, x, color, nbins, title, template, barmode)
     fig = px.histogram(
         df,
         x=x,
@@ -160,11 +340,32 @@ def histogram_plot(df, x, color=None, nbins=None, title="", template="plotly_whi
 
 # 🌡️ Density Heatmap Utility
 
-def density_heatmap(df, x, y, color_continuous_scale="Viridis", title="", template="plotly_white"):
+@memoize_figure
+def density_heatmap(df, x, y, color_continuous_scale="Viridis", title="", template="plotly_white",
+                    nbinsx=None, nbinsy=None, binning="client"):
+    """
+    2D density of (x, y). binning="server" counts the grid with
+    np.histogram2d and ships a go.Heatmap of bins × bins cells.
+    """
+    _check_binning(binning)
+    if binning == "server":
+        bins = histogram2d_bins(df, x, y, nbinsx=nbinsx, nbinsy=nbinsy)
+        fig = go.Figure(go.Heatmap(
+            x=bin_centers(bins["x_edges"]),
+            y=bin_centers(bins["y_edges"]),
+            z=bins["counts"],
+            colorscale=color_continuous_scale,
+            colorbar=dict(title="count"),
+        ))
+        fig.update_layout(title=title, template=template, xaxis_title=x, yaxis_title=y)
+        return fig
+
     fig = px.density_heatmap(
         df,
         x=x,
         y=y,
+        nbinsx=nbinsx,
+        nbinsy=nbinsy,
         color_continuous_scale=color_continuous_scale,
         title=title,
         template=template
@@ -173,6 +374,7 @@ def density_heatmap(df, x, y, color_continuous_scale="Viridis", title="", templa
 
 # 📈 Density Contour (KDE-style) Utility
 
+@memoize_figure
 def density_contour(df, x, y, color=None, title="", template="plotly_white"):
     fig = px.density_contour(
         df,
@@ -186,8 +388,26 @@ def density_contour(df, x, y, color=None, title="", template="plotly_white"):
 
 
 # 🌍 Scatter Geo Utility
-
-def scatter_geo(df, lat, lon, color=None, size=None, hover_name=None, title="", template="plotly_white"):
+# With aggregate="grid" | "hex" | "geohash", the map helpers plot one marker per
+# cell (see geo_utils) sized by its point count and colored by the mean of a
+# numeric color column (by the count otherwise). Cells are sized for zoom.
+
+def _aggregate_for_map(df, lat, lon, color, aggregate, zoom):
+    values = [color] if color is not None and pd.api.types.is_numeric_dtype(df[color]) else []
+    cells = aggregate_points(df, lat, lon, values=values, method=aggregate, zoom=zoom)
+    print(f"{lat}/{lon} – 🗺️ {aggregate}: {len(df):,} points → {len(cells):,} markers (zoom level {zoom_level(zoom)})")
+    return cells, (values[0] if values else COUNT_COLUMN)
+
+@memoize_figure
+def scatter_geo(df, lat, lon, color=None, size=None, hover_name=None, title="", template="plotly_white",
+                aggregate=None, zoom=1):
+    """
+    Scatter on a natural-earth projection. aggregate="grid", "hex" or "geohash"
+    plots one marker per cell sized for zoom instead of one per row.
+    """
+    if aggregate:
+        df, color = _aggregate_for_map(df, lat, lon, color, aggregate, zoom)
+        size, hover_name = COUNT_COLUMN, "cell"
     fig = px.scatter_geo(
         df,
         lat=lat,
@@ -203,8 +423,56 @@ def scatter_geo(df, lat, lon, color=None, size=None, hover_name=None, title="",
 
 
 # 🗺️ Choropleth Utility (By Country)
+# geometry="bundled" resolves locations against the local country bundle (see
+# geo_utils / build_geometry.py), reports unmatched ones and draws only the
+# shapes present on a tile-less map (map_style="white-bg"), so plotly.js loads
+# neither its topojson nor map tiles; "plotly" leaves both to plotly.js (fetches
+# its world topojson from a CDN); "auto" uses the bundle when it has been built.
+
+GEOMETRY_SOURCES = ("auto", "bundled", "plotly")
+
+def _bundled_choropleth(df, locations, color, locationmode, title, template, color_continuous_scale, zoom):
+    iso3, unmatched = resolve_countries(df[locations], locationmode)
+    matched = pd.notna(iso3)
+    report = f"{locations} – 🌐 {int(matched.sum()):,}/{len(df):,} rows matched"
+    if unmatched:
+        shown = ", ".join(unmatched[:10]) + (", …" if len(unmatched) > 10 else "")
+        report += f"; unmatched ({len(unmatched)}): {shown}"
+    print(report)
+
+    df = df[matched].assign(_iso3=iso3[matched])
+    # A geo subplot fetches plotly.js' topojson for any trace with a locationmode
+    # (geojson traces included); a map subplot with the white-bg style fetches nothing
+    fig = px.choropleth_map(
+        df,
+        geojson=country_shapes(df["_iso3"], zoom=zoom),
+        locations="_iso3",
+        featureidkey="id",
+        color=color,
+        hover_name=locations,
+        color_continuous_scale=color_continuous_scale,
+        map_style="white-bg",
+        zoom=zoom,
+        center={"lat": 20, "lon": 0},
+        title=title,
+        template=template
+    )
+    return fig
 
-def choropleth_map(df, locations, color, locationmode="country names", title="", template="plotly_white", color_continuous_scale="Viridis"):
+@memoize_figure
+def choropleth_map(df, locations, color, locationmode="country names", title="", template="plotly_white",
+                   color_continuous_scale="Viridis", geometry="auto", zoom=0):
+    """
+    Country choropleth. geometry picks the shapes (GEOMETRY_SOURCES); with the
+    bundle, zoom is the map zoom and picks its simplification level.
+    """
+    if geometry not in GEOMETRY_SOURCES:
+        raise ValueError(f"Unknown geometry source '{geometry}'. Use one of: {', '.join(GEOMETRY_SOURCES)}")
+    if geometry == "bundled" or (geometry == "auto" and locationmode in LOCATION_MODES and has_country_geometry()):
+        return _bundled_choropleth(df, locations, color, locationmode, title, template, color_continuous_scale, zoom)
+    if geometry == "auto" and locationmode in LOCATION_MODES:
+        print(f"{locations} – 🌐 no country bundle in datasets/geo/ (run build_geometry.py); "
+              "plotly.js will fetch its topojson")
     fig = px.choropleth(
         df,
         locations=locations,
@@ -219,11 +487,20 @@ def choropleth_map(df, locations, color, locationmode="country names", title="",
 
 # 🧭 Scatter Mapbox Utility (Optional if using Mapbox token)
 
-def scatter_mapbox(df, lat, lon, color=None, size=None, hover_name=None, title="", zoom=1, mapbox_style="carto-positron", token=None):
+@memoize_figure
+def scatter_mapbox(df, lat, lon, color=None, size=None, hover_name=None, title="", zoom=1, center=None,
+                   mapbox_style="carto-positron", token=None, aggregate=None):
+    """
+    Create a scatter mapbox plot. Optionally inject your Mapbox access token for custom styling.
+    aggregate="grid", "hex" or "geohash" plots one marker per cell sized for zoom.
+    """
     if token:
         import plotly
         plotly.io.mapbox.default_access_token = token
 
+    if aggregate:
+        df, color = _aggregate_for_map(df, lat, lon, color, aggregate, zoom)
+        size, hover_name = COUNT_COLUMN, "cell"
     fig = px.scatter_mapbox(
         df,
         lat=lat,
@@ -232,6 +509,7 @@ def scatter_mapbox(df, lat, lon, color=None, size=None, hover_name=None, title="
         size=size,
         hover_name=hover_name,
         zoom=zoom,
+        center=center,
         mapbox_style=mapbox_style,
         title=title
     )
@@ -239,7 +517,30 @@ def scatter_mapbox(df, lat, lon, color=None, size=None, hover_name=None, title="
 
 # 🎞️ Animated Bar/Line Plot Utility (using animation_frame)
 
-def animated_plot(df, x, y, animation_frame, color=None, title="", template="plotly_white", plot_type="line"):
+ANIMATION_ENGINES = ("arrays", "express")
+
+@memoize_figure
+def animated_plot(df, x, y, animation_frame, color=None, title="", template="plotly_white", plot_type="line",
+                  engine="arrays", max_frames=None, report=False):
+    """
+    Animated line/bar chart. engine="arrays" builds the frames from grouped NumPy
+    arrays, each carrying only its y values (see animation_utils.build_animation);
+    "express" uses px with animation_frame. max_frames keeps that many evenly
+    spaced frames. report=True prints the frame count, build time and JSON size
+    (serializing the figure once more to measure it).
+    """
+    if engine not in ANIMATION_ENGINES:
+        raise ValueError(f"Unknown animation engine '{engine}'. Use one of: {', '.join(ANIMATION_ENGINES)}")
+    if engine == "arrays":
+        fig, stats = build_animation(df, x, y, animation_frame, color=color, title=title, template=template,
+                                     plot_type=plot_type, max_frames=max_frames, measure=report)
+        if report:
+            print(f"{animation_frame} – {stats}")
+        return fig
+
+    if max_frames:
+        frames = df[animation_frame].drop_duplicates().sort_values()
+        df = df[df[animation_frame].isin(frames.iloc[frame_positions(len(frames), max_frames)])]
     if plot_type == "line":
         fig = px.line(
             df,
@@ -267,16 +568,81 @@ def animated_plot(df, x, y, animation_frame, color=None, title="", template="plo
     return fig
 
 
-# 🎛️ Interactive Dropdown with Traces
+# 🎛️ Interactive Dropdown / Slider Toggling
+# - mode="visible": every trace stays in the figure and each button/step sends a
+#   visible flag per trace, so payload and build time grow with steps × traces.
+# - mode="swap": the figure keeps one trace per slot (the most traces a step
+#   shows) and each button/step restyles those slots with its own arrays, so
+#   cost grows linearly with the steps. data_dropdown/data_slider do the same
+#   from precomputed arrays (see group_arrays) without building a trace per step.
+
+TOGGLE_MODES = ("visible", "swap")
+
+# Trace attributes a swap step carries (whatever the traces set of these)
+_SWAP_ATTRS = ("x", "y", "z", "text", "hovertext", "customdata", "name", "marker.color", "marker.size")
 
-def add_dropdown(fig, label_trace_map, title=""):
-    buttons = []
-    for label, trace_idxs in label_trace_map.items():
-        visible = [False] * len(fig.data)
-        for i in trace_idxs:
-            visible[i] = True
-        buttons.append(dict(label=label, method="update", args=[{"visible": visible}, {"title": title}]))
 
+def group_arrays(df, by, **columns):
+    """
+    Per-group arrays (plus the group as trace name) for data_dropdown/data_slider,
+    in order of appearance.
+
+    Example: group_arrays(df, "Category", x="Month", y="Sales")
+    → {"Electronics": {"x": array, "y": array, "name": "Electronics"}, ...}
+    """
+    groups = df.groupby(by, sort=False, observed=True).indices
+    values = {attr: df[column].to_numpy() for attr, column in columns.items()}
+    return {
+        label: {**{attr: arr[rows] for attr, arr in values.items()}, "name": str(label)}
+        for label, rows in groups.items()
+    }
+
+
+def _trace_arrays(trace):
+    # The type goes along, so a slot can show a bar in one step and a line in the next
+    data = {attr: trace[attr] for attr in _SWAP_ATTRS if attr in trace and trace[attr] is not None}
+    data["type"] = trace.plotly_name
+    return data
+
+
+def _swap_updates(step_data):
+    # step_data: per step, one {attr: value} dict per slot → restyle updates for every slot.
+    # Attributes some step leaves unset are sent as None, which resets them.
+    slots = max(len(step) for step in step_data)
+    attrs = sorted({attr for step in step_data for data in step for attr in data})
+    updates = []
+    for step in step_data:
+        update = {attr: [step[j].get(attr) if j < len(step) else None for j in range(slots)] for attr in attrs}
+        update["visible"] = [j < len(step) for j in range(slots)]
+        updates.append(update)
+    return updates
+
+
+def _apply_update(fig, update, trace_ids):
+    for j, i in enumerate(trace_ids):
+        for attr, values in update.items():
+            if attr != "type":
+                fig.data[i][attr] = values[j]
+
+
+def _swap_traces(fig, steps):
+    # Reduces fig to one trace per slot, filled with the first step's data
+    updates = _swap_updates([[_trace_arrays(fig.data[i]) for i in idxs] for idxs in steps])
+    slots = len(updates[0]["visible"])
+    templates = [next(fig.data[idxs[j]] for idxs in steps if len(idxs) > j) for j in range(slots)]
+    copies = [type(trace)(trace) for trace in templates]
+    fig.data = []
+    fig.add_traces(copies)
+    _apply_update(fig, updates[0], range(slots))
+    return updates, list(range(slots))
+
+
+def _check_mode(mode):
+    if mode not in TOGGLE_MODES:
+        raise ValueError(f"Unknown toggle mode '{mode}'. Use one of: {', '.join(TOGGLE_MODES)}")
+
+
+def _dropdown_menu(fig, buttons):
     fig.update_layout(
         updatemenus=[
             dict(
@@ -292,10 +658,66 @@ def add_dropdown(fig, label_trace_map, title=""):
     return fig
 
 
+def _slider_menu(fig, steps, title):
+    sliders = [dict(
+        active=0,
+        pad={"t": 50},
+        steps=steps
+    )]
+
+    fig.update_layout(sliders=sliders, title=title)
+    return fig
+
+
+def add_dropdown(fig, label_trace_map, title="", mode="visible"):
+    """
+    Dropdown whose buttons show the listed traces ({label: [trace indices]}).
+    mode="swap" keeps one trace per slot and restyles it per button (see TOGGLE_MODES).
+    """
+    _check_mode(mode)
+    if mode == "swap":
+        updates, trace_ids = _swap_traces(fig, list(label_trace_map.values()))
+        buttons = [dict(label=label, method="update", args=[update, {"title": title}, trace_ids])
+                   for label, update in zip(label_trace_map, updates)]
+        return _dropdown_menu(fig, buttons)
+
+    buttons = []
+    for label, trace_idxs in label_trace_map.items():
+        visible = [False] * len(fig.data)
+        for i in trace_idxs:
+            visible[i] = True
+        buttons.append(dict(label=label, method="update", args=[{"visible": visible}, {"title": title}]))
+
+    return _dropdown_menu(fig, buttons)
+
+
+def data_dropdown(fig, label_data_map, title="", trace=0):
+    """
+    Dropdown that swaps per-button arrays ({label: {"x": ..., "y": ...}}) into
+    one trace; the trace starts with the first button's data.
+    """
+    updates = _swap_updates([[data] for data in label_data_map.values()])
+    _apply_update(fig, updates[0], [trace])
+    buttons = [dict(label=label, method="update", args=[update, {"title": title}, [trace]])
+               for label, update in zip(label_data_map, updates)]
+    return _dropdown_menu(fig, buttons)
+
+
 # 🎚️ Slider Utility (Trace-based Time Slider for go.Figure)
 
 
-def add_slider(fig, steps_titles, title=""):
+def add_slider(fig, steps_titles, title="", mode="visible"):
+    """
+    Slider whose step i shows trace i. mode="swap" keeps a single trace and
+    restyles it per step (see TOGGLE_MODES).
+    """
+    _check_mode(mode)
+    if mode == "swap":
+        updates, trace_ids = _swap_traces(fig, [[i] for i in range(len(steps_titles))])
+        steps = [dict(method="update", args=[update, {"title": step_title}, trace_ids], label=step_title)
+                 for step_title, update in zip(steps_titles, updates)]
+        return _slider_menu(fig, steps, title)
+
     steps = []
     for i, step_title in enumerate(steps_titles):
         step = dict(
@@ -306,20 +728,25 @@ def add_slider(fig, steps_titles, title=""):
         )
         steps.append(step)
 
-    sliders = [dict(
-        active=0,
-        pad={"t": 50},
-        steps=steps
-    )]
+    return _slider_menu(fig, steps, title)
 
-    fig.update_layout(sliders=sliders, title=title)
-    return fig
+
+def data_slider(fig, label_data_map, title="", trace=0):
+    """
+    Slider that swaps per-step arrays ({label: {"x": ..., "y": ...}}) into one
+    trace; the trace starts with the first step's data.
+    """
+    updates = _swap_updates([[data] for data in label_data_map.values()])
+    _apply_update(fig, updates[0], [trace])
+    steps = [dict(method="update", args=[update, {"title": label}, [trace]], label=label)
+             for label, update in zip(label_data_map, updates)]
+    return _slider_menu(fig, steps, title)
 
 
 # 🧱 Subplot Creator Utility
 
 def create_subplots(rows, cols, specs=None, subplot_titles=None, shared_x=False, shared_y=False, vertical_spacing=0.1, horizontal_spacing=0.1):
-    fig = make_subplots(
+    fig = subplots.make_subplots(
         rows=rows,
         cols=cols,
         specs=specs,
@@ -403,52 +830,6 @@ def add_shape_go(fig, shape_dict):
     fig.add_shape(shape_dict)
     return fig
 
-# 🧭 Mapbox-Based Scatter Utility
-
-def scatter_mapbox(df, lat, lon, color=None, size=None, hover_name=None, title="", zoom=1, center=None,
-                   mapbox_style="carto-positron", token=None):
-    """
-    Create a scatter mapbox plot. Optionally inject your Mapbox access token for custom styling.
-    """
-    if token:
-        import plotly
-        plotly.io.mapbox.default_access_token = token
-
-    fig = px.scatter_mapbox(
-        df,
-        lat=lat,
-        lon=lon,
-        color=color,
-        size=size,
-        hover_name=hover_name,
-        zoom=zoom,
-        center=center,
-        mapbox_style=mapbox_style,
-        title=title
-    )
-    return fig
-
-
-# 📈 Linear Trendline (OLS)
-
-def add_trendline(fig, x, y, name="Trendline", color="red", dash="dash"):
-    """
-    Adds a linear trendline to an existing figure using numpy polyfit.
-    """
-    coeffs = np.polyfit(x, y, 1)
-    trend_y = coeffs[0] * np.array(x) + coeffs[1]
-
-    trend_trace = go.Scatter(
-        x=x,
-        y=trend_y,
-        mode="lines",
-        name=name,
-        line=dict(color=color, dash=dash)
-    )
-    fig.add_trace(trend_trace)
-    return fig
-
-
 # 🟦 Z-Score Band Utility
 
 def add_zscore_band(fig, x, y, band=1, color='rgba(0,100,255,0.1)', name=None):
@@ -486,7 +867,7 @@ def add_moving_average(fig, x, y, window=7, name="Moving Avg", color="green", da
     """
     y_smooth = pd.Series(y).rolling(window=window, min_periods=1).mean()
 
-    ma_trace = go.Scatter(
+    ma_trace = scatter_trace(
         x=x,
         y=y_smooth,
         mode="lines",
@@ -499,27 +880,59 @@ def add_moving_average(fig, x, y, window=7, name="Moving Avg", color="green", da
 
 #📈 add_trendline(): Linear Regression Overlay
 
-def add_trendline(x, y, name="Trendline", color="crimson"):
-    # Convert datetime to numeric if needed
-    if pd.api.types.is_datetime64_any_dtype(x):
-        x_numeric = (pd.to_datetime(x) - pd.to_datetime(x).min()).dt.days.values.reshape(-1, 1)
-        x_display = pd.to_datetime(x)
-    else:
-        x_numeric = np.array(x).reshape(-1, 1)
-        x_display = x
-
-    y_np = np.array(y)
-
-    model = LinearRegression().fit(x_numeric, y_np)
-    y_pred = model.predict(x_numeric)
-
-    return go.Scatter(
-        x=x_display,
-        y=y_pred,
-        mode="lines",
-        name=name,
-        line=dict(color=color, dash="dash")
-    )
+def _trendline_traces(x, y, name="Trendline", color=None, dash="dash", groups=None, ci=None):
+    fit = fit_linear(x, y, groups=groups)
+    traces = []
+    for i, group in enumerate(fit["group"]):
+        if fit["n"][i] == 0:
+            continue
+        label = name if group is None else f"{name} – {group}"
+        tx, ty, lower, upper = trend_points(fit, i, ci=ci)
+        line = dict(color=color, dash=dash) if color else dict(dash=dash)
+        if ci:
+            band_color = "rgba(128,128,128,0.2)"
+            traces.append(go.Scatter(x=tx, y=upper, mode="lines", line=dict(width=0),
+                                     showlegend=False, hoverinfo="skip", legendgroup=label))
+            traces.append(go.Scatter(x=tx, y=lower, mode="lines", line=dict(width=0), fill="tonexty",
+                                     fillcolor=band_color, name=f"{label} ({ci:.0%} CI)", legendgroup=label))
+        traces.append(scatter_trace(x=tx, y=ty, mode="lines", name=label, line=line, legendgroup=label))
+    return traces
+
+
+def add_trendline(*args, **kwargs):
+    """
+    Least-squares trendline(s), fitted in closed form (see stats_utils.fit_linear).
+
+    Two call styles:
+    - add_trendline(x, y, ...) → the trendline trace (a list of traces when
+      groups or ci is given)
+    - add_trendline(fig, x, y, ...) → adds the trace(s) to fig and returns fig
+
+    Parameters:
+    - x (array-like): Numbers or datetimes (datetimes are handled natively).
+    - y (array-like): Values to fit.
+    - name (str): Trace name (suffixed with the group label when grouped).
+    - color (str | None): Line color (default: crimson, or red when adding to a figure).
+    - dash (str): Line dash style.
+    - groups (array-like | None): One trendline per distinct label, e.g. df["Region"].
+    - ci (float | None): Also draw the confidence band of the fit, e.g. 0.95.
+
+    Each line is drawn from its two endpoints; the payload does not grow with len(x).
+    """
+    if args and isinstance(args[0], go.Figure):
+        fig, args = args[0], args[1:]
+        if len(args) < 4:
+            kwargs.setdefault("color", "red")
+        for trace in _trendline_traces(*args, **kwargs):
+            fig.add_trace(trace)
+        return fig
+
+    if len(args) < 4:
+        kwargs.setdefault("color", "crimson")
+    traces = _trendline_traces(*args, **kwargs)
+    if kwargs.get("groups") is None and not kwargs.get("ci"):
+        return traces[0]
+    return traces
 
 
 # 📊 add_moving_average(): Rolling Mean Overlay
@@ -527,7 +940,7 @@ def add_trendline(x, y, name="Trendline", color="crimson"):
 def add_moving_average(x, y, window=5, name="Moving Avg", color="royalblue"):
     y_series = pd.Series(y).rolling(window=window).mean()
     
-    return go.Scatter(
+    return scatter_trace(
         x=x,
         y=y_series,
         mode="lines",
@@ -551,16 +964,63 @@ def add_zscore_band(x, y, z=2):
     return upper_band, lower_band
 
 
+# ➕ extend_trace(): Append Live Points to an Existing Trace
+
+def extend_trace(fig, trace, x, y):
+    """
+    Appends points to one trace of a figure in place (e.g. the output of
+    RollingMean.update / ZScoreBand.update for a new batch).
+
+    Parameters:
+    - fig (go.Figure): Figure holding the trace.
+    - trace (int | str): Trace index or name.
+    - x, y (array-like): New points.
+    """
+    if isinstance(trace, str):
+        matches = [t for t in fig.data if t.name == trace]
+        if not matches:
+            raise KeyError(f"No trace named '{trace}'")
+        target = matches[0]
+    else:
+        target = fig.data[trace]
+
+    old_x = np.asarray(target.x) if target.x is not None else np.empty(0)
+    old_y = np.asarray(target.y) if target.y is not None else np.empty(0)
+    target.x = np.concatenate([old_x, np.asarray(x)])
+    target.y = np.concatenate([old_y, np.asarray(y, dtype=np.float64)])
+    return fig
+
+
 
 # ============================
-# 🎨 GLOBAL PROJECT THEME
+# 🎨 PROJECT THEME
 # ============================
+# The theme is a template object set on each figure (build_page(..., theme=...)),
+# never a change to plotly's shared pio.templates entries, so figures can be
+# built concurrently and one page's theme cannot leak into another's.
 
-def apply_theme(template="plotly_white", font_family="Arial", font_size=14):
+@functools.lru_cache(maxsize=None)
+def theme_template(template="plotly_white", font_family="Arial", font_size=14):
     """
-    Sets a global Plotly theme.
+    The project theme as a go.layout.Template: a copy of the named plotly
+    template with the project font. The same object is returned for the same
+    arguments; assigning it to a figure copies it, so do not modify it.
     """
-    pio.templates.default = template
-    pio.templates[template].layout.font.family = font_family
-    pio.templates[template].layout.font.size = font_size
+    theme = go.layout.Template(pio.templates[template])
+    theme.layout.font.family = font_family
+    theme.layout.font.size = font_size
+    return theme
+
 
+def apply_theme(template="plotly_white", font_family="Arial", font_size=14, fig=None):
+    """
+    Applies the project theme (see theme_template) to fig and returns it.
+
+    Without fig (notebooks), the theme becomes the session's default template
+    instead; plotly's named templates themselves are left untouched.
+    """
+    theme = theme_template(template, font_family, font_size)
+    if fig is not None:
+        return fig.update_layout(template=theme)
+    pio.templates.default = theme
+    return theme
@@ -0,0 +1,212 @@
+# utils/serialize_utils.py
+
+import time
+from dataclasses import dataclass
+
+try:
+    from .lazy_utils import lazy_import
+except ImportError:  # notebooks import plot_utils as a top-level module
+    from lazy_utils import lazy_import
+
+np = lazy_import("numpy")
+pio = lazy_import("plotly.io")
+
+# ============================
+# 🗜️ COMPACT FIGURE SERIALIZATION
+# ============================
+# Plotly writes NumPy arrays as base64 typed arrays ({"dtype": "f8", "bdata": ...})
+# but Python lists, tuples and object arrays as decimal JSON text. compact_figure
+# turns every numeric per-point array of a figure's traces (and animation
+# frames) into a NumPy array, optionally downcast, so st.plotly_chart,
+# write_html and to_json all emit the binary form:
+#
+# - downcast=None: dtypes kept
+# - "lossless": integers → the narrowest of (u)int8/16/32 that holds them, and
+#   float64 → float32 only when every value survives
+# - "float32": float64 → float32 always (about 7 significant digits), ints as in "lossless"
+#
+# Plotly narrows int64 arrays on its own, but only to signed widths; an array
+# already narrowed here is written as is.
+
+DOWNCAST_MODES = (None, "lossless", "float32")
+
+# Per-point attributes (by leaf name) that may hold numeric arrays
+_ARRAY_KEYS = {
+    "x", "y", "z", "lat", "lon", "values", "open", "high", "low", "close", "r", "theta",
+    "a", "b", "c", "u", "v", "w", "base", "width", "offset", "size", "color", "opacity",
+    "customdata", "array", "arrayminus", "intensity", "surfacecolor",
+}
+
+# Containers whose x/y are layout ranges, not data (e.g. pie domain)
+_SKIP_PARENTS = {"domain"}
+
+# Candidate integer widths, narrowest first (all are plotly.js typed arrays)
+_INT_DTYPES = ("int8", "uint8", "int16", "uint16", "int32", "uint32")
+
+# Shorter arrays are left alone: as text they are no larger than base64
+MIN_ARRAY_LENGTH = 32
+
+
+def _numeric_array(value):
+    # Lists/tuples/arrays of numbers (1-D or 2-D) → ndarray; anything else → None
+    if isinstance(value, (str, bytes, dict)) or not hasattr(value, "__len__") or len(value) < MIN_ARRAY_LENGTH:
+        return None
+    try:
+        arr = np.asarray(value)
+    except (ValueError, TypeError):  # ragged nested lists
+        return None
+    if arr.dtype.kind not in "iuf" or arr.ndim > 2:
+        return None
+    return arr
+
+
+def _narrow_int(arr):
+    # Narrowest lossless integer dtype; arrays that need 64 bits are left as is
+    if not arr.size:
+        return arr
+    low, high = arr.min(), arr.max()
+    for name in _INT_DTYPES:
+        dtype = np.dtype(name)
+        if dtype.itemsize >= arr.dtype.itemsize:
+            break
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return arr.astype(dtype)
+    return arr
+
+
+def _downcast(arr, mode):
+    if mode is None:
+        return arr
+    if arr.dtype.kind in "iu":
+        return _narrow_int(arr)
+    if arr.dtype == np.float64:
+        narrow = arr.astype(np.float32)
+        if mode == "float32" or np.array_equal(narrow.astype(np.float64), arr, equal_nan=True):
+            return narrow
+    return arr
+
+
+def _compact_props(obj, props, mode, parent=None):
+    # Walks a trace's plotly JSON; assigns converted arrays back through obj[path]
+    changed = 0
+    for key, value in props.items():
+        path = key if parent is None else f"{parent}.{key}"
+        if isinstance(value, dict):
+            if key not in _SKIP_PARENTS:
+                changed += _compact_props(obj, value, mode, path)
+            continue
+        if key not in _ARRAY_KEYS:
+            continue
+        arr = _numeric_array(value)
+        if arr is None:
+            continue
+        new = _downcast(arr, mode)
+        if new is not value:
+            # Plotly ignores an assignment equal to the current value, even as another type
+            obj[path] = None
+            obj[path] = new
+            changed += 1
+    return changed
+
+
+def compact_figure(fig, downcast="lossless"):
+    """
+    Converts a figure's numeric per-point arrays to (optionally downcast) NumPy
+    arrays in place, so they serialize as base64 typed arrays.
+
+    Parameters:
+    - fig (go.Figure): Figure to compact (traces and animation frames).
+    - downcast (str | None): None, "lossless" or "float32" (see DOWNCAST_MODES).
+
+    Returns fig.
+    """
+    if downcast not in DOWNCAST_MODES:
+        raise ValueError(f"Unknown downcast mode '{downcast}'. Use one of: {DOWNCAST_MODES}")
+    traces = list(fig.data) + [t for frame in (fig.frames or ()) for t in frame.data]
+    for trace in traces:
+        _compact_props(trace, trace.to_plotly_json(), downcast)
+    return fig
+
+
+def json_engine():
+    """
+    The JSON engine figure serialization uses: "orjson" when installed, else "json".
+    """
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        return "json"
+    return "orjson"
+
+
+def figure_to_json(fig, downcast="lossless", engine=None):
+    """
+    Compact JSON for a figure: compact_figure on a copy, then the fastest
+    available engine (see json_engine). The figure itself is not modified.
+    """
+    import plotly.graph_objects as go
+
+    copy = compact_figure(go.Figure(fig), downcast)
+    return pio.to_json(copy, validate=False, engine=engine or json_engine())
+
+
+# ============================
+# 🧾 SERIALIZATION REPORT
+# ============================
+
+
+@dataclass
+class SerializationReport:
+    downcast: str
+    engine: str
+    bytes_in: int
+    bytes_out: int
+    seconds_in: float
+    seconds_out: float
+    seconds_compact: float
+
+    @property
+    def reduction(self):
+        return 1 - self.bytes_out / self.bytes_in if self.bytes_in else 0.0
+
+    def __str__(self):
+        return (
+            f"🗜️ {self.bytes_in / 1e6:.2f} MB → {self.bytes_out / 1e6:.2f} MB JSON ({-self.reduction:+.1%}), "
+            f"encode {self.seconds_in * 1000:.1f} ms → {self.seconds_out * 1000:.1f} ms "
+            f"({self.engine}, downcast={self.downcast}; compacting took {self.seconds_compact * 1000:.1f} ms)"
+        )
+
+
+def serialization_report(fig, downcast="lossless", engine=None):
+    """
+    Payload bytes and encode time of the figure as Plotly serializes it by
+    default (stdlib json engine, arrays as given) versus compacted and encoded
+    with the fastest engine. The one-off compact_figure cost is reported
+    separately. The figure itself is not modified.
+    """
+    import plotly.graph_objects as go
+
+    start = time.perf_counter()
+    default = pio.to_json(fig, validate=False, engine="json")
+    seconds_in = time.perf_counter() - start
+
+    copy = go.Figure(fig)
+    start = time.perf_counter()
+    compact_figure(copy, downcast)
+    seconds_compact = time.perf_counter() - start
+
+    engine = engine or json_engine()
+    start = time.perf_counter()
+    compact = pio.to_json(copy, validate=False, engine=engine)
+    seconds_out = time.perf_counter() - start
+
+    return SerializationReport(
+        downcast=str(downcast),
+        engine=engine,
+        bytes_in=len(default.encode()),
+        bytes_out=len(compact.encode()),
+        seconds_in=seconds_in,
+        seconds_out=seconds_out,
+        seconds_compact=seconds_compact,
+    )
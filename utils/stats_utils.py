@@ -0,0 +1,250 @@
+# utils/stats_utils.py
+
+try:
+    from .lazy_utils import lazy_import
+except ImportError:  # notebooks import plot_utils as a top-level module
+    from lazy_utils import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# ============================
+# 🔁 ONLINE OVERLAY STATISTICS
+# ============================
+# Stateful counterparts of add_moving_average / add_zscore_band for live feeds:
+# each update() takes only the newly appended points and returns the overlay
+# values for those points, ready to extend an existing trace (see
+# plot_utils.extend_trace). Work per update is proportional to the batch (plus
+# the rolling window), not to the length of the series.
+
+
+def _as_float(values):
+    return np.atleast_1d(np.asarray(values, dtype=np.float64))
+
+
+class RollingMean:
+    """
+    Rolling mean over the last `window` points, fed in batches.
+
+    Parameters:
+    - window (int): Window length in points.
+    - min_periods (int | None): Valid (non-NaN) points needed for a value
+      (default: window, like pandas' rolling().mean()).
+
+    Matches pd.Series(all_values).rolling(window, min_periods).mean() for the
+    concatenation of every batch.
+    """
+
+    def __init__(self, window, min_periods=None):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self._tail = np.empty(0)  # last window-1 values seen
+        self.count = 0
+
+    def update(self, values):
+        """
+        Appends a batch and returns the rolling means of its points.
+        """
+        values = _as_float(values)
+        seq = np.concatenate([self._tail, values])
+        valid = np.isfinite(seq)
+
+        # Windowed sums via cumulative sums over (tail + batch) only
+        csum = np.concatenate([[0.0], np.cumsum(np.where(valid, seq, 0.0))])
+        ccnt = np.concatenate([[0], np.cumsum(valid)])
+        end = np.arange(len(self._tail), len(seq)) + 1
+        start = np.maximum(end - self.window, 0)
+        sums = csum[end] - csum[start]
+        counts = ccnt[end] - ccnt[start]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(counts >= self.min_periods, sums / counts, np.nan)
+
+        self._tail = seq[-(self.window - 1):] if self.window > 1 else np.empty(0)
+        self.count += len(values)
+        return means
+
+
+class RunningStats:
+    """
+    Count, mean and variance of every point seen so far (Welford's algorithm,
+    merged batch-wise with Chan's parallel update). NaNs are ignored.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, values):
+        """
+        Folds a batch into the statistics in O(batch). Returns self.
+        """
+        values = _as_float(values)
+        values = values[np.isfinite(values)]
+        n = len(values)
+        if n == 0:
+            return self
+
+        batch_mean = values.mean()
+        batch_m2 = ((values - batch_mean) ** 2).sum()
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += batch_m2 + delta ** 2 * self.count * n / total
+        self.count = total
+        return self
+
+    def var(self, ddof=0):
+        """
+        Variance (ddof=0 matches np.var / np.std as used by add_zscore_band).
+        """
+        return self._m2 / (self.count - ddof) if self.count > ddof else np.nan
+
+    def std(self, ddof=0):
+        return np.sqrt(self.var(ddof))
+
+
+class ZScoreBand:
+    """
+    Expanding ±z·σ band around the running mean, fed in batches.
+
+    Points of a batch get the band computed from everything seen up to and
+    including that batch, so earlier points keep the level they were drawn
+    with. band() gives the current level for redrawing the whole band.
+    """
+
+    def __init__(self, z=2):
+        self.z = z
+        self.stats = RunningStats()
+
+    def band(self):
+        """
+        Current (upper, lower) levels.
+        """
+        mean, std = self.stats.mean, self.stats.std()
+        return mean + self.z * std, mean - self.z * std
+
+    def update(self, values):
+        """
+        Appends a batch and returns (upper, lower) arrays for its points.
+        """
+        values = _as_float(values)
+        self.stats.update(values)
+        upper, lower = self.band()
+        return np.full(len(values), upper), np.full(len(values), lower)
+
+
+# ============================
+# 📈 CLOSED-FORM TRENDLINES
+# ============================
+# Ordinary least squares y = intercept + slope·x from grouped sums: one
+# vectorized pass fits every group (e.g. one trend per Region) at once.
+
+
+def _x_numeric(x):
+    # Datetimes are fitted in days since the epoch (UTC for tz-aware x), NaT as
+    # NaN; returns (floats, is_datetime, tz)
+    if pd.api.types.is_datetime64_any_dtype(x):
+        stamps = pd.DatetimeIndex(pd.to_datetime(x))
+        tz = stamps.tz
+        if tz is not None:
+            stamps = stamps.tz_convert("UTC").tz_localize(None)
+        days = stamps.as_unit("ns").asi8 / 86_400e9
+        days[stamps.isna()] = np.nan
+        return days, True, tz
+    return np.asarray(x).astype(np.float64), False, None
+
+
+def _x_display(values, is_datetime, tz=None):
+    if not is_datetime:
+        return values
+    stamps = pd.DatetimeIndex((np.asarray(values) * 86_400e9).astype(np.int64).astype("datetime64[ns]"))
+    return stamps.tz_localize("UTC").tz_convert(tz) if tz is not None else stamps
+
+
+def fit_linear(x, y, groups=None):
+    """
+    Least-squares line per group in closed form.
+
+    Parameters:
+    - x (array-like): Numbers or datetimes (fitted in days).
+    - y (array-like): Numbers; rows with a missing x or y are skipped.
+    - groups (array-like | None): Group label per row (None → one fit).
+
+    Returns a dict of equal-length arrays, one entry per group: "group", "n",
+    "slope", "intercept", "x_mean", "sxx" (centered sum of squares of x),
+    "resid_var" (residual variance, n - 2 dof), "x_min", "x_max", plus
+    "datetime" (bool) and "tz" (of tz-aware datetime x, else None).
+    slope/intercept are per day for datetime x.
+    """
+    xv, is_datetime, tz = _x_numeric(x)
+    yv = np.asarray(y, dtype=np.float64)
+    if groups is None:
+        codes, labels = np.zeros(len(xv), dtype=np.int64), np.array([None], dtype=object)
+    else:
+        codes, labels = pd.factorize(np.asarray(groups), sort=False)
+    keep = np.isfinite(xv) & np.isfinite(yv) & (codes >= 0)
+    xv, yv, codes = xv[keep], yv[keep], codes[keep]
+    k = len(labels)
+
+    n = np.bincount(codes, minlength=k).astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = np.bincount(codes, weights=xv, minlength=k) / n
+        y_mean = np.bincount(codes, weights=yv, minlength=k) / n
+        # Centered sums keep the fit stable for large x (e.g. datetimes)
+        dx = xv - x_mean[codes]
+        dy = yv - y_mean[codes]
+        sxx = np.bincount(codes, weights=dx * dx, minlength=k)
+        sxy = np.bincount(codes, weights=dx * dy, minlength=k)
+        syy = np.bincount(codes, weights=dy * dy, minlength=k)
+        slope = np.where(sxx > 0, sxy / sxx, 0.0)
+        intercept = y_mean - slope * x_mean
+        resid_var = np.where(n > 2, np.maximum(syy - slope * sxy, 0.0) / (n - 2), np.nan)
+
+    x_min = np.full(k, np.inf)
+    x_max = np.full(k, -np.inf)
+    np.minimum.at(x_min, codes, xv)
+    np.maximum.at(x_max, codes, xv)
+    x_min[n == 0] = x_max[n == 0] = np.nan
+
+    return {
+        "group": labels,
+        "n": n.astype(np.int64),
+        "slope": slope,
+        "intercept": intercept,
+        "x_mean": x_mean,
+        "sxx": sxx,
+        "resid_var": resid_var,
+        "x_min": x_min,
+        "x_max": x_max,
+        "datetime": is_datetime,
+        "tz": tz,
+    }
+
+
+def trend_points(fit, i, ci=None, points=50):
+    """
+    Points of group i's fitted line over its x range.
+
+    Without ci the line needs only its two endpoints. With ci (e.g. 0.95) the
+    confidence band of the mean is evaluated on `points` x values (normal
+    approximation). Returns (x, y, lower, upper); lower/upper are None
+    without ci.
+    """
+    x0, x1 = fit["x_min"][i], fit["x_max"][i]
+    xs = np.linspace(x0, x1, points if ci else 2)
+    ys = fit["intercept"][i] + fit["slope"][i] * xs
+    lower = upper = None
+    if ci:
+        from statistics import NormalDist
+
+        zcrit = NormalDist().inv_cdf(0.5 + ci / 2)
+        n, sxx = fit["n"][i], fit["sxx"][i]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            leverage = 1 / n + np.where(sxx > 0, (xs - fit["x_mean"][i]) ** 2 / sxx, 0.0)
+        half = zcrit * np.sqrt(fit["resid_var"][i] * leverage)
+        lower, upper = ys - half, ys + half
+    return _x_display(xs, fit["datetime"], fit["tz"]), ys, lower, upper
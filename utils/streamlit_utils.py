@@ -1,11 +1,115 @@
 # utils/streamlit_utils.py
 
+import base64
+import gzip
+import re
+
 import streamlit as st
 from pathlib import Path
 
+from utils.cache_utils import LRUCache
+
+# <script src> of a shared plotly.js bundle (export_figures(..., plotlyjs="shared"))
+_SHARED_PLOTLYJS = re.compile(r'<script charset="utf-8" src="([^"]*plotly-[\w.]+\.min\.js)"></script>')
+
+# ============================
+# 🗃️ HTML EMBED CACHE
+# ============================
+# Process-wide, so shared by every session: resolved path → (signature, shared
+# bundles, HTML ready to embed). The signature is the (mtime_ns, size) of the
+# file and of every plotly.js bundle it inlines, so an edited export is
+# re-read on the next embed. An unchanged file always yields the same string,
+# which lets Streamlit's forward-message cache skip re-sending it to a browser
+# that already has it.
+#
+# Embeds above COMPRESS_MIN_BYTES are sent gzip-compressed (base64) inside a
+# small loader page that decompresses them in the browser (DecompressionStream).
+
+HTML_CACHE_BYTES = 64 * 1024 ** 2
+COMPRESS_MIN_BYTES = 256 * 1024
+
+_HTML_CACHE = LRUCache(max_bytes=HTML_CACHE_BYTES, sizeof=lambda entry: len(entry[2]))
+
+_GZIP_LOADER = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head><body><script>
+(async () => {{
+  const bytes = Uint8Array.from(atob("{payload}"), c => c.charCodeAt(0));
+  const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+  const html = await new Response(stream).text();
+  document.open(); document.write(html); document.close();
+}})();
+</script></body></html>"""
+
+
+def html_cache_stats():
+    """
+    Hit/miss/eviction counters and byte usage of the HTML embed cache.
+    """
+    return _HTML_CACHE.stats()
+
+
+def clear_html_cache():
+    """
+    Drops every cached HTML embed.
+    """
+    _HTML_CACHE.clear()
+
+
+def _inline_shared_plotlyjs(html, html_path):
+    # The component iframe has no base URL, so a relative bundle is inlined
+    def inline(match):
+        asset = html_path.parent / match.group(1)
+        if not asset.exists():
+            return match.group(0)
+        return f'<script type="text/javascript">{asset.read_text(encoding="utf-8")}</script>'
+
+    return _SHARED_PLOTLYJS.sub(inline, html)
+
+
+def _compress(html):
+    data = html.encode("utf-8")
+    if len(data) < COMPRESS_MIN_BYTES:
+        return html
+    # mtime=0 keeps the output identical for identical input
+    payload = base64.b64encode(gzip.compress(data, mtime=0)).decode("ascii")
+    return _GZIP_LOADER.format(payload=payload)
+
+
+def _stat(path):
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def html_embed(html_path: Path):
+    """
+    HTML for st.components.v1.html: the file with shared plotly.js inlined and,
+    when large, compressed. Served from the process-wide cache while the file
+    and its bundles are unchanged.
+    """
+    html_path = Path(html_path)
+    key = str(html_path.resolve())
+    entry = _HTML_CACHE.get(key)
+    if entry is not None:
+        signature, assets, embed = entry
+        if signature == (_stat(html_path), *map(_stat, assets)):
+            return embed
+
+    file_stat = _stat(html_path)
+    html = html_path.read_text(encoding="utf-8")
+    assets = [html_path.parent / src for src in _SHARED_PLOTLYJS.findall(html)]
+    signature = (file_stat, *map(_stat, assets))
+    embed = _compress(_inline_shared_plotlyjs(html, html_path))
+    _HTML_CACHE.put(key, (signature, assets, embed))
+    return embed
+
+
 def load_html_plot(html_path: Path, height: int = 600):
     """
     Embed a standalone Plotly HTML file inside a Streamlit app.
+
+    The prepared HTML is cached across reruns and sessions (see html_embed).
     
     Parameters:
     - html_path (Path): Path to the exported HTML file.
@@ -16,8 +120,41 @@ def load_html_plot(html_path: Path, height: int = 600):
         return
 
     try:
-        with open(html_path, "r", encoding="utf-8") as f:
-            html = f.read()
-        st.components.v1.html(html, height=height)
+        st.components.v1.html(html_embed(html_path), height=height)
     except Exception as e:
         st.error(f"🚨 Failed to load HTML: {e}")
+
+
+# ============================
+# 🧩 PARTIAL PAGE RECOMPUTE
+# ============================
+
+
+def page_figure_cache(page):
+    """
+    This session's built figures of a page, for build_page(page, cache=...):
+    a rerun rebuilds only the figures whose declared inputs (builder arguments)
+    or datasets changed and serves the rest from st.session_state.
+    """
+    return st.session_state.setdefault(f"figures::{page.NOTEBOOK}", {})
+
+
+def save_all_plots(figures: dict, notebook_name: str, formats=("html", "png"), plotlyjs="shared"):
+    """
+    Export a page's figures in one batch and report the outcome in the app.
+
+    Parameters:
+    - figures (dict): {file stem: figure}, e.g. {"total_sales_over_time": fig1}.
+    - notebook_name (str): Sub-folder under exports/html and exports/images.
+    - formats (tuple): File extensions to write for every figure.
+    - plotlyjs (str): "shared" (one plotly.js per export root) or "inline".
+    """
+    from utils.export_utils import export_figures
+
+    jobs = [(fig, f"{stem}.{ext}", notebook_name) for stem, fig in figures.items() for ext in formats]
+    results = export_figures(jobs, plotlyjs=plotlyjs)
+
+    for result in results:
+        if not result.ok:
+            st.error(f"🚨 Failed to save {result.filename}: {result.error}")
+    return results